@@ -119,6 +119,12 @@ STATIC_URL = '/static/'
 STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
+
+# Каталог, у межах якого дозволено хешування дерев через /lab2/hash-tree/.
+# None - ендпоінт вимкнено; вмикати лише з окремим каталогом даних
+# (не BASE_DIR: там база даних, налаштування і .git)
+HASH_TREE_ROOT = None
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
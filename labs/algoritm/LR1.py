@@ -6,48 +6,326 @@ import numpy as np
 
 import math
 import random
-from typing import List, Tuple, Dict, Any
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from statistics import NormalDist
+from collections import deque
+from typing import List, Tuple, Dict, Any, Iterator, Optional, Union
+
+# Розмір блоку (кількість "доріжок") для векторизованої генерації
+BLOCK_SIZE = 1 << 16
+
+# Найбільший модуль, для якого a*x + c гарантовано вміщується в uint64
+VECTOR_MAX_MODULUS = 1 << 32
+
+# Найменша довжина (у бітах) модуля 2^k - 1, з якої скалярне згортання швидше за %:
+# для менших чисел ділення довгих цілих у CPython виграє у циклу зі зсувами
+# (виміряно: 2^127 - 1 - 0.8x, 2^257 - 1 - 1.06x, 2^521 - 1 - 1.45x)
+MERSENNE_FOLD_MIN_BITS = 512
+
+# Послідовність чисел: список або компактний масив (NumPy / array('I'))
+Sequence = Union[List[int], np.ndarray, array]
+
+
+def _as_numeric_array(sequence: Sequence) -> Optional[np.ndarray]:
+    # Представлення компактної послідовності як масиву NumPy без копіювання
+    # (для звичайних списків повертає None)
+    if isinstance(sequence, np.ndarray):
+        return sequence
+    if isinstance(sequence, array):
+        return np.frombuffer(sequence, dtype=sequence.typecode) if len(sequence) else np.empty(0)
+    return None
+
+
+# Кількість одиничних бітів у кожному байті 0..255
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    # Кількість одиничних бітів у кожному елементі беззнакового масиву
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    values = np.ascontiguousarray(values)
+    table = _POPCOUNT_TABLE[values.view(np.uint8)].reshape(values.shape + (values.dtype.itemsize,))
+    return table.sum(axis=-1, dtype=np.uint8)
+
+
+def _exact_sum(values: np.ndarray) -> int:
+    # Точна сума цілочисельного масиву (без переповнення uint64)
+    if values.dtype.itemsize <= 4:
+        return int(values.sum(dtype=np.uint64))
+    high = int((values >> np.uint64(32)).sum(dtype=np.uint64))
+    low = int((values & np.uint64(0xFFFFFFFF)).sum(dtype=np.uint64))
+    return (high << 32) + low
+
+
+def detect_modulus_class(m: int) -> Tuple[str, int]:
+    # Клас модуля для вибору способу зведення за модулем:
+    # ('pow2', k) для m = 2^k - досить маски m - 1;
+    # ('mersenne', k) для m = 2^k - 1 - згортання x = (x & m) + (x >> k), бо 2^k = 1 (mod m);
+    # ('generic', 0) - звичайний залишок від ділення
+    if m > 1 and m & (m - 1) == 0:
+        return 'pow2', m.bit_length() - 1
+    if m > 2 and m & (m + 1) == 0:
+        return 'mersenne', m.bit_length()
+    return 'generic', 0
+
+
+def affine_power(a: int, c: int, m: int, k: int) -> Tuple[int, int]:
+    # Композиція k кроків відображення x -> (a*x + c) mod m
+    # Повертає (A, C) такі, що x_{n+k} = (A * x_n + C) mod m; O(log k) множень
+    result_a, result_c = 1 % m, 0
+    base_a, base_c = a % m, c % m
+    while k > 0:
+        if k & 1:
+            result_a, result_c = (base_a * result_a) % m, (base_a * result_c + base_c) % m
+        base_a, base_c = (base_a * base_a) % m, (base_a * base_c + base_c) % m
+        k >>= 1
+    return result_a, result_c
+
 
 class LinearCongruentialGenerator:
     #Генератор псевдовипадкових чисел за методом лінійного порівняння
 
-    def __init__(self, m: int, a: int, c: int, x0: int):
+    def __init__(self, m: int, a: int, c: int, x0: int, history_size: Optional[int] = None):
         # m: модуль порівняння (m > 0)
         # a: множник (0 <= a < m)
         # c: приріст (0 <= c < m)
         # x0: початкове значення (0 <= x0 < m)
+        # history_size: None - повна історія, 0 - без історії,
+        #               N > 0 - кільцевий буфер останніх N значень
         self.m = m
         self.a = a
         self.c = c
         self.x0 = x0
         self.current = x0
-        self.history = []
+        self.history_size = history_size
+        self.history = self._new_history()
+        self._select_kernels(*detect_modulus_class(m))
+
+    def _select_kernels(self, modulus_class: str, modulus_bits: int):
+        # Вибір скалярного ядра next() і векторного зведення за класом модуля
+        self.modulus_class = modulus_class
+        self.modulus_bits = modulus_bits
+        if modulus_class == 'pow2':
+            self.next = self._next_pow2
+        elif modulus_class == 'mersenne' and self.modulus_bits >= MERSENNE_FOLD_MIN_BITS:
+            self.next = self._next_mersenne
+        else:
+            self.next = self._next_generic
+
+    def _new_history(self):
+        # Повна історія - список; обмежена - deque(maxlen=N), для N = 0 вона нічого не зберігає
+        if self.history_size is None:
+            return []
+        return deque(maxlen=self.history_size)
 
     def reset(self):
         #Скидання генератора до початкового стану
         self.current = self.x0
-        self.history = []
+        self.history = self._new_history()
 
     def next(self) -> int:
         #енерація наступного псевдовипадкового числа
+        #(екземпляр використовує ядро свого класу модуля, вибране в __init__)
+        return self._next_generic()
+
+    def _next_generic(self) -> int:
         self.current = (self.a * self.current + self.c) % self.m
         self.history.append(self.current)
         return self.current
 
-    def generate_sequence(self, n: int) -> List[int]:
+    def _next_pow2(self) -> int:
+        self.current = (self.a * self.current + self.c) & (self.m - 1)
+        self.history.append(self.current)
+        return self.current
+
+    def _next_mersenne(self) -> int:
+        # Згортання старших бітів на молодші, поки число не вміститься в modulus_bits біт
+        x = self.a * self.current + self.c
+        m, bits = self.m, self.modulus_bits
+        while x >> bits:
+            x = (x & m) + (x >> bits)
+        self.current = 0 if x == m else x
+        self.history.append(self.current)
+        return self.current
+
+    def value_at(self, k: int) -> int:
+        # Елемент послідовності з номером k (x_0 = x0) за O(log k) без генерації префікса
+        step_a, step_c = affine_power(self.a, self.c, self.m, k)
+        return (step_a * self.x0 + step_c) % self.m
+
+    def jump(self, k: int) -> int:
+        # Перехід на k кроків уперед від поточного стану за O(log k)
+        # Проміжні значення не генеруються і в історію не потрапляють
+        if k < 0:
+            raise ValueError("Крок переходу k повинен бути >= 0")
+        step_a, step_c = affine_power(self.a, self.c, self.m, k)
+        self.current = (step_a * self.current + step_c) % self.m
+        return self.current
+
+    def split(self, n: int, stream_length: int) -> List['LinearCongruentialGenerator']:
+        # Розбиття послідовності на n незалежних підпотоків по stream_length чисел
+        # Підпотік i починається після i * stream_length кроків від поточного стану,
+        # тож підпотоки не перетинаються, а їх конкатенація дає вихідну послідовність
+        if n <= 0 or stream_length <= 0:
+            raise ValueError("Кількість підпотоків і їх довжина повинні бути > 0")
+        step_a, step_c = affine_power(self.a, self.c, self.m, stream_length)
+        streams = []
+        state = self.current
+        for _ in range(n):
+            streams.append(LinearCongruentialGenerator(self.m, self.a, self.c, state))
+            state = (step_a * state + step_c) % self.m
+        return streams
+
+    def generate_sequence(self, n: int, as_array: bool = False) -> Sequence:
         #Генерація послідовності псевдовипадкових чисел
+        #as_array: повернути компактний масив NumPy замість списку
 
         self.reset()
-        sequence = []
-        for _ in range(n):
-            sequence.append(self.next())
-        return sequence
+        values = self.generate_array(n)
+        if self.history_size != 0:
+            tail = values if self.history_size is None else values[max(0, n - self.history_size):]
+            self.history.extend(tail.tolist())
+        return values if as_array else values.tolist()
+
+    def generate_window(self, offset: int, limit: int) -> np.ndarray:
+        # Вікно послідовності generate_sequence: limit чисел, починаючи з номера offset (від 0).
+        # Префікс не генерується: початок вікна знаходиться переходом jump() за O(log offset)
+        if offset < 0 or limit < 0:
+            raise ValueError("Зсув і розмір вікна повинні бути >= 0")
+        self.reset()
+        self.jump(offset)
+        return self.generate_array(limit)
+
+    def _dtype(self):
+        # Тип елементів масиву для значень з діапазону [0, m)
+        if self.m <= VECTOR_MAX_MODULUS:
+            return np.uint32
+        if self.m <= 1 << 64:
+            return np.uint64
+        return object
+
+    def _vectorizable(self) -> bool:
+        # a*x + c вміщується в uint64 для m <= 2^32; для m = 2^k (k <= 64) переповнення
+        # uint64 не заважає: зведення за модулем 2^64 не змінює молодших k бітів
+        return self.m <= VECTOR_MAX_MODULUS or (self.modulus_class == 'pow2' and self.m <= 1 << 64)
+
+    def _reduce(self, work: np.ndarray, scratch: np.ndarray):
+        # Векторне зведення work (uint64) за модулем m на місці
+        m = np.uint64(self.m - 1 if self.modulus_class == 'pow2' else self.m)
+        if self.modulus_class == 'pow2':
+            if self.m < 1 << 64:
+                np.bitwise_and(work, m, out=work)
+        elif self.modulus_class == 'mersenne':
+            # Одне згортання дає значення < 2m; min(t, t - m) у беззнаковій арифметиці
+            # (t - m "перекручується" у велике число при t < m) завершує зведення
+            np.right_shift(work, np.uint64(self.modulus_bits), out=scratch)
+            np.bitwise_and(work, m, out=work)
+            work += scratch
+            np.subtract(work, m, out=scratch)
+            np.minimum(work, scratch, out=work)
+        else:
+            work %= m
+
+    def generate_blocks(self, n: int, block_size: int = BLOCK_SIZE) -> Iterator[np.ndarray]:
+        # Блокова генерація: видає n наступних чисел масивами по block_size елементів.
+        # Кожен блок обчислюється з попереднього однією операцією над масивом:
+        # x[i + L] = (A_L * x[i] + C_L) mod m, де (A_L, C_L) - композиція L кроків (a, c).
+        # Результат побітово збігається з послідовними викликами next().
+        # Історія (self.history) в цьому режимі не заповнюється.
+        if n <= 0:
+            return
+        dtype = self._dtype()
+
+        if not self._vectorizable():
+            # Для великих модулів добуток не вміщується в uint64 - скалярний цикл
+            m, a, c, x = self.m, self.a, self.c, self.current
+            mask, bits = m - 1, self.modulus_bits
+            fold = self.modulus_class == 'mersenne' and bits >= MERSENNE_FOLD_MIN_BITS
+            for start in range(0, n, block_size):
+                size = min(block_size, n - start)
+                block = np.empty(size, dtype=dtype)
+                if self.modulus_class == 'pow2':
+                    for i in range(size):
+                        x = (a * x + c) & mask
+                        block[i] = x
+                elif fold:
+                    for i in range(size):
+                        x = a * x + c
+                        while x >> bits:
+                            x = (x & m) + (x >> bits)
+                        x = 0 if x == m else x
+                        block[i] = x
+                else:
+                    for i in range(size):
+                        x = (a * x + c) % m
+                        block[i] = x
+                self.current = x
+                yield block
+            return
+
+        m = self.m
+        lanes = min(block_size, n)
+        work = np.empty(lanes, dtype=np.uint64)
+        scratch = np.empty(lanes, dtype=np.uint64)
+
+        # Перший блок: одне скалярне значення, далі подвоєння кількості доріжок
+        work[0] = (self.a * self.current + self.c) % m
+        step_a, step_c = self.a % m, self.c % m
+        filled = 1
+        while filled < lanes:
+            size = min(filled, lanes - filled)
+            target = work[filled:filled + size]
+            np.multiply(work[:size], np.uint64(step_a), out=target)
+            target += np.uint64(step_c)
+            self._reduce(target, scratch[:size])
+            step_a, step_c = (step_a * step_a) % m, (step_a * step_c + step_c) % m
+            filled += size
+
+        # Крок між сусідніми блоками: композиція lanes кроків генератора
+        step_a, step_c = affine_power(self.a, self.c, m, lanes)
+        big_a, big_c = np.uint64(step_a), np.uint64(step_c)
 
-    def find_period(self, max_iterations: int = 1000000000) -> Tuple[int, bool]: # change
+        produced = 0
+        while True:
+            size = min(lanes, n - produced)
+            self.current = int(work[size - 1])
+            yield work[:size].astype(dtype)
+            produced += size
+            if produced >= n:
+                return
+            np.multiply(work, big_a, out=work)
+            work += big_c
+            self._reduce(work, scratch)
+
+    def generate_array(self, n: int, block_size: int = BLOCK_SIZE) -> np.ndarray:
+        # Генерація n наступних чисел у масив NumPy (uint32 для m <= 2^32)
+        out = np.empty(max(n, 0), dtype=self._dtype())
+        pos = 0
+        for block in self.generate_blocks(n, block_size):
+            out[pos:pos + len(block)] = block
+            pos += len(block)
+        return out
+
+    def find_period(self, max_iterations: int = 1000000000,
+                    method: str = 'dict') -> Tuple[int, bool]: # change
         #Знаходження періоду функції генерації
         #max_iterations: максимальна кількість ітерацій для пошуку
+        #method: 'dict' - словник побачених значень, 'brent' - алгоритм Брента з O(1) пам'яті,
+        #        'analytic' - точне обчислення без ітерування (analytic_period)
         #Tuple (період, чи знайдено повний період)
 
+        if method == 'analytic':
+            period, _ = analytic_period(self.m, self.a, self.c, self.x0)
+            return period, True
+        if method == 'brent':
+            period, _, found = self.find_cycle(max_iterations)
+            return period, found
+        if method != 'dict':
+            raise ValueError(f"Невідомий метод пошуку періоду: {method}")
+
         self.reset()
         seen = {self.x0: 0}
 
@@ -60,34 +338,512 @@ class LinearCongruentialGenerator:
 
         return max_iterations, False
 
-    def get_statistics(self, sequence: List[int]) -> Dict[str, Any]:
+    def find_cycle(self, max_iterations: int = 1000000000) -> Tuple[int, int, bool]:
+        #Пошук циклу алгоритмом Брента: O(1) пам'яті замість словника всіх значень
+        #max_iterations: максимальна кількість кроків генератора на етапі пошуку довжини циклу
+        #Tuple (період, довжина передперіоду (хвоста), чи знайдено цикл)
+
+        m, a, c, x0 = self.m, self.a, self.c, self.x0
+
+        # Етап 1: довжина циклу. "Черепаха" стоїть на місці, "заєць" робить
+        # кроки; на кожному степені двійки черепаха переноситься до зайця
+        power = period = 1
+        tortoise = x0
+        hare = (a * x0 + c) % m
+        steps = 1
+        while tortoise != hare:
+            if steps >= max_iterations:
+                return max_iterations, 0, False
+            if power == period:
+                tortoise = hare
+                power *= 2
+                period = 0
+            hare = (a * hare + c) % m
+            period += 1
+            steps += 1
+
+        # Етап 2: довжина хвоста. Заєць випереджає черепаху на period кроків,
+        # далі обидва рухаються разом до першої зустрічі
+        tortoise = hare = x0
+        for _ in range(period):
+            hare = (a * hare + c) % m
+        tail = 0
+        while tortoise != hare:
+            tortoise = (a * tortoise + c) % m
+            hare = (a * hare + c) % m
+            tail += 1
+
+        return period, tail, True
+
+    def get_statistics(self, sequence: Sequence) -> Dict[str, Any]:
 
         #Отримання статистики послідовності
+        #Один прохід блоками через StatisticsAccumulator, без копій усієї послідовності
+
+        accumulator = StatisticsAccumulator(self.m)
+        for start in range(0, len(sequence), BLOCK_SIZE):
+            accumulator.update(sequence[start:start + BLOCK_SIZE])
+        return accumulator.result(
+            verify_chunks=(sequence[start:start + BLOCK_SIZE] for start in range(0, len(sequence), BLOCK_SIZE))
+        )
+
+    def generate_statistics(self, n: int, block_size: int = BLOCK_SIZE) -> Dict[str, Any]:
+        #Статистика перших n чисел послідовності без її збереження:
+        #блоки передаються в акумулятор одразу після генерації
+
+        self.reset()
+        accumulator = StatisticsAccumulator(self.m)
+        for block in self.generate_blocks(n, block_size):
+            accumulator.update(block)
+        # Другий прохід для точних частот - повторна генерація тієї ж послідовності
+        replay = LinearCongruentialGenerator(self.m, self.a, self.c, self.x0, history_size=0)
+        return accumulator.result(verify_chunks=replay.generate_blocks(n, block_size))
+
+
+# Найбільший модуль, для якого унікальні значення рахуються бітовою картою (32 МБ)
+BITMAP_UNIQUE_LIMIT = 1 << 28
 
-        if not sequence:
+
+def _normalize_chunk(chunk: Sequence) -> np.ndarray:
+    # Приведення блоку до беззнакового масиву (або object для довгих/від'ємних чисел)
+    values = _as_numeric_array(chunk)
+    if values is None:
+        values = np.asarray(chunk)
+        if values.dtype.kind not in ('i', 'u'):
+            # Список з числами поза int64/uint64 - довга арифметика Python
+            values = np.array(chunk, dtype=object)
+    if values.dtype.kind == 'i':
+        if len(values) and values.min() < 0:
+            return values.astype(object)
+        return values.astype(np.uint64)
+    if values.dtype.kind not in ('u', 'O'):
+        raise TypeError(f"Очікувалися цілі числа, отримано {values.dtype}")
+    return values
+
+
+def _sum_of_squares(values: np.ndarray) -> int:
+    # Точна сума квадратів. Для uint32 число ділиться на 16-бітові половини
+    # x = h * 2^16 + l, тож x^2 = h^2 * 2^32 + 2hl * 2^16 + l^2 і кожна сума вміщується в uint64
+    if values.dtype.kind == 'u' and values.dtype.itemsize <= 4:
+        wide = values.astype(np.uint64)
+        high = wide >> np.uint64(16)
+        low = wide & np.uint64(0xFFFF)
+        hh = int(np.dot(high, high))
+        hl = int(np.dot(high, low))
+        ll = int(np.dot(low, low))
+        return (hh << 32) + (hl << 17) + ll
+    return sum(x * x for x in values.tolist())
+
+
+def _run_starts(values: np.ndarray) -> np.ndarray:
+    # Початки серій однакових значень у відсортованому масиві
+    if len(values) == 0:
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    # Відсортовані різні значення: np.sort і межі серій.
+    # np.unique без return_counts у numpy 2.x на порядки повільніший (10^7 uint64: 8 с проти 0.1 с)
+    values = np.sort(values)
+    return values[_run_starts(values)]
+
+
+def _count_runs(values: np.ndarray, counts: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    # Різні значення і їх кількості (counts - ваги значень, None - по одному)
+    if counts is None:
+        values = np.sort(values)
+        starts = _run_starts(values)
+        return values[starts], np.diff(np.append(starts, len(values))).astype(np.int64)
+    order = np.argsort(values)
+    values, counts = values[order], counts[order]
+    starts = _run_starts(values)
+    return values[starts], np.add.reduceat(counts, starts) if len(starts) else counts
+
+
+class _SortedUnique:
+    # Точна кількість унікальних значень для великих модулів: відсортований масив.
+    # Нові блоки накопичуються окремо і зливаються, коли їх обсяг зрівнюється
+    # з основним масивом - амортизовано O(n log n) без множини з boxed int
+
+    def __init__(self):
+        self.values = np.empty(0, dtype=np.uint64)
+        self._pending = []
+        self._pending_size = 0
+
+    def update(self, values: np.ndarray):
+        unique = _sorted_unique(values)
+        self._pending.append(unique)
+        self._pending_size += len(unique)
+        if self._pending_size >= max(len(self.values), 1 << 16):
+            self._compact()
+
+    def merge(self, other: '_SortedUnique'):
+        other._compact()
+        self._pending.append(other.values)
+        self._compact()
+
+    def _compact(self):
+        if self._pending:
+            self.values = _sorted_unique(np.concatenate([self.values] + self._pending))
+            self._pending = []
+            self._pending_size = 0
+
+    def distinct(self) -> int:
+        self._compact()
+        return len(self.values)
+
+
+class _SparseCounts:
+    # Точні частоти як відсортовані пари (значення, кількість): пам'ять залежить
+    # від кількості різних значень, а не від модуля. Блоки зливаються так само,
+    # як у _SortedUnique, - коли їх обсяг зрівнюється з основним масивом
+
+    def __init__(self):
+        self.values = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    def update(self, values: np.ndarray):
+        self._pending.append(_count_runs(values))
+        self._pending_size += len(self._pending[-1][0])
+        if self._pending_size >= max(len(self.values), 1 << 16):
+            self._compact()
+
+    def merge(self, other: '_SparseCounts'):
+        other._compact()
+        self._pending.append((other.values, other.counts))
+        self._compact()
+
+    def _compact(self):
+        if self._pending:
+            self.values, self.counts = _count_runs(
+                np.concatenate([self.values] + [values for values, _ in self._pending]),
+                np.concatenate([self.counts] + [counts for _, counts in self._pending]))
+            self._pending = []
+            self._pending_size = 0
+
+    def size(self) -> int:
+        # Верхня межа кількості різних значень (без злиття буфера)
+        return len(self.values) + self._pending_size
+
+    def distinct(self) -> int:
+        self._compact()
+        return len(self.values)
+
+    def top(self, k: int) -> Dict[int, int]:
+        self._compact()
+        return _top_counts(self.values, self.counts, k)
+
+
+class _UniqueBitmap:
+    # Унікальні значення з [0, m) як бітова карта на m біт; об'єднання - побітове OR
+
+    def __init__(self, m: int):
+        self.bits = np.zeros((m + 7) // 8, dtype=np.uint8)
+
+    def update(self, values: np.ndarray):
+        shifts = (values & 7).astype(np.uint8)
+        np.bitwise_or.at(self.bits, values >> 3, np.left_shift(np.uint8(1), shifts))
+
+    def merge(self, other: '_UniqueBitmap'):
+        self.bits |= other.bits
+
+    def distinct(self) -> int:
+        return int(_popcount(self.bits).sum(dtype=np.int64))
+
+
+def _top_counts(values: np.ndarray, counts: np.ndarray, k: int) -> Dict[int, int]:
+    # k найчастіших значень (при рівності - менше значення першим; values відсортовані)
+    order = np.argsort(-counts, kind='stable')[:k]
+    order = order[counts[order] > 0]
+    return dict(zip(values[order].tolist(), counts[order].tolist()))
+
+
+class _DenseCounts:
+    # Точна таблиця частот для малих модулів: np.bincount у масив довжини m.
+    # Блоки буферизуються, поки їх сумарна довжина не порівняється з m,
+    # щоб вартість bincount (O(m)) розподілялась на багато значень
+
+    def __init__(self, m: int):
+        self.m = m
+        self.table = np.zeros(m, dtype=np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    def update(self, values: np.ndarray):
+        self._pending.append(values)
+        self._pending_size += len(values)
+        if self._pending_size * 4 >= self.m:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            values = np.concatenate(self._pending).astype(np.intp)
+            self.table += np.bincount(values, minlength=self.m)
+            self._pending = []
+            self._pending_size = 0
+
+    def add(self, values: np.ndarray, counts: np.ndarray):
+        # Готові частоти різних значень (перехід з _SparseCounts)
+        self.table[values.astype(np.intp)] += counts
+
+    def merge(self, other: '_DenseCounts'):
+        self._flush()
+        other._flush()
+        self.table += other.table
+
+    def distinct(self) -> int:
+        self._flush()
+        return int(np.count_nonzero(self.table))
+
+    def top(self, k: int) -> Dict[int, int]:
+        self._flush()
+        if k < self.m:
+            # Поріг k-ї найбільшої частоти, далі - лише значення не менші за нього
+            threshold = np.partition(self.table, self.m - k)[self.m - k]
+            candidates = np.flatnonzero(self.table >= max(threshold, 1))
+        else:
+            candidates = np.flatnonzero(self.table)
+        return _top_counts(candidates, self.table[candidates], k)
+
+
+class HeavyHitters:
+    # Пошук k найчастіших значень в O(k) пам'яті: зведення Місри-Гріса.
+    # Зберігається не більше capacity лічильників; після додавання блоку всі
+    # лічильники зменшуються на (capacity + 1)-й найбільший, і непозитивні
+    # відкидаються. Кожне значення з частотою > n / (capacity + 1) гарантовано
+    # залишається кандидатом, а зведення об'єднуються тим самим кроком (merge).
+    # Оцінки лічильників - нижні межі; точні частоти дає другий прохід verify().
+    # error - сума всіх відніманих порогів: частота будь-якого відкинутого значення
+    # не перевищує error, тож топ-k точний, якщо k-та частота більша за error.
+    # Окремо зберігаються k найменших значень: у майже рівномірній послідовності
+    # лічильники взаємно скорочуються, а при рівних частотах топ-k - найменші значення.
+
+    def __init__(self, k: int = 10, capacity: Optional[int] = None):
+        self.k = k
+        self.capacity = capacity if capacity is not None else 64 * k
+        self.values = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.error = 0
+        self.smallest = np.empty(0, dtype=np.uint64)
+        # Сума і кількість ненульових точних частот кандидатів після verify()
+        self.verified_total = None
+        self.verified_distinct = None
+
+    def update(self, values: np.ndarray) -> 'HeavyHitters':
+        self._combine(*_count_runs(values))
+        return self
+
+    def merge(self, other: 'HeavyHitters') -> 'HeavyHitters':
+        self.error += other.error
+        self.smallest = _sorted_unique(np.concatenate([self.smallest, other.smallest]))[:self.k]
+        self._combine(other.values, other.counts)
+        return self
+
+    def _combine(self, values: np.ndarray, counts: np.ndarray):
+        values, counts = _count_runs(np.concatenate([self.values, values]), np.concatenate([self.counts, counts]))
+        self.smallest = _sorted_unique(np.concatenate([self.smallest, values[:self.k]]))[:self.k]
+        if len(values) > self.capacity:
+            threshold = np.partition(counts, len(counts) - self.capacity - 1)[len(counts) - self.capacity - 1]
+            counts -= threshold
+            self.error += int(threshold)
+            keep = counts > 0
+            values, counts = values[keep], counts[keep]
+        self.values, self.counts = values, counts
+
+    def candidates(self) -> np.ndarray:
+        # Відсортовані кандидати у найчастіші значення: лічильники зведення і k найменших значень
+        return _sorted_unique(np.concatenate([self.values, self.smallest]))
+
+    def top(self) -> Dict[int, int]:
+        # Оцінка без другого проходу (лічильники - нижні межі частот)
+        return _top_counts(self.values, self.counts, self.k)
+
+    def verify(self, chunks) -> Dict[int, int]:
+        # Другий прохід: точні частоти кандидатів і точний топ-k
+        candidates = self.candidates()
+        exact = np.zeros(len(candidates), dtype=np.int64)
+        if len(candidates) == 0:
             return {}
+        for chunk in chunks:
+            values = _normalize_chunk(chunk)
+            positions = np.minimum(np.searchsorted(candidates, values), len(candidates) - 1)
+            hits = candidates[positions] == values
+            exact += np.bincount(positions[hits], minlength=len(candidates))
+        self.verified_total = int(exact.sum())
+        self.verified_distinct = int(np.count_nonzero(exact))
+        return _top_counts(candidates, exact, self.k)
+
+    def is_exact(self, top: Dict[int, int], n: Optional[int] = None, distinct: Optional[int] = None) -> bool:
+        # Чи гарантовано точний топ-k, отриманий verify(). Частота значення поза кандидатами
+        # не перевищує error, а за відомих n і кількості різних значень - ще й
+        # (n - сума частот кандидатів) - (інші різні значення - 1), бо кожне з них трапляється хоча б раз
+        bound = self.error
+        if n is not None and distinct is not None and self.verified_total is not None:
+            rest_distinct = distinct - self.verified_distinct
+            bound = min(bound, n - self.verified_total - rest_distinct + 1) if rest_distinct > 0 else 0
+        if bound <= 0:
+            return True
+        if len(top) < self.k:
+            return False
+        value, count = list(top.items())[-1]
+        # При рівній частоті k-те значення випереджає всі значення поза k найменшими
+        return count > bound or (count == bound and value <= int(self.smallest[-1]))
+
+
+# Найбільший модуль, для якого частоти рахуються щільною таблицею (32 МБ)
+DENSE_COUNT_LIMIT = 1 << 22
 
-        n = len(sequence)
-        mean = sum(sequence) / n
-        variance = sum((x - mean) ** 2 for x in sequence) / n
-        std_dev = math.sqrt(variance)
+# Найбільша кількість різних значень, що рахуються точно у розрідженій формі (16 МБ)
+SPARSE_COUNT_LIMIT = 1 << 20
 
-        # Частотний аналіз
-        frequency = {}
-        for num in sequence:
-            frequency[num] = frequency.get(num, 0) + 1
 
+class StatisticsAccumulator:
+    # Потокова статистика послідовності за один прохід.
+    # Блоки подаються через update() у міру генерації; часткові результати
+    # паралельних обробників об'єднуються через merge() без втрати точності:
+    # середнє і дисперсія рахуються з точних цілих сум x та x^2 (замість
+    # наближеного Велфорда), мінімум/максимум і кількість унікальних - точні.
+    # Пам'ять визначається min(m, n): спочатку частоти рахуються розріджено
+    # (_SparseCounts), і лише коли різних значень стає достатньо багато -
+    # для m <= DENSE_COUNT_LIMIT перехід на щільну таблицю (bincount),
+    # інакше - на зведення HeavyHitters з O(k) пам'яті та окремий підрахунок унікальних.
+
+    TOP_K = 10
+
+    def __init__(self, m: Optional[int] = None):
+        # m: модуль генератора; визначає стратегію підрахунку частот та унікальних значень
+        self.m = m
+        self.count = 0
+        self.total = 0
+        self.total_squares = 0
+        self.min = None
+        self.max = None
+        self._sparse = _SparseCounts()
+        self._dense = None
+        self._heavy = None
+        self._unique = None
+
+    def _dense_mode(self) -> bool:
+        return self.m is not None and 0 < self.m <= DENSE_COUNT_LIMIT
+
+    def _promote(self, force: bool = False):
+        # Перехід від розріджених частот до щільної таблиці або HeavyHitters,
+        # коли розріджена форма перестає бути дешевшою
+        if self._sparse is None:
+            return
+        limit = self.m // 4 if self._dense_mode() else SPARSE_COUNT_LIMIT
+        if not force and self._sparse.size() <= limit:
+            return
+        sparse = self._sparse
+        sparse._compact()
+        if not force and len(sparse.values) <= limit:
+            return
+        self._sparse = None
+        if self._dense_mode():
+            self._dense = _DenseCounts(self.m)
+        else:
+            self._heavy = HeavyHitters(self.TOP_K)
+            if self.m is not None and 0 < self.m <= BITMAP_UNIQUE_LIMIT:
+                self._unique = _UniqueBitmap(self.m)
+            else:
+                self._unique = _SortedUnique()
+        self._absorb(sparse.values, sparse.counts)
+
+    def _absorb(self, values: np.ndarray, counts: np.ndarray):
+        # Додавання готових частот різних значень до щільної таблиці або зведення
+        if self._dense is not None:
+            self._dense.add(values, counts)
+        else:
+            self._heavy._combine(values, counts)
+            self._unique.update(values)
+
+    def update(self, chunk: Sequence) -> 'StatisticsAccumulator':
+        values = _normalize_chunk(chunk)
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        if values.dtype == object:
+            self.total += sum(values.tolist())
+        else:
+            self.total += _exact_sum(values)
+        self.total_squares += _sum_of_squares(values)
+        low, high = values.min(), values.max()
+        self.min = int(low) if self.min is None else min(self.min, int(low))
+        self.max = int(high) if self.max is None else max(self.max, int(high))
+        if self._sparse is not None:
+            self._sparse.update(values)
+            self._promote()
+        elif self._dense is not None:
+            self._dense.update(values)
+        else:
+            self._heavy.update(values)
+            self._unique.update(values)
+        return self
+
+    def merge(self, other: 'StatisticsAccumulator') -> 'StatisticsAccumulator':
+        if self.m != other.m:
+            raise ValueError("Об'єднувати можна лише акумулятори з однаковим модулем")
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        if self._sparse is not None and other._sparse is not None:
+            self._sparse.merge(other._sparse)
+            self._promote()
+            return self
+        # Хоча б один вже перейшов на щільну таблицю чи зведення - стратегія визначається модулем
+        self._promote(force=True)
+        if other._sparse is not None:
+            other._sparse._compact()
+            self._absorb(other._sparse.values, other._sparse.counts)
+        elif self._dense is not None:
+            self._dense.merge(other._dense)
+        else:
+            self._heavy.merge(other._heavy)
+            self._unique.merge(other._unique)
+        return self
+
+    def result(self, verify_chunks=None) -> Dict[str, Any]:
+        # Словник у форматі LinearCongruentialGenerator.get_statistics
+        # verify_chunks: повторний прохід по тих самих даних для точних частот
+        # топ-10 (потрібен лише після переходу на HeavyHitters; без нього - оцінки знизу).
+        # frequency_top10_exact = False, якщо точність топ-10 не гарантована межею похибки
+        # зведення (майже рівномірні послідовності без явно частих значень)
+        if self.count == 0:
+            return {}
+        n = self.count
+        variance = float(Fraction(n * self.total_squares - self.total ** 2, n * n))
+        exact = True
+        if self._sparse is not None:
+            unique = self._sparse.distinct()
+            top = self._sparse.top(self.TOP_K)
+        elif self._dense is not None:
+            unique = self._dense.distinct()
+            top = self._dense.top(self.TOP_K)
+        else:
+            unique = self._unique.distinct()
+            if verify_chunks is not None:
+                top = self._heavy.verify(verify_chunks)
+                exact = self._heavy.is_exact(top, n, unique)
+            else:
+                top = self._heavy.top()
+                exact = self._heavy.error == 0
         return {
             'count': n,
-            'mean': mean,
+            'mean': self.total / n,
             'variance': variance,
-            'std_dev': std_dev,
-            'min': min(sequence),
-            'max': max(sequence),
-            'unique_values': len(set(sequence)),
-            'frequency_top10': dict(sorted(frequency.items(), #Топ 10 за кількістю одинакових значеньА
-                                         key=lambda x: x[1],
-                                         reverse=True)[:10])
+            'std_dev': math.sqrt(variance),
+            'min': self.min,
+            'max': self.max,
+            'unique_values': unique,
+            'frequency_top10': top,
+            'frequency_top10_exact': exact
         }
 
 
@@ -99,6 +855,273 @@ def gcd(a: int, b: int) -> int:
     return a
 
 
+def _is_probable_prime(n: int) -> bool:
+    # Тест Міллера-Рабіна (детермінований для n < 3.3 * 10^24)
+    if n < 2:
+        return False
+    small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in small_primes:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in small_primes:
+        x = pow(base, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+class FactorizationLimitError(ValueError):
+    # Розклад на множники не завершився в межах заданої кількості кроків
+    pass
+
+
+# Найбільша довжина модуля (біти) для аналітичного періоду: кожен крок ро-методу
+# і тесту Міллера-Рабіна дорожчає з довжиною числа, тож ліміт кроків сам по собі
+# не обмежує час для дуже довгих m
+ANALYTIC_MAX_BITS = 1024
+
+
+class _StepBudget:
+    # Спільний ліміт кроків ро-методу для всіх розкладів одного обчислення
+    # (розклад m, дільників m і p - 1); None - без обмеження
+    def __init__(self, max_steps: Optional[int] = None):
+        self.remaining = max_steps
+
+    def spend(self, steps: int):
+        if self.remaining is None:
+            return
+        self.remaining -= steps
+        if self.remaining < 0:
+            raise FactorizationLimitError("Розклад модуля на множники перевищив ліміт кроків")
+
+
+def _pollard_rho(n: int, budget: Optional[_StepBudget] = None) -> int:
+    # Нетривіальний дільник складеного n (ро-метод Полларда з циклом Брента)
+    budget = budget or _StepBudget()
+    if n % 2 == 0:
+        return 2
+    for seed in range(1, n):
+        y, r, q, divisor = 2, 1, 1, 1
+        while divisor == 1:
+            x = y
+            budget.spend(r)
+            for _ in range(r):
+                y = (y * y + seed) % n
+            k = 0
+            while k < r and divisor == 1:
+                saved = y
+                budget.spend(min(128, r - k))
+                for _ in range(min(128, r - k)):
+                    y = (y * y + seed) % n
+                    q = q * abs(x - y) % n
+                divisor = math.gcd(q, n)
+                k += 128
+            r *= 2
+        if divisor == n:
+            # Відкат до покрокового пошуку з останньої збереженої точки
+            divisor = 1
+            while divisor == 1:
+                budget.spend(1)
+                saved = (saved * saved + seed) % n
+                divisor = math.gcd(abs(x - saved), n)
+        if divisor != n:
+            return divisor
+    return n
+
+
+def factorize(n: int, budget: Optional[_StepBudget] = None) -> Dict[int, int]:
+    # Розклад n на прості множники: {просте: степінь}
+    # budget: ліміт кроків ро-методу (FactorizationLimitError після його вичерпання)
+    factors = {}
+    for p in (2, 3, 5):
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    # Пробне ділення малими дільниками, далі - ро-метод Полларда
+    p = 7
+    while p * p <= n and p < 10000:
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+        p += 2
+    stack = [n] if n > 1 else []
+    while stack:
+        value = stack.pop()
+        if value == 1:
+            continue
+        if _is_probable_prime(value):
+            factors[value] = factors.get(value, 0) + 1
+            continue
+        divisor = _pollard_rho(value, budget)
+        stack.extend((divisor, value // divisor))
+    return dict(sorted(factors.items()))
+
+
+def euler_phi(factors: Dict[int, int]) -> int:
+    # Функція Ейлера за розкладом на прості множники
+    result = 1
+    for p, e in factors.items():
+        result *= (p - 1) * p ** (e - 1)
+    return result
+
+
+def _phi_factors(factors: Dict[int, int], budget: Optional[_StepBudget] = None) -> Dict[int, int]:
+    # Розклад phi(n) на прості множники за розкладом n
+    result = {}
+    for p, e in factors.items():
+        if e > 1:
+            result[p] = result.get(p, 0) + e - 1
+        for q, f in factorize(p - 1, budget).items():
+            result[q] = result.get(q, 0) + f
+    return result
+
+
+def multiplicative_order(a: int, n: int, budget: Optional[_StepBudget] = None) -> int:
+    # Мультиплікативний порядок a за модулем n (gcd(a, n) = 1):
+    # найменше k > 0 з a^k = 1 (mod n). Порядок ділить phi(n), тож
+    # від phi(n) відкидаються прості множники, поки рівність зберігається
+    if n == 1:
+        return 1
+    if math.gcd(a, n) != 1:
+        raise ValueError("Порядок визначено лише для a, взаємно простого з n")
+    factors = factorize(n, budget)
+    order = euler_phi(factors)
+    for p in _phi_factors(factors, budget):
+        while order % p == 0 and pow(a, order // p, n) == 1:
+            order //= p
+    return order
+
+
+def hull_dobell(m: int, a: int, c: int, budget: Optional[_StepBudget] = None) -> bool:
+    # Умови Халла-Добелла повного періоду m для c != 0:
+    # 1) gcd(c, m) = 1; 2) a - 1 кратне кожному простому дільнику m;
+    # 3) a - 1 кратне 4, якщо m кратне 4
+    if math.gcd(c, m) != 1:
+        return False
+    for p in factorize(m, budget):
+        if (a - 1) % p != 0:
+            return False
+    return m % 4 != 0 or (a - 1) % 4 == 0
+
+
+def validate_parameters(m: int, a: int, c: int, x0: int, strict: bool = False):
+    # Перевірка параметрів генератора (спільна для представлень і пошуку параметрів)
+    # strict: a, c, x0 повинні лежати в [0, m), як вимагає генерація послідовності
+    if m <= 0:
+        raise ValueError("Модуль m повинен бути > 0")
+    if not strict:
+        return
+    if not (0 <= a < m):
+        raise ValueError(f"Множник a повинен бути в діапазоні [0, {m})")
+    if not (0 <= c < m):
+        raise ValueError(f"Приріст c повинен бути в діапазоні [0, {m})")
+    if not (0 <= x0 < m):
+        raise ValueError(f"Початкове значення x0 повинен бути в діапазоні [0, {m})")
+
+
+def max_possible_period(m: int, c: int) -> int:
+    # Найбільший можливий період: m для змішаного генератора, m - 1 для мультиплікативного
+    return m if c != 0 else m - 1
+
+
+def period_quality(period: int, m: int, c: int) -> str:
+    # Оцінка якості періоду відносно найбільшого можливого
+    max_period = max_possible_period(m, c)
+    return 'Відмінно' if period == max_period \
+        else 'Добре' if period > m / 2 \
+        else 'Задовільно' if period > m / 4 \
+        else 'Погано'
+
+
+def analytic_period(m: int, a: int, c: int, x0: int, max_steps: Optional[int] = None) -> Tuple[int, int]:
+    # Точний період і довжина передперіоду послідовності ЛКГ без ітерування
+    # Tuple (період, довжина хвоста) - ті самі значення, що дає find_cycle()
+    # max_steps: ліміт кроків розкладу на множники (m від клієнта може бути
+    # добутком великих простих); після нього - FactorizationLimitError
+    #
+    # За китайською теоремою про остачі m = m1 * m2, де m1 містить прості
+    # дільники m, які ділять a, а m2 - решту:
+    # - за модулем m1 відображення стискаюче: послідовність сходиться до нерухомої
+    #   точки x* = c / (1 - a), це дає хвіст і період 1;
+    # - за модулем m2 відображення бієктивне: хвоста немає, період - найменше k
+    #   з f^k(x0) = x0 (для c = 0 - мультиплікативний порядок a).
+    if m <= 0:
+        raise ValueError("Модуль m повинен бути > 0")
+    if m == 1:
+        return 1, 0
+    if m.bit_length() > ANALYTIC_MAX_BITS:
+        raise FactorizationLimitError(f"Аналітичний період підтримує модуль до 2^{ANALYTIC_MAX_BITS}")
+    budget = _StepBudget(max_steps)
+    if hull_dobell(m, a, c, budget):
+        return m, 0
+
+    m1 = 1
+    for p, e in factorize(m, budget).items():
+        if a % p == 0:
+            m1 *= p ** e
+    m2 = m // m1
+
+    # Хвіст: скільки кроків потрібно, щоб a^n * (x0 - x*) стало 0 за модулем m1
+    tail = 0
+    if m1 > 1:
+        fixed_point = c * pow(1 - a, -1, m1) % m1
+        delta = (x0 - fixed_point) % m1
+        while delta:
+            delta = delta * a % m1
+            tail += 1
+
+    if m2 == 1:
+        return 1, tail
+
+    a2, c2, x2 = a % m2, c % m2, x0 % m2
+    if c2 == 0:
+        # x_k = a^k * x0: період - порядок a за модулем m2 / gcd(x0, m2)
+        return multiplicative_order(a2, m2 // math.gcd(x2, m2), budget), tail
+
+    # Період ділить m2 * phi(m2) (порядок елемента афінної групи за модулем m2)
+    factors = factorize(m2, budget)
+    period = m2 * euler_phi(factors)
+    candidates = dict(factors)
+    for p, e in _phi_factors(factors, budget).items():
+        candidates[p] = candidates.get(p, 0) + e
+    for p in candidates:
+        while period % p == 0:
+            step_a, step_c = affine_power(a2, c2, m2, period // p)
+            if (step_a * x2 + step_c) % m2 != x2:
+                break
+            period //= p
+    return period, tail
+
+
+# Кількість пар в одному блоці пакетного тесту Чезаро (кратна 100 - кроку історії оцінок)
+CESARO_BLOCK_PAIRS = 32000
+
+
+def _cesaro_partition(m: int, a: int, c: int, state: int, num_pairs: int) -> Tuple[int, np.ndarray]:
+    # Обробка однієї частини тесту Чезаро (виконується і в окремих процесах):
+    # num_pairs пар, починаючи зі стану state. Повертає кількість взаємно простих
+    # пар і кумулятивні кількості після кожних 100 пар цієї частини
+    generator = LinearCongruentialGenerator(m, a, c, state, history_size=0)
+    coprime_count = 0
+    checkpoints = []
+    for block in generator.generate_blocks(2 * num_pairs, 2 * CESARO_BLOCK_PAIRS):
+        coprime = np.gcd(block[0::2], block[1::2]) == 1
+        cumulative = np.cumsum(coprime, dtype=np.int64)
+        checkpoints.append(cumulative[99::100] + coprime_count)
+        coprime_count += int(cumulative[-1])
+    return coprime_count, np.concatenate(checkpoints) if checkpoints else np.empty(0, dtype=np.int64)
+
+
 class CesaroTest:
     # Тестування генератора на основі теореми Чезаро
     @staticmethod
@@ -136,18 +1159,132 @@ class CesaroTest:
         return 0, float('inf'), pi_estimates
 
     @staticmethod
-    def compare_with_system_random(num_pairs: int = 10000000) -> Dict[str, Any]:
-        #Порівняння з системним генератором випадкових чисел (random)
+    def estimate_pi_batched(generator: LinearCongruentialGenerator, num_pairs: int = 10000000,
+                            workers: int = 1) -> Tuple[float, float, List[float]]:
+        # Пакетна версія estimate_pi: пари генеруються блоками NumPy, НСД - np.gcd над масивами
+        # workers > 1: частини (кратні 100 парам) обробляються пулом процесів; початок кожної
+        # частини знаходиться переходом jump(), тому результат не залежить від кількості процесів
+        # Tuple і історія оцінок (кожні 100 пар) збігаються з estimate_pi; історія генератора не ведеться
+
+        start_state = generator.current
+        workers = max(1, min(workers, num_pairs // 100))
+        part = -(-num_pairs // workers // 100) * 100 if workers > 1 else num_pairs
+
+        tasks = []
+        cursor = LinearCongruentialGenerator(generator.m, generator.a, generator.c, start_state)
+        for start in range(0, num_pairs, part):
+            size = min(part, num_pairs - start)
+            tasks.append((generator.m, generator.a, generator.c, cursor.current, size))
+            cursor.jump(2 * size)
+
+        if len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_cesaro_partition, *zip(*tasks)))
+        else:
+            results = [_cesaro_partition(*task) for task in tasks]
+
+        # Зведення частин: зсув кумулятивних кількостей на суму попередніх частин
+        coprime_count = 0
+        checkpoints = []
+        for count, partial in results:
+            checkpoints.append(partial + coprime_count)
+            coprime_count += count
+        generator.current = cursor.current
+
+        counts = np.concatenate(checkpoints) if checkpoints else np.empty(0, dtype=np.int64)
+        pairs = np.arange(1, len(counts) + 1, dtype=np.int64) * 100
+        valid = counts > 0
+        pi_estimates = np.sqrt(6.0 / (counts[valid] / pairs[valid])).tolist()
+
+        if coprime_count > 0:
+            probability = coprime_count / num_pairs
+            pi_estimate = math.sqrt(6.0 / probability)
+            error = abs(pi_estimate - math.pi)
+            return pi_estimate, error, pi_estimates
+
+        return 0, float('inf'), pi_estimates
+
+    @staticmethod
+    def estimate_pi_sequential(generator: LinearCongruentialGenerator, max_pairs: int = 10000000,
+                               tolerance: float = 0.001, confidence: float = 0.95,
+                               min_pairs: int = 100) -> Dict[str, Any]:
+        # Послідовне оцінювання з ранньою зупинкою: після кожної пари будується довірчий
+        # інтервал Вільсона для ймовірності взаємної простоти p і переводиться в інтервал
+        # для Pi = sqrt(6 / p). Тест зупиняється на першій парі, де піврозмах інтервалу
+        # для Pi не перевищує tolerance (не раніше min_pairs пар), або після max_pairs пар.
+        # Умова перевіряється векторно для всіх пар блоку, тож зупинка точна до пари.
+
+        start_state = generator.current
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        z2 = z * z
+        coprime_count = 0
+        pairs_used = 0
+        converged = False
+        interval = (0.0, float('inf'))
+        checkpoints = []
+
+        for block in generator.generate_blocks(2 * max_pairs, 2 * CESARO_BLOCK_PAIRS):
+            coprime = np.gcd(block[0::2], block[1::2]) == 1
+            counts = np.cumsum(coprime, dtype=np.int64) + coprime_count
+            n = np.arange(pairs_used + 1, pairs_used + len(counts) + 1, dtype=np.float64)
+
+            # Інтервал Вільсона для p і відповідний інтервал для Pi
+            p_hat = counts / n
+            center = (p_hat + z2 / (2 * n)) / (1 + z2 / n)
+            spread = z / (1 + z2 / n) * np.sqrt(p_hat * (1 - p_hat) / n + z2 / (4 * n * n))
+            with np.errstate(divide='ignore'):
+                pi_low = np.sqrt(6.0 / np.minimum(center + spread, 1.0))
+                pi_high = np.sqrt(6.0 / np.maximum(center - spread, 0.0))
+            done = ((pi_high - pi_low) / 2 <= tolerance) & (n >= min_pairs)
+
+            stop = int(np.argmax(done)) if done.any() else len(counts) - 1
+            converged = bool(done[stop])
+            interval = (float(pi_low[stop]), float(pi_high[stop]))
+            checkpoints.append(counts[99 - pairs_used % 100:stop + 1:100])
+            coprime_count = int(counts[stop])
+            pairs_used += stop + 1
+            if converged:
+                break
+
+        # Генератор зупиняється одразу після останньої використаної пари
+        generator.current = start_state
+        generator.jump(2 * pairs_used)
+
+        counts = np.concatenate(checkpoints) if checkpoints else np.empty(0, dtype=np.int64)
+        history_pairs = np.arange(1, len(counts) + 1, dtype=np.int64) * 100
+        valid = counts > 0
+        pi_estimates = np.sqrt(6.0 / (counts[valid] / history_pairs[valid])).tolist()
+
+        probability = coprime_count / pairs_used if pairs_used else 0
+        pi_estimate = math.sqrt(6.0 / probability) if probability > 0 else 0
+        return {
+            'pi_estimate': pi_estimate,
+            'error': abs(pi_estimate - math.pi) if probability > 0 else float('inf'),
+            'coprime_probability': probability,
+            'pairs_used': pairs_used,
+            'converged': converged,
+            'confidence': confidence,
+            'confidence_interval': interval,
+            'half_width': (interval[1] - interval[0]) / 2,
+            'pi_history': pi_estimates
+        }
+
+    @staticmethod
+    def compare_with_system_random(num_pairs: int = 10000000,
+                                   block_pairs: int = CESARO_BLOCK_PAIRS) -> Dict[str, Any]:
+        #Порівняння з системним генератором випадкових чисел
         #num_pairs: кількість пар для тестування
+        #Пари генеруються блоками системним генератором NumPy (ініціалізується з random),
+        #НСД обчислюється np.gcd над цілими масивами
         coprime_count = 0
         max_val = 2 ** 31 - 1
+        rng = np.random.default_rng(random.getrandbits(128))
 
-        for _ in range(num_pairs):
-            x = random.randint(1, max_val)
-            y = random.randint(1, max_val)
-
-            if gcd(x, y) == 1:
-                coprime_count += 1
+        for start in range(0, num_pairs, block_pairs):
+            size = min(block_pairs, num_pairs - start)
+            x = rng.integers(1, max_val, size=size, endpoint=True)
+            y = rng.integers(1, max_val, size=size, endpoint=True)
+            coprime_count += int(np.count_nonzero(np.gcd(x, y) == 1))
 
         probability = coprime_count / num_pairs
         pi_estimate = math.sqrt(6.0 / probability) if probability > 0 else 0 #Тест чезеро 6/Pi^2
@@ -160,22 +1297,263 @@ class CesaroTest:
         }
 
 
+# Константи Ерміта gamma_t^t для t = 2..8: найкоротший вектор ґратки з визначником m
+# у розмірності t не довший за sqrt(gamma_t) * m^(1/t)
+HERMITE_CONSTANTS_POWER = {2: 4 / 3, 3: 2, 4: 4, 5: 8, 6: 64 / 3, 7: 64, 8: 256}
+
+
+def _lll_reduce(basis: List[List[int]], delta: Fraction = Fraction(99, 100)) -> Tuple[List[List[int]], List[int], List[List[int]]]:
+    # Цілочисельний LLL (Cohen, алгоритм 2.6.7) без дробів: замість ортогоналізації
+    # Грама-Шмідта зберігаються цілі d_i = det(Gram(b_1..b_i)) та lambda_ij = d_j * mu_ij.
+    # Повертає редукований базис, d (d[0] = 1) та lambda
+    basis = [list(row) for row in basis]
+    n = len(basis)
+    dot = lambda u, v: sum(x * y for x, y in zip(u, v))
+    d = [1] + [0] * n
+    lam = [[0] * n for _ in range(n)]
+    d[1] = dot(basis[0], basis[0])
+
+    def reduce(k, l):
+        # Зменшення b_k на найближче ціле кратне b_l (індекси з 1)
+        if 2 * abs(lam[k - 1][l - 1]) > d[l]:
+            q = (2 * lam[k - 1][l - 1] + d[l]) // (2 * d[l])
+            basis[k - 1] = [x - q * y for x, y in zip(basis[k - 1], basis[l - 1])]
+            lam[k - 1][l - 1] -= q * d[l]
+            for i in range(1, l):
+                lam[k - 1][i - 1] -= q * lam[l - 1][i - 1]
+
+    def swap(k, k_max):
+        basis[k - 1], basis[k - 2] = basis[k - 2], basis[k - 1]
+        for j in range(1, k - 1):
+            lam[k - 1][j - 1], lam[k - 2][j - 1] = lam[k - 2][j - 1], lam[k - 1][j - 1]
+        value = lam[k - 1][k - 2]
+        b = (d[k - 2] * d[k] + value * value) // d[k - 1]
+        for i in range(k + 1, k_max + 1):
+            t = lam[i - 1][k - 1]
+            lam[i - 1][k - 1] = (d[k] * lam[i - 1][k - 2] - value * t) // d[k - 1]
+            lam[i - 1][k - 2] = (b * t + value * lam[i - 1][k - 1]) // d[k]
+        d[k - 1] = b
+
+    k, k_max = 2, 1
+    while k <= n:
+        if k > k_max:
+            # Інкрементальна ортогоналізація нового вектора
+            k_max = k
+            for j in range(1, k + 1):
+                u = dot(basis[k - 1], basis[j - 1])
+                for i in range(1, j):
+                    u = (d[i] * u - lam[k - 1][i - 1] * lam[j - 1][i - 1]) // d[i - 1]
+                if j < k:
+                    lam[k - 1][j - 1] = u
+                else:
+                    d[k] = u
+        reduce(k, k - 1)
+        # Умова Ловаса: d_k d_{k-2} >= delta d_{k-1}^2 - lambda_{k,k-1}^2
+        value = lam[k - 1][k - 2]
+        if delta.denominator * (d[k] * d[k - 2] + value * value) < delta.numerator * d[k - 1] ** 2:
+            swap(k, k_max)
+            k = max(2, k - 1)
+        else:
+            for l in range(k - 2, 0, -1):
+                reduce(k, l)
+            k += 1
+    return basis, d, lam
+
+
+def _shortest_vector(basis: List[List[int]]) -> Tuple[int, List[int]]:
+    # Найкоротший ненульовий вектор ґратки (перебір Фінке-Поста над LLL-редукованим базисом).
+    # Перебір іде в числах з рухомою комою із запасом, довжини кандидатів - точні цілі
+    basis, d, lam = _lll_reduce(basis)
+    n = len(basis)
+    norms = [d[i + 1] / d[i] for i in range(n)]
+    mu = [[lam[i][j] / d[j + 1] for j in range(n)] for i in range(n)]
+
+    # Поточний найкоротший вектор і радіус перебору (квадрат довжини із запасом)
+    best = {'norm': sum(x * x for x in basis[0]), 'vector': list(basis[0])}
+    best['radius'] = best['norm'] * (1 + 1e-9)
+    coefficients = [0] * n
+
+    def enumerate_level(level, partial):
+        center = -sum(mu[i][level] * coefficients[i] for i in range(level + 1, n))
+        span = math.sqrt(max(best['radius'] - partial, 0) / norms[level])
+        for x in range(math.ceil(center - span), math.floor(center + span) + 1):
+            length = partial + (x - center) ** 2 * norms[level]
+            if length > best['radius']:
+                continue
+            coefficients[level] = x
+            if level > 0:
+                enumerate_level(level - 1, length)
+            elif any(coefficients):
+                vector = [sum(coefficients[i] * basis[i][j] for i in range(n)) for j in range(n)]
+                exact = sum(v * v for v in vector)
+                if exact < best['norm']:
+                    best.update(norm=exact, vector=vector, radius=exact * (1 + 1e-9))
+        coefficients[level] = 0
+
+    enumerate_level(n - 1, 0.0)
+    return best['norm'], best['vector']
+
+
+class SpectralTest:
+    # Спектральний тест Кнута: структура ґратки точок (x_n, ..., x_{n+t-1}) / m.
+    # Усі t-вимірні точки лежать на паралельних гіперплощинах з відстанню 1/nu_t, де
+    # nu_t - довжина найкоротшого ненульового s з s_1 + s_2 a + ... + s_t a^{t-1} = 0 (mod m)
+    # (найкоротший вектор дуальної ґратки). Результат не залежить від c та x0
+
+    @staticmethod
+    def test(generator: LinearCongruentialGenerator, max_dimension: int = 8) -> Dict[str, Any]:
+        return SpectralTest.test_parameters(generator.m, generator.a, max_dimension)
+
+    @staticmethod
+    def test_parameters(m: int, a: int, max_dimension: int = 8) -> Dict[str, Any]:
+        #m, a: модуль і множник
+        #max_dimension: найбільша розмірність t (2..8)
+        if m < 2:
+            raise ValueError('Модуль має бути не менше 2')
+        if not 2 <= max_dimension <= 8:
+            raise ValueError('Розмірність має бути від 2 до 8')
+
+        dimensions = []
+        for t in range(2, max_dimension + 1):
+            # Базис дуальної ґратки: (m, 0, ..., 0) та (-a^j mod m, e_j)
+            basis = [[m] + [0] * (t - 1)]
+            for j in range(1, t):
+                basis.append([-pow(a, j, m) % m] + [int(i == j) for i in range(1, t)])
+            nu_square, vector = _shortest_vector(basis)
+
+            nu = math.sqrt(nu_square)
+            # Кнут: mu_t = pi^(t/2) nu_t^t / (Gamma(t/2 + 1) m); добре - не менше 0.1
+            mu = math.exp((t / 2) * math.log(math.pi) + t * math.log(nu)
+                          - math.lgamma(t / 2 + 1) - math.log(m))
+            # Нормована оцінка: nu_t відносно верхньої межі sqrt(gamma_t) m^(1/t), від 0 до 1
+            bound = HERMITE_CONSTANTS_POWER[t] ** (1 / (2 * t)) * math.exp(math.log(m) / t)
+            dimensions.append({
+                'dimension': t,
+                'nu_square': nu_square,
+                'nu': nu,
+                'hyperplane_distance': 1 / nu,
+                'mu': mu,
+                'figure_of_merit': nu / bound,
+                'shortest_vector': vector
+            })
+
+        worst = min(dimensions, key=lambda item: item['figure_of_merit'])
+        return {
+            'm': m,
+            'a': a,
+            'dimensions': dimensions,
+            'min_figure_of_merit': worst['figure_of_merit'],
+            'worst_dimension': worst['dimension'],
+            'min_mu': min(item['mu'] for item in dimensions),
+            'passed': all(item['mu'] >= 0.1 for item in dimensions)
+        }
+
+
+def _bit_lengths(values: np.ndarray) -> np.ndarray:
+    # Довжина двійкового запису кожного елемента (int.bit_length) для беззнакового масиву
+    values = values.astype(np.uint64)
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >> np.uint64(shift)
+        mask = high != 0
+        lengths[mask] += shift
+        values = np.where(mask, high, values)
+    lengths += (values != 0)
+    return lengths
+
+
+def igamc(a: float, x: float) -> float:
+    # Регуляризована верхня неповна гамма-функція Q(a, x) (p-значення тестів хі-квадрат)
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        # Ряд для нижньої функції P(a, x), Q = 1 - P
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Ланцюговий дріб (метод Лентца)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
 class FrequencyTest:
     #Частотний тест для перевірки випадковості
 
     @staticmethod
-    def test_bits(sequence: List[int], bit_length: int = 32) -> Dict[str, Any]:
+    def test_bits(sequence: Sequence, bit_length: int = 32,
+                  block_size: Optional[int] = None) -> Dict[str, Any]:
         #sequence: послідовність чисел
         #bit_length: довжина представлення числа в бітах
+        #block_size: кількість чисел у блоці для блокового частотного тесту (None - не виконувати)
+        chunks = (sequence[start:start + BLOCK_SIZE] for start in range(0, len(sequence), BLOCK_SIZE))
+        return FrequencyTest.test_bits_stream(chunks, bit_length, block_size)
+
+    @staticmethod
+    def test_bits_stream(chunks, bit_length: int = 32,
+                         block_size: Optional[int] = None) -> Dict[str, Any]:
+        #Той самий тест для потоку блоків (генератор, memmap): за один прохід рахуються
+        #одиниці через popcount над масивом, без рядкового представлення чисел.
+        #Число займає max(bit_length, довжина запису) біт, як у bin(num)[2:].zfill(bit_length)
         ones_count = 0
-        zeros_count = 0
+        total_bits = 0
 
-        for num in sequence:
-            binary = bin(num)[2:].zfill(bit_length)
-            ones_count += binary.count('1')
-            zeros_count += binary.count('0')
+        # Блоковий тест: частки одиниць у блоках по block_size чисел,
+        # незавершений блок переноситься між частинами потоку
+        block_chi_square = 0.0
+        blocks = 0
+        carry_ones = np.empty(0, dtype=np.int64)
+        carry_bits = np.empty(0, dtype=np.int64)
 
-        total_bits = ones_count + zeros_count
+        for chunk in chunks:
+            values = _normalize_chunk(chunk)
+            if len(values) == 0:
+                continue
+            if values.dtype == object:
+                numbers = values.tolist()
+                ones = np.array([num.bit_count() for num in numbers], dtype=np.int64)
+                widths = np.array([max(bit_length, num.bit_length()) for num in numbers], dtype=np.int64)
+            else:
+                ones = _popcount(values).astype(np.int64)
+                if int(values.max()) >> bit_length:
+                    widths = np.maximum(_bit_lengths(values), bit_length)
+                else:
+                    widths = np.full(len(values), bit_length, dtype=np.int64)
+            ones_count += int(ones.sum())
+            total_bits += int(widths.sum())
+
+            if block_size:
+                ones = np.concatenate([carry_ones, ones])
+                widths = np.concatenate([carry_bits, widths])
+                complete = len(ones) // block_size * block_size
+                block_ones = ones[:complete].reshape(-1, block_size).sum(axis=1)
+                block_bits = widths[:complete].reshape(-1, block_size).sum(axis=1)
+                # 4 * M * (pi - 1/2)^2 = (2 * ones - M)^2 / M
+                block_chi_square += float((((2 * block_ones - block_bits) ** 2) / block_bits).sum())
+                blocks += len(block_ones)
+                carry_ones, carry_bits = ones[complete:], widths[complete:]
+
+        zeros_count = total_bits - ones_count
         if total_bits == 0:
             return {'error': 'Порожня послідовність'}
 
@@ -186,37 +1564,89 @@ class FrequencyTest:
         chi_square = ((ones_count - total_bits / 2) ** 2 +
                       (zeros_count - total_bits / 2) ** 2) / (total_bits / 2)
 
-        return {
+        result = {
             'ones_count': ones_count,
             'zeros_count': zeros_count,
             'ones_ratio': ones_ratio,
             'zeros_ratio': zeros_ratio,
             'chi_square': chi_square,
+            'p_value': math.erfc(math.sqrt(chi_square / 2)),
             'is_random': chi_square < 3.841  # критичне значення для p=0.05
         }
 
+        if block_size:
+            if blocks == 0:
+                result['block_frequency'] = {'error': 'Недостатньо чисел для жодного блоку'}
+            else:
+                p_value = igamc(blocks / 2, block_chi_square / 2)
+                result['block_frequency'] = {
+                    'block_size': block_size,
+                    'blocks': blocks,
+                    'chi_square': block_chi_square,
+                    'p_value': p_value,
+                    'is_random': p_value >= 0.01  # рівень значущості NIST SP 800-22
+                }
+        return result
+
 
 class RunsTest:
     # Тест на послідовності однакових бітів
     @staticmethod
-    def test(sequence: List[int]) -> Dict[str, Any]:
+    def test(sequence: Sequence, bit_length: Optional[int] = None) -> Dict[str, Any]:
+        # bit_length: None - числа записуються без ведучих нулів (bin(num)[2:]),
+        #             N - фіксована ширина N біт, як у FrequencyTest.test_bits
+        chunks = (sequence[start:start + BLOCK_SIZE] for start in range(0, len(sequence), BLOCK_SIZE))
+        return RunsTest.test_stream(chunks, bit_length)
+
+    @staticmethod
+    def test_stream(chunks, bit_length: Optional[int] = None) -> Dict[str, Any]:
+        # Потоковий тест без побітових списків: для кожного числа x ширини w
+        # - одиниці: popcount(x);
+        # - зміни біта всередині числа: popcount((x ^ (x >> 1)) & (2^(w-1) - 1));
+        # - зміна на стику чисел: старший біт x[i] проти молодшого біта x[i-1].
+        # Молодший біт останнього числа переноситься між частинами потоку
 
-        # Перетворення на бітову послідовність
-        bits = []
-        for num in sequence:
-            binary = bin(num)[2:]
-            bits.extend([int(b) for b in binary])
+        min_width = bit_length or 1
+        n = 0
+        ones = 0
+        transitions = 0
+        last_bit = None
 
-        if len(bits) < 2:
-            return {'error': 'Послідовність коротка'}
+        for chunk in chunks:
+            values = _normalize_chunk(chunk)
+            if len(values) == 0:
+                continue
+            if values.dtype == object:
+                for num in values.tolist():
+                    width = max(min_width, num.bit_length())
+                    n += width
+                    ones += num.bit_count()
+                    transitions += ((num ^ (num >> 1)) & ((1 << (width - 1)) - 1)).bit_count()
+                    first_bit = (num >> (width - 1)) & 1
+                    if last_bit is not None and first_bit != last_bit:
+                        transitions += 1
+                    last_bit = num & 1
+                continue
 
-        runs = 1  # кількість послідовностей
-        for i in range(1, len(bits)):
-            if bits[i] != bits[i - 1]:
-                runs += 1
+            values = values.astype(np.uint64)
+            widths = np.maximum(_bit_lengths(values), min_width).astype(np.uint64)
+            one = np.uint64(1)
+            inner_mask = np.left_shift(one, widths - one) - one
+            first_bits = (values >> (widths - one)) & one
+            last_bits = values & one
+
+            n += int(widths.sum())
+            ones += int(_popcount(values).sum(dtype=np.int64))
+            transitions += int(_popcount((values ^ (values >> one)) & inner_mask).sum(dtype=np.int64))
+            transitions += int(np.count_nonzero(first_bits[1:] != last_bits[:-1]))
+            if last_bit is not None and int(first_bits[0]) != last_bit:
+                transitions += 1
+            last_bit = int(last_bits[-1])
+
+        if n < 2:
+            return {'error': 'Послідовність коротка'}
 
-        n = len(bits)
-        ones = sum(bits)
+        runs = 1 + transitions  # кількість послідовностей
         zeros = n - ones
 
         if ones == 0 or zeros == 0:
@@ -1,7 +1,20 @@
+import io
+import mmap
+import os
+import stat
 import struct
 import math
 
+import numpy as np
+
 cd = 0xFFFFFFFF
+
+# 16 слів блоку (little-endian): формат розбирається один раз
+BLOCK_WORDS = struct.Struct('<16I')
+
+# Кількість повідомлень, що обробляються одночасно в hash_many (масиви стану вміщуються в кеш)
+LANE_BATCH = 1 << 14
+
 class MD5:
     """Реалізація алгоритму хешування MD5 згідно RFC 1321"""
 
@@ -44,29 +57,266 @@ class MD5:
     def _i(b, c, d):
         return c ^ (b | ~d)
 
+    # Параметри, сумісні з об'єктами hashlib
+    name = 'md5'
+    digest_size = 16
+    block_size = 64
+
+    def __init__(self, data=b''):
+        """
+        Інкрементний MD5-контекст (сумісний з hashlib.md5)
+        Зберігає лише стан ABCD, загальну довжину і необроблений залишок (< 64 байт)
+
+        Args:
+            data: початкові дані (необов'язково)
+        """
+        self._state = (MD5.INIT_A, MD5.INIT_B, MD5.INIT_C, MD5.INIT_D)
+        self._length = 0
+        self._tail = b''
+        # Будь-який буфер (зокрема масив NumPy, для якого if data неоднозначне)
+        self.update(data)
+
+    def update(self, data):
+        """
+        Додає дані до хешованого повідомлення
+
+        Args:
+            data: байти або будь-який об'єкт з буферним протоколом
+        """
+        source = memoryview(data)
+        if not source.c_contiguous:
+            # Несуцільний буфер (наприклад, ndarray[::2]) копіюється в байти в порядку C:
+            # cast('B') можливий лише для суцільного представлення
+            with source:
+                source = memoryview(source.tobytes())
+        # Представлення звільняються одразу (інакше mmap-джерело не можна закрити)
+        with source, source.cast('B') as view:
+            self._length += len(view)
+            a, b, c, d = self._state
+            offset = 0
+
+            # Доповнюємо залишок попереднього виклику до повного блоку
+            if self._tail:
+                offset = min(64 - len(self._tail), len(view))
+                self._tail += view[:offset].tobytes()
+                if len(self._tail) < 64:
+                    return
+                a, b, c, d = MD5._process_block(self._tail, a, b, c, d)
+
+            # Повні блоки читаються прямо з буфера за зсувом, без копій і зрізів
+            end = offset + (len(view) - offset) // 64 * 64
+            process_block = MD5._process_block
+            for i in range(offset, end, 64):
+                a, b, c, d = process_block(view, a, b, c, d, i)
+
+            self._tail = view[end:].tobytes()
+            self._state = (a, b, c, d)
+
+    def digest(self):
+        """
+        Повертає хеш повідомлення (16 байт); стан контексту не змінюється
+        """
+        a, b, c, d = self._state
+        final_data = MD5._padding(self._tail, self._length)
+        for i in range(0, len(final_data), 64):
+            a, b, c, d = MD5._process_block(final_data[i:i + 64], a, b, c, d)
+        return struct.pack('<4I', a, b, c, d)
+
+    def hexdigest(self):
+        """
+        Повертає хеш у шістнадцятковому форматі (малі літери, як hashlib)
+        """
+        return self.digest().hex()
+
+    def copy(self):
+        """
+        Повертає незалежну копію контексту (для хешів спільних префіксів)
+        """
+        clone = MD5.__new__(MD5)
+        clone._state = self._state
+        clone._length = self._length
+        clone._tail = self._tail
+        return clone
+
     @staticmethod
-    def _padding(message):
+    def _padding(message, length=None):
         """
         Крок 1 і 2: Додавання доповнення та довжини
         Повідомлення доповнюється до довжини 448 mod 512,
         потім додається 64-бітове значення довжини
+
+        Args:
+            message: повідомлення (або його необроблений залишок)
+            length: повна довжина повідомлення в байтах (за замовчуванням len(message))
         """
-        msg_len = len(message)
-        message += b'\x80'  # Додаємо біт 1 та біти 0
+        msg_len = len(message) if length is None else length
 
-        # Доповнюємо нулями до 448 mod 512 біт (56 mod 64 байт)
-        while len(message) % 64 != 56:
-            message += b'\x00'
+        # Біт 1, потім нулі до 448 mod 512 біт (56 mod 64 байт)
+        zeros = (55 - len(message)) % 64
+        message = bytes(message) + b'\x80' + b'\x00' * zeros
 
         # Додаємо довжину вихідного повідомлення в бітах (64 біти, little-endian)
-        message += struct.pack('<Q', msg_len * 8)
+        message += struct.pack('<Q', (msg_len * 8) & 0xFFFFFFFFFFFFFFFF)
 
         return message
 
     @staticmethod
-    def _process_block(block, a, b, c, d):
+    def _process_block(block, a, b, c, d, offset=0):
         """
-        Крок 4: Обробка одного 512-бітового блоку
+        Крок 4: Обробка одного 512-бітового блоку (оптимізована версія)
+        Розклад раундів (номер слова k, зсув s, константа T) обчислено заздалегідь
+        і підставлено в розгорнуті 64 раунди; логічні функції та циклічний зсув
+        вбудовані, маска - локальна змінна. Нові значення a, b, c, d не маскуються:
+        старші біти не впливають на молодші 32 (кожне t маскується перед зсувом,
+        підсумок - у кінці). Результат збігається з _process_block_reference
+
+        Args:
+            block: буфер з блоком (bytes, memoryview, mmap)
+            offset: зсув блоку в буфері (блок читається без створення зрізу)
+        """
+        M = cd
+        x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15 = BLOCK_WORDS.unpack_from(block, offset)
+        aa, bb, cc, dd = a, b, c, d
+
+        # Цикл 1: F(b, c, d) = (b & c) | (~b & d)
+        t = (a + (d ^ (b & (c ^ d))) + x0 + 0xD76AA478) & M
+        a = b + ((t << 7 & M) | t >> 25)
+        t = (d + (c ^ (a & (b ^ c))) + x1 + 0xE8C7B756) & M
+        d = a + ((t << 12 & M) | t >> 20)
+        t = (c + (b ^ (d & (a ^ b))) + x2 + 0x242070DB) & M
+        c = d + ((t << 17 & M) | t >> 15)
+        t = (b + (a ^ (c & (d ^ a))) + x3 + 0xC1BDCEEE) & M
+        b = c + ((t << 22 & M) | t >> 10)
+        t = (a + (d ^ (b & (c ^ d))) + x4 + 0xF57C0FAF) & M
+        a = b + ((t << 7 & M) | t >> 25)
+        t = (d + (c ^ (a & (b ^ c))) + x5 + 0x4787C62A) & M
+        d = a + ((t << 12 & M) | t >> 20)
+        t = (c + (b ^ (d & (a ^ b))) + x6 + 0xA8304613) & M
+        c = d + ((t << 17 & M) | t >> 15)
+        t = (b + (a ^ (c & (d ^ a))) + x7 + 0xFD469501) & M
+        b = c + ((t << 22 & M) | t >> 10)
+        t = (a + (d ^ (b & (c ^ d))) + x8 + 0x698098D8) & M
+        a = b + ((t << 7 & M) | t >> 25)
+        t = (d + (c ^ (a & (b ^ c))) + x9 + 0x8B44F7AF) & M
+        d = a + ((t << 12 & M) | t >> 20)
+        t = (c + (b ^ (d & (a ^ b))) + x10 + 0xFFFF5BB1) & M
+        c = d + ((t << 17 & M) | t >> 15)
+        t = (b + (a ^ (c & (d ^ a))) + x11 + 0x895CD7BE) & M
+        b = c + ((t << 22 & M) | t >> 10)
+        t = (a + (d ^ (b & (c ^ d))) + x12 + 0x6B901122) & M
+        a = b + ((t << 7 & M) | t >> 25)
+        t = (d + (c ^ (a & (b ^ c))) + x13 + 0xFD987193) & M
+        d = a + ((t << 12 & M) | t >> 20)
+        t = (c + (b ^ (d & (a ^ b))) + x14 + 0xA679438E) & M
+        c = d + ((t << 17 & M) | t >> 15)
+        t = (b + (a ^ (c & (d ^ a))) + x15 + 0x49B40821) & M
+        b = c + ((t << 22 & M) | t >> 10)
+        # Цикл 2: G(b, c, d) = (b & d) | (c & ~d)
+        t = (a + (c ^ (d & (b ^ c))) + x1 + 0xF61E2562) & M
+        a = b + ((t << 5 & M) | t >> 27)
+        t = (d + (b ^ (c & (a ^ b))) + x6 + 0xC040B340) & M
+        d = a + ((t << 9 & M) | t >> 23)
+        t = (c + (a ^ (b & (d ^ a))) + x11 + 0x265E5A51) & M
+        c = d + ((t << 14 & M) | t >> 18)
+        t = (b + (d ^ (a & (c ^ d))) + x0 + 0xE9B6C7AA) & M
+        b = c + ((t << 20 & M) | t >> 12)
+        t = (a + (c ^ (d & (b ^ c))) + x5 + 0xD62F105D) & M
+        a = b + ((t << 5 & M) | t >> 27)
+        t = (d + (b ^ (c & (a ^ b))) + x10 + 0x02441453) & M
+        d = a + ((t << 9 & M) | t >> 23)
+        t = (c + (a ^ (b & (d ^ a))) + x15 + 0xD8A1E681) & M
+        c = d + ((t << 14 & M) | t >> 18)
+        t = (b + (d ^ (a & (c ^ d))) + x4 + 0xE7D3FBC8) & M
+        b = c + ((t << 20 & M) | t >> 12)
+        t = (a + (c ^ (d & (b ^ c))) + x9 + 0x21E1CDE6) & M
+        a = b + ((t << 5 & M) | t >> 27)
+        t = (d + (b ^ (c & (a ^ b))) + x14 + 0xC33707D6) & M
+        d = a + ((t << 9 & M) | t >> 23)
+        t = (c + (a ^ (b & (d ^ a))) + x3 + 0xF4D50D87) & M
+        c = d + ((t << 14 & M) | t >> 18)
+        t = (b + (d ^ (a & (c ^ d))) + x8 + 0x455A14ED) & M
+        b = c + ((t << 20 & M) | t >> 12)
+        t = (a + (c ^ (d & (b ^ c))) + x13 + 0xA9E3E905) & M
+        a = b + ((t << 5 & M) | t >> 27)
+        t = (d + (b ^ (c & (a ^ b))) + x2 + 0xFCEFA3F8) & M
+        d = a + ((t << 9 & M) | t >> 23)
+        t = (c + (a ^ (b & (d ^ a))) + x7 + 0x676F02D9) & M
+        c = d + ((t << 14 & M) | t >> 18)
+        t = (b + (d ^ (a & (c ^ d))) + x12 + 0x8D2A4C8A) & M
+        b = c + ((t << 20 & M) | t >> 12)
+        # Цикл 3: H(b, c, d) = b ^ c ^ d
+        t = (a + (b ^ c ^ d) + x5 + 0xFFFA3942) & M
+        a = b + ((t << 4 & M) | t >> 28)
+        t = (d + (a ^ b ^ c) + x8 + 0x8771F681) & M
+        d = a + ((t << 11 & M) | t >> 21)
+        t = (c + (d ^ a ^ b) + x11 + 0x6D9D6122) & M
+        c = d + ((t << 16 & M) | t >> 16)
+        t = (b + (c ^ d ^ a) + x14 + 0xFDE5380C) & M
+        b = c + ((t << 23 & M) | t >> 9)
+        t = (a + (b ^ c ^ d) + x1 + 0xA4BEEA44) & M
+        a = b + ((t << 4 & M) | t >> 28)
+        t = (d + (a ^ b ^ c) + x4 + 0x4BDECFA9) & M
+        d = a + ((t << 11 & M) | t >> 21)
+        t = (c + (d ^ a ^ b) + x7 + 0xF6BB4B60) & M
+        c = d + ((t << 16 & M) | t >> 16)
+        t = (b + (c ^ d ^ a) + x10 + 0xBEBFBC70) & M
+        b = c + ((t << 23 & M) | t >> 9)
+        t = (a + (b ^ c ^ d) + x13 + 0x289B7EC6) & M
+        a = b + ((t << 4 & M) | t >> 28)
+        t = (d + (a ^ b ^ c) + x0 + 0xEAA127FA) & M
+        d = a + ((t << 11 & M) | t >> 21)
+        t = (c + (d ^ a ^ b) + x3 + 0xD4EF3085) & M
+        c = d + ((t << 16 & M) | t >> 16)
+        t = (b + (c ^ d ^ a) + x6 + 0x04881D05) & M
+        b = c + ((t << 23 & M) | t >> 9)
+        t = (a + (b ^ c ^ d) + x9 + 0xD9D4D039) & M
+        a = b + ((t << 4 & M) | t >> 28)
+        t = (d + (a ^ b ^ c) + x12 + 0xE6DB99E5) & M
+        d = a + ((t << 11 & M) | t >> 21)
+        t = (c + (d ^ a ^ b) + x15 + 0x1FA27CF8) & M
+        c = d + ((t << 16 & M) | t >> 16)
+        t = (b + (c ^ d ^ a) + x2 + 0xC4AC5665) & M
+        b = c + ((t << 23 & M) | t >> 9)
+        # Цикл 4: I(b, c, d) = c ^ (b | ~d)
+        t = (a + (c ^ (b | (d ^ M))) + x0 + 0xF4292244) & M
+        a = b + ((t << 6 & M) | t >> 26)
+        t = (d + (b ^ (a | (c ^ M))) + x7 + 0x432AFF97) & M
+        d = a + ((t << 10 & M) | t >> 22)
+        t = (c + (a ^ (d | (b ^ M))) + x14 + 0xAB9423A7) & M
+        c = d + ((t << 15 & M) | t >> 17)
+        t = (b + (d ^ (c | (a ^ M))) + x5 + 0xFC93A039) & M
+        b = c + ((t << 21 & M) | t >> 11)
+        t = (a + (c ^ (b | (d ^ M))) + x12 + 0x655B59C3) & M
+        a = b + ((t << 6 & M) | t >> 26)
+        t = (d + (b ^ (a | (c ^ M))) + x3 + 0x8F0CCC92) & M
+        d = a + ((t << 10 & M) | t >> 22)
+        t = (c + (a ^ (d | (b ^ M))) + x10 + 0xFFEFF47D) & M
+        c = d + ((t << 15 & M) | t >> 17)
+        t = (b + (d ^ (c | (a ^ M))) + x1 + 0x85845DD1) & M
+        b = c + ((t << 21 & M) | t >> 11)
+        t = (a + (c ^ (b | (d ^ M))) + x8 + 0x6FA87E4F) & M
+        a = b + ((t << 6 & M) | t >> 26)
+        t = (d + (b ^ (a | (c ^ M))) + x15 + 0xFE2CE6E0) & M
+        d = a + ((t << 10 & M) | t >> 22)
+        t = (c + (a ^ (d | (b ^ M))) + x6 + 0xA3014314) & M
+        c = d + ((t << 15 & M) | t >> 17)
+        t = (b + (d ^ (c | (a ^ M))) + x13 + 0x4E0811A1) & M
+        b = c + ((t << 21 & M) | t >> 11)
+        t = (a + (c ^ (b | (d ^ M))) + x4 + 0xF7537E82) & M
+        a = b + ((t << 6 & M) | t >> 26)
+        t = (d + (b ^ (a | (c ^ M))) + x11 + 0xBD3AF235) & M
+        d = a + ((t << 10 & M) | t >> 22)
+        t = (c + (a ^ (d | (b ^ M))) + x2 + 0x2AD7D2BB) & M
+        c = d + ((t << 15 & M) | t >> 17)
+        t = (b + (d ^ (c | (a ^ M))) + x9 + 0xEB86D391) & M
+        b = c + ((t << 21 & M) | t >> 11)
+
+        return (a + aa) & M, (b + bb) & M, (c + cc) & M, (d + dd) & M
+
+    @staticmethod
+    def _process_block_reference(block, a, b, c, d):
+        """
+        Крок 4: Обробка одного 512-бітового блоку (еталонна версія)
         Виконує 4 цикли по 16 раундів кожен
         """
         # Розбиваємо блок на 16 32-бітових слів (little-endian)
@@ -115,6 +365,43 @@ class MD5:
 
         return a, b, c, d
 
+    @staticmethod
+    def _process_lanes(words, a, b, c, d):
+        """
+        Крок 4 для багатьох незалежних повідомлень одночасно (hash_many)
+        Кожне повідомлення - окрема «доріжка» масивів uint32; переповнення
+        при додаванні дає потрібне зведення за модулем 2^32
+
+        Args:
+            words: масив (кількість блоків, 16, доріжки) слів блоків
+            a, b, c, d: масиви стану (доріжки,)
+
+        Returns:
+            tuple: новий стан (a, b, c, d)
+        """
+        for block in words:
+            aa, bb, cc, dd = a, b, c, d
+            for i in range(64):
+                if i < 16:
+                    f = d ^ (b & (c ^ d))
+                    k = i
+                elif i < 32:
+                    f = c ^ (d & (b ^ c))
+                    k = (1 + 5 * i) % 16
+                elif i < 48:
+                    f = b ^ c ^ d
+                    k = (5 + 3 * i) % 16
+                else:
+                    f = c ^ (b | ~d)
+                    k = (7 * i) % 16
+                s = MD5.S[i // 16][i % 16]
+                f += a
+                f += block[k]
+                f += np.uint32(MD5.T[i])
+                a, b, c, d = d, b + ((f << np.uint32(s)) | (f >> np.uint32(32 - s))), b, c
+            a, b, c, d = a + aa, b + bb, c + cc, d + dd
+        return a, b, c, d
+
     @staticmethod
     def hash_bytes(data):
         """
@@ -126,26 +413,7 @@ class MD5:
         Returns:
             str: хеш у шістнадцятковому форматі (32 символи)
         """
-        # Крок 3: Ініціалізація MD-буфера
-        a = MD5.INIT_A
-        b = MD5.INIT_B
-        c = MD5.INIT_C
-        d = MD5.INIT_D
-
-        # Крок 1-2: Доповнення повідомлення
-        padded_data = MD5._padding(data)
-
-        # Крок 4: Обробка повідомлення блоками по 512 біт (64 байти)
-        for i in range(0, len(padded_data), 64):
-            block = padded_data[i:i + 64]
-            a, b, c, d = MD5._process_block(block, a, b, c, d)
-
-        # Крок 5: Формування виходу (128 біт = 16 байт)
-        # Конвертуємо в little-endian формат
-        result = struct.pack('<4I', a, b, c, d)
-
-        # Повертаємо у шістнадцятковому форматі
-        return result.hex().upper()
+        return MD5(data).hexdigest().upper()
 
     @staticmethod
     def hash_string(text):
@@ -160,6 +428,51 @@ class MD5:
         """
         return MD5.hash_bytes(text.encode('utf-8'))
 
+    @staticmethod
+    def hash_many(messages):
+        """
+        Обчислює MD5 хеші багатьох повідомлень одночасно
+        Повідомлення групуються за кількістю блоків після доповнення, і кожна група
+        обробляється функцією стиснення над масивами NumPy (одна доріжка - одне повідомлення)
+
+        Args:
+            messages: список байтових рядків (рядки str кодуються в UTF-8)
+
+        Returns:
+            list: хеші у шістнадцятковому форматі в порядку повідомлень
+        """
+        messages = [m.encode('utf-8') if isinstance(m, str) else bytes(m) for m in messages]
+        lengths = np.fromiter(map(len, messages), dtype=np.int64, count=len(messages))
+        block_counts = (lengths + 8) // 64 + 1
+        digests = np.empty((len(messages), 4), dtype='<u4')
+
+        for count in np.unique(block_counts):
+            group = np.flatnonzero(block_counts == count)
+            width = int(count) * 64
+            for start in range(0, len(group), LANE_BATCH):
+                index = group[start:start + LANE_BATCH]
+                sizes = lengths[index]
+
+                # Кроки 1-2 для всієї групи: байти повідомлень розкладаються по рядках
+                # матриці, далі біт 1 і довжина в бітах (little-endian) у кінці рядка
+                padded = np.zeros((len(index), width), dtype=np.uint8)
+                data = np.frombuffer(b''.join([messages[i] for i in index]), dtype=np.uint8)
+                rows = np.repeat(np.arange(len(index)), sizes)
+                columns = np.arange(len(data)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+                padded[rows, columns] = data
+                padded[np.arange(len(index)), sizes] = 0x80
+                padded[:, -8:] = (sizes.astype('<u8') * 8)[:, None].view(np.uint8)
+
+                # Слова блоків: (блок, слово, доріжка) - кожне слово суцільний масив
+                words = padded.view('<u4').reshape(len(index), int(count), 16).transpose(1, 2, 0).copy()
+                state = [np.full(len(index), value, dtype=np.uint32)
+                         for value in (MD5.INIT_A, MD5.INIT_B, MD5.INIT_C, MD5.INIT_D)]
+                digests[index] = np.stack(MD5._process_lanes(words, *state), axis=1)
+
+        # Крок 5: 16 байт на повідомлення, little-endian
+        hex_digests = digests.tobytes().hex().upper()
+        return [hex_digests[i:i + 32] for i in range(0, len(hex_digests), 32)]
+
     @staticmethod
     def hash_file(filepath=None, file_object=None, chunk_size=8192):
         """
@@ -174,18 +487,20 @@ class MD5:
         Returns:
             str: хеш у шістнадцятковому форматі
         """
-        # Крок 3: Ініціалізація MD-буфера
-        a = MD5.INIT_A
-        b = MD5.INIT_B
-        c = MD5.INIT_C
-        d = MD5.INIT_D
+        md5 = MD5()
 
-        total_length = 0
-        buffer = b''
+        # Завантажений Django-файл, збережений на диску, хешується як локальний файл
+        temporary_file_path = getattr(file_object, 'temporary_file_path', None)
+        if file_object and temporary_file_path is not None:
+            filepath, file_object = temporary_file_path(), None
 
         # Визначаємо, з якого джерела читати
         if file_object:
-            file_object.seek(0)
+            try:
+                file_object.seek(0)
+            except OSError:
+                # Канал або сокет: читається з поточної позиції
+                pass
             source = file_object
         elif filepath:
             source = open(filepath, 'rb')
@@ -193,52 +508,56 @@ class MD5:
             raise ValueError("Необхідно вказати filepath або file_object")
 
         try:
-            # Читаємо файл по частинах
-            while True:
-                chunk = source.read(chunk_size)
-                if not chunk:
-                    break
-
-                buffer += chunk
-                total_length += len(chunk)
-
-                # Обробляємо повні 512-бітові блоки (64 байти)
-                while len(buffer) >= 64:
-                    block = buffer[:64]
-                    buffer = buffer[64:]
-                    a, b, c, d = MD5._process_block(block, a, b, c, d)
-
-            # Обробляємо залишок з доповненням
-            final_data = MD5._padding(buffer)
-            for i in range(0, len(final_data), 64):
-                block = final_data[i:i + 64]
-                a, b, c, d = MD5._process_block(block, a, b, c, d)
-
-            # Враховуємо довжину вже оброблених даних
-            if len(final_data) > 0:
-                # Коригуємо останній блок з правильною довжиною
-                a = MD5.INIT_A
-                b = MD5.INIT_B
-                c = MD5.INIT_C
-                d = MD5.INIT_D
-
-                # Перечитуємо файл для правильного підрахунку
-                if file_object:
-                    file_object.seek(0)
-                    all_data = file_object.read()
-                else:
-                    source.seek(0)
-                    all_data = source.read()
-
-                return MD5.hash_bytes(all_data)
-
+            # Файл у пам'яті (InMemoryUploadedFile, BytesIO) - буфер без копіювання
+            inner = getattr(source, 'file', source)
+            if isinstance(inner, io.BytesIO):
+                with inner.getbuffer() as buffer:
+                    md5.update(buffer)
+            # Звичайний файл на диску - відображення в пам'ять
+            elif not MD5._update_mapped(md5, source):
+                # Канали, сокети тощо: один прохід по частинах,
+                # у пам'яті лише поточна частина і залишок < 64 байт
+                while True:
+                    chunk = source.read(chunk_size)
+                    if not chunk:
+                        break
+                    md5.update(chunk)
         finally:
             if filepath and source:
                 source.close()
 
-        # Формуємо результат
-        result = struct.pack('<4I', a, b, c, d)
-        return result.hex().upper()
+        return md5.hexdigest().upper()
+
+    @staticmethod
+    def _update_mapped(md5, source):
+        """
+        Хешує звичайний файл через mmap: блоки читаються прямо зі сторінок файлу,
+        пам'ять процесу не залежить від розміру файлу
+
+        Args:
+            md5: MD5-контекст
+            source: відкритий файл
+
+        Returns:
+            bool: False, якщо файл не можна відобразити (канал, порожній файл тощо)
+        """
+        try:
+            info = os.fstat(source.fileno())
+            if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+                return False
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            return False
+
+        try:
+            if hasattr(mapped, 'madvise'):
+                # Послідовне читання: ядро читає наперед і звільняє пройдені сторінки
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as view:
+                md5.update(view)
+        finally:
+            mapped.close()
+        return True
 
     @staticmethod
     def verify_file(filepath=None, file_object=None, expected_hash=None):
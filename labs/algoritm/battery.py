@@ -0,0 +1,427 @@
+"""
+Батарея тестів випадковості у стилі NIST SP 800-22
+Лабораторна робота №1 - Варіант 17
+
+Послідовність бітів генерується один раз у спільний файл, відображений у пам'ять
+(np.memmap), і тести виконуються паралельно в пулі процесів: кожен процес
+відкриває той самий файл без копіювання даних
+"""
+import math
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
+
+import numpy as np
+
+from .LR1 import LinearCongruentialGenerator, igamc, _popcount
+
+# Кількість бітів, що розпаковуються в пам'ять за один крок тесту
+BATTERY_CHUNK_BITS = 1 << 23
+
+# Найбільша довжина послідовності для спектрального тесту (ДПФ усієї послідовності
+# довжиною 10^8 потребувало б гігабайтів пам'яті)
+DFT_MAX_BITS = 1 << 20
+
+# Рівень значущості NIST SP 800-22
+SIGNIFICANCE_LEVEL = 0.01
+
+# Параметри тесту найдовшої серії одиниць: (мінімальна довжина, M, межі категорій, ймовірності)
+LONGEST_RUN_TABLE = (
+    (750000, 10000, (10, 16), (0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727)),
+    (6272, 128, (4, 9), (0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124)),
+    (128, 8, (1, 4), (0.2148, 0.3672, 0.2305, 0.1875)),
+)
+
+
+def _bit_chunks(packed: np.ndarray, n_bits: int, multiple: int = 8) -> Iterator[np.ndarray]:
+    # Розпакування бітів частинами; довжина кожної частини (крім останньої) кратна multiple
+    step = multiple * 8 // math.gcd(multiple, 8)
+    chunk_bits = step * max(1, BATTERY_CHUNK_BITS // step)
+    for start in range(0, n_bits, chunk_bits):
+        stop = min(start + chunk_bits, n_bits)
+        yield np.unpackbits(packed[start // 8:(stop + 7) // 8], count=stop - start)
+
+
+def _pattern_counts(packed: np.ndarray, n_bits: int, length: int) -> np.ndarray:
+    # Кількість входжень кожного length-бітного шаблону (length <= 25) з перекриттям
+    # у циклічно замкненій послідовності (перші length-1 біт дописуються в кінець).
+    # Вікна читаються з 32-бітних слів над впакованими байтами: для зсуву r у байті
+    # шаблон - це (word << r) >> (32 - length), тобто 8 векторних проходів по n/8 словах
+    counts = np.zeros(1 << length, dtype=np.int64)
+    inside = n_bits - length + 1  # вікна, що повністю лежать у послідовності
+    chunk_bytes = BATTERY_CHUNK_BITS // 8
+    for first in range(0, (inside + 7) // 8, chunk_bytes):
+        size = min(chunk_bytes, (inside + 7) // 8 - first)
+        data = np.zeros(size + 3, dtype=np.uint32)
+        raw = packed[first:first + size + 3]
+        data[:len(raw)] = raw
+        words = (data[:size] << 24) | (data[1:size + 1] << 16) | (data[2:size + 2] << 8) | data[3:size + 3]
+        for shift in range(8):
+            # Останній байт може містити лише частину допустимих позицій
+            valid = min(size, (inside - shift - 8 * first + 7) // 8)
+            values = (words[:valid] << np.uint32(shift)) >> np.uint32(32 - length)
+            counts += np.bincount(values, minlength=1 << length)
+
+    # Вікна, що переходять через кінець послідовності на її початок
+    start = max(inside, 0)
+    tail = np.unpackbits(packed[start // 8:(n_bits + 7) // 8], count=n_bits - start // 8 * 8)[start % 8:]
+    head = np.unpackbits(packed[:(length + 6) // 8], count=length - 1)
+    window = np.concatenate([tail, head])
+    positions = len(window) - length + 1
+    values = np.zeros(positions, dtype=np.uint32)
+    for shift in range(length):
+        values = (values << np.uint32(1)) | window[shift:shift + positions]
+    counts += np.bincount(values, minlength=1 << length)
+    return counts
+
+
+def _fold_counts(counts: np.ndarray) -> np.ndarray:
+    # Кількості (length-1)-бітних шаблонів з кількостей length-бітних
+    # (у циклічній послідовності кожне вікно однозначно продовжується на один біт)
+    return counts[0::2] + counts[1::2]
+
+
+def _psi_square(counts: np.ndarray, n_bits: int) -> float:
+    # Статистика psi^2 серійного тесту
+    return float((counts.astype(np.float64) ** 2).sum()) * len(counts) / n_bits - n_bits
+
+
+def monobit_test(packed: np.ndarray, n_bits: int) -> Dict[str, Any]:
+    # Частотний (монобітний) тест
+    if n_bits < 100:
+        return {'error': 'Потрібно щонайменше 100 біт'}
+    ones = int(_popcount(packed).sum(dtype=np.int64))
+    s_obs = abs(2 * ones - n_bits) / math.sqrt(n_bits)
+    return {
+        'ones_count': ones,
+        's_obs': s_obs,
+        'p_value': math.erfc(s_obs / math.sqrt(2))
+    }
+
+
+def block_frequency_test(packed: np.ndarray, n_bits: int, block_size: int = 128) -> Dict[str, Any]:
+    # Частотний тест у блоках по block_size біт
+    blocks = n_bits // block_size
+    if block_size < 1 or blocks < 1 or n_bits < 100:
+        return {'error': 'Недостатньо бітів для жодного блоку'}
+    chi_square = 0.0
+    for bits in _bit_chunks(packed, blocks * block_size, block_size):
+        ones = bits.reshape(-1, block_size).sum(axis=1, dtype=np.int64)
+        chi_square += float(((2 * ones - block_size) ** 2).sum()) / block_size
+    return {
+        'block_size': block_size,
+        'blocks': blocks,
+        'chi_square': chi_square,
+        'p_value': igamc(blocks / 2, chi_square / 2)
+    }
+
+
+def runs_test(packed: np.ndarray, n_bits: int) -> Dict[str, Any]:
+    # Тест серій: кількість змін значення біта
+    if n_bits < 100:
+        return {'error': 'Потрібно щонайменше 100 біт'}
+    ones = int(_popcount(packed).sum(dtype=np.int64))
+    pi = ones / n_bits
+    # Попередня умова: без неї тест серій не має сенсу
+    if abs(pi - 0.5) >= 2 / math.sqrt(n_bits):
+        return {'runs': None, 'pi': pi, 'p_value': 0.0}
+    transitions = 0
+    last_bit = None
+    for bits in _bit_chunks(packed, n_bits):
+        transitions += int(np.count_nonzero(bits[1:] != bits[:-1]))
+        if last_bit is not None and bits[0] != last_bit:
+            transitions += 1
+        last_bit = bits[-1]
+    runs = transitions + 1
+    expected = 2 * n_bits * pi * (1 - pi)
+    return {
+        'runs': runs,
+        'pi': pi,
+        'p_value': math.erfc(abs(runs - expected) / (2 * math.sqrt(2 * n_bits) * pi * (1 - pi)))
+    }
+
+
+def longest_run_test(packed: np.ndarray, n_bits: int) -> Dict[str, Any]:
+    # Тест найдовшої серії одиниць у блоці
+    for min_bits, block_size, (low, high), probabilities in LONGEST_RUN_TABLE:
+        if n_bits >= min_bits:
+            break
+    else:
+        return {'error': 'Потрібно щонайменше 128 біт'}
+
+    blocks = n_bits // block_size
+    frequencies = np.zeros(len(probabilities), dtype=np.int64)
+    for bits in _bit_chunks(packed, blocks * block_size, block_size):
+        rows = bits.reshape(-1, block_size)
+        # Нульовий стовпець-роздільник, щоб серії не переходили між блоками
+        padded = np.zeros((len(rows), block_size + 2), dtype=np.int8)
+        padded[:, 1:-1] = rows
+        edges = np.diff(padded.ravel())
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        longest = np.zeros(len(rows), dtype=np.int64)
+        np.maximum.at(longest, starts // (block_size + 2), ends - starts)
+        frequencies += np.bincount(np.clip(longest, low, high) - low, minlength=len(probabilities))
+
+    expected = blocks * np.array(probabilities)
+    chi_square = float(((frequencies - expected) ** 2 / expected).sum())
+    return {
+        'block_size': block_size,
+        'blocks': blocks,
+        'frequencies': frequencies.tolist(),
+        'chi_square': chi_square,
+        'p_value': igamc((len(probabilities) - 1) / 2, chi_square / 2)
+    }
+
+
+def default_pattern_lengths(n_bits: int) -> Dict[str, int]:
+    # Довжини шаблонів за замовчуванням для заданої кількості бітів:
+    # рекомендації NIST m < log2(n) - 2 (серійний тест) та m < log2(n) - 5 (ентропія),
+    # обмежені зверху попередніми значеннями 16 та 10
+    log_bits = int(math.log2(max(n_bits, 1)))
+    return {
+        'serial': min(16, max(2, log_bits - 3)),
+        'approximate_entropy': min(10, max(1, log_bits - 6)),
+    }
+
+
+def serial_test(packed: np.ndarray, n_bits: int, length: int = 16) -> Dict[str, Any]:
+    # Серійний тест: рівномірність усіх length-бітних шаблонів з перекриттям
+    if length < 2 or length > 25 or length >= int(math.log2(max(n_bits, 1))) - 2:
+        return {'error': 'Довжина шаблону має бути від 2 до min(25, log2(n) - 3)'}
+    counts = _pattern_counts(packed, n_bits, length)
+    psi = [_psi_square(counts, n_bits)]
+    for _ in range(2):
+        counts = _fold_counts(counts)
+        psi.append(_psi_square(counts, n_bits) if len(counts) > 1 else 0.0)
+    delta = psi[0] - psi[1]
+    delta_square = psi[0] - 2 * psi[1] + psi[2]
+    p_values = [igamc(2 ** (length - 2), delta / 2), igamc(2 ** (length - 3), delta_square / 2)]
+    return {
+        'pattern_length': length,
+        'psi_square': psi,
+        'p_values': p_values,
+        'p_value': min(p_values)
+    }
+
+
+def approximate_entropy_test(packed: np.ndarray, n_bits: int, length: int = 10) -> Dict[str, Any]:
+    # Тест апроксимованої ентропії для шаблонів довжини length та length + 1.
+    # Рекомендацію NIST m < log2(n) - 5 враховує лише довжина за замовчуванням
+    # (default_pattern_lengths): приклад стандарту використовує m = 2 для n = 100
+    if length < 1 or length > 24 or 1 << (length + 1) > n_bits:
+        return {'error': 'Довжина шаблону має бути від 1 до min(24, log2(n) - 1)'}
+    counts = _pattern_counts(packed, n_bits, length + 1)
+    phi = []
+    for _ in range(2):
+        frequencies = counts[counts > 0] / n_bits
+        phi.append(float((frequencies * np.log(frequencies)).sum()))
+        counts = _fold_counts(counts)
+    entropy = phi[1] - phi[0]
+    chi_square = 2 * n_bits * (math.log(2) - entropy)
+    return {
+        'pattern_length': length,
+        'approximate_entropy': entropy,
+        'chi_square': chi_square,
+        'p_value': igamc(2 ** (length - 1), chi_square / 2)
+    }
+
+
+def _cusum_p_value(z: int, n_bits: int) -> float:
+    # p-значення тесту кумулятивних сум (межі сум як у еталонній реалізації NIST)
+    if z == 0:
+        return 1.0
+    root = math.sqrt(n_bits)
+    phi = lambda x: 0.5 * math.erfc(-x / math.sqrt(2))
+    ratio = n_bits // z
+    total = 1.0
+    for k in range(math.trunc((-ratio + 1) / 4), math.trunc((ratio - 1) / 4) + 1):
+        total -= phi((4 * k + 1) * z / root) - phi((4 * k - 1) * z / root)
+    for k in range(math.trunc((-ratio - 3) / 4), math.trunc((ratio - 1) / 4) + 1):
+        total += phi((4 * k + 3) * z / root) - phi((4 * k + 1) * z / root)
+    return min(1.0, max(0.0, total))
+
+
+def _byte_walk_tables():
+    # Для кожного байта (біти від старшого): зміна суми за байт та мінімум/максимум
+    # часткових сум після 1..8 кроків випадкового блукання +-1
+    steps = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).astype(np.int64) * 2 - 1
+    prefix = np.cumsum(steps, axis=1)
+    return prefix[:, -1], prefix.min(axis=1), prefix.max(axis=1)
+
+
+BYTE_WALK_DELTA, BYTE_WALK_MIN, BYTE_WALK_MAX = _byte_walk_tables()
+
+
+def cumulative_sums_test(packed: np.ndarray, n_bits: int) -> Dict[str, Any]:
+    # Тест кумулятивних сум у прямому та зворотному напрямках.
+    # Зворотні суми виражаються через прямі: S'_k = S_n - S_{n-k}, тому достатньо
+    # одного проходу з екстремумами S_1..S_n (прямий) та S_0..S_{n-1} (зворотний).
+    # Усі байти, крім останнього, обробляються таблицями екстремумів усередині байта
+    if n_bits < 100:
+        return {'error': 'Потрібно щонайменше 100 біт'}
+    offset = 0
+    low = high = 0
+    full_bytes = (n_bits - 1) // 8
+    chunk_bytes = BATTERY_CHUNK_BITS // 8
+    for first in range(0, full_bytes, chunk_bytes):
+        data = packed[first:min(first + chunk_bytes, full_bytes)]
+        deltas = BYTE_WALK_DELTA[data]
+        before = np.cumsum(deltas) - deltas + offset
+        low = min(low, int((before + BYTE_WALK_MIN[data]).min()))
+        high = max(high, int((before + BYTE_WALK_MAX[data]).max()))
+        offset += int(deltas.sum())
+
+    # Останній (можливо неповний) байт: S_n входить лише до прямих сум
+    last = np.unpackbits(packed[full_bytes:full_bytes + 1], count=n_bits - full_bytes * 8)
+    sums = np.cumsum(last.astype(np.int64) * 2 - 1) + offset
+    total = int(sums[-1])
+    backward_min = min(low, offset, int(sums[:-1].min(initial=offset)))
+    backward_max = max(high, offset, int(sums[:-1].max(initial=offset)))
+    # S_0 = 0 не змінює max(|min|, |max|), тому прямі екстремуми - це зворотні разом із S_n
+    forward_min, forward_max = min(backward_min, total), max(backward_max, total)
+
+    forward_z = max(abs(forward_min), abs(forward_max))
+    backward_z = max(abs(total - backward_min), abs(total - backward_max))
+    p_values = [_cusum_p_value(forward_z, n_bits), _cusum_p_value(backward_z, n_bits)]
+    return {
+        'forward_z': forward_z,
+        'backward_z': backward_z,
+        'p_values': p_values,
+        'p_value': min(p_values)
+    }
+
+
+def dft_test(packed: np.ndarray, n_bits: int) -> Dict[str, Any]:
+    # Спектральний тест (дискретне перетворення Фур'є) на перших DFT_MAX_BITS бітах
+    n = min(n_bits, DFT_MAX_BITS)
+    if n < 1000:
+        return {'error': 'Потрібно щонайменше 1000 біт'}
+    signal = np.unpackbits(packed[:(n + 7) // 8], count=n).astype(np.float64) * 2 - 1
+    modulus = np.abs(np.fft.rfft(signal)[:n // 2])
+    threshold = math.sqrt(math.log(1 / 0.05) * n)
+    expected = 0.95 * n / 2
+    observed = int(np.count_nonzero(modulus < threshold))
+    d = (observed - expected) / math.sqrt(n * 0.95 * 0.05 / 4)
+    return {
+        'bits_used': n,
+        'peaks_below_threshold': observed,
+        'expected_peaks': expected,
+        'p_value': math.erfc(abs(d) / math.sqrt(2))
+    }
+
+
+BATTERY_TESTS = {
+    'monobit': monobit_test,
+    'block_frequency': block_frequency_test,
+    'runs': runs_test,
+    'longest_run': longest_run_test,
+    'serial': serial_test,
+    'approximate_entropy': approximate_entropy_test,
+    'cumulative_sums': cumulative_sums_test,
+    'dft': dft_test,
+}
+
+
+def _run_test(name: str, path: str, n_bits: int, params: Dict[str, Any]) -> Dict[str, Any]:
+    # Виконання одного тесту над бітами з файлу (функція модуля - для пулу процесів)
+    start_time = time.perf_counter()
+    packed = np.memmap(path, dtype=np.uint8, mode='r', shape=((n_bits + 7) // 8,))
+    result = BATTERY_TESTS[name](packed, n_bits, **params)
+    del packed
+    result['time_ms'] = (time.perf_counter() - start_time) * 1000
+    if 'p_value' in result:
+        result['is_random'] = result['p_value'] >= SIGNIFICANCE_LEVEL
+    return result
+
+
+def write_bits(generator: LinearCongruentialGenerator, n_bits: int, bit_length: int,
+               output: np.ndarray) -> int:
+    # Запис n_bits біт послідовності (по bit_length молодших біт кожного числа,
+    # від старшого до молодшого) у впакований масив output; повертає кількість чисел
+    count = -(-n_bits // bit_length)
+    shifts = np.arange(bit_length - 1, -1, -1, dtype=np.uint64)
+    carry = np.empty(0, dtype=np.uint8)
+    position = 0
+    written = 0
+    for block in generator.generate_blocks(count):
+        if block.dtype == object:
+            raise ValueError('Батарея тестів підтримує модуль до 2^64')
+        bits = ((block.astype(np.uint64)[:, None] >> shifts) & np.uint64(1)).astype(np.uint8).ravel()
+        bits = np.concatenate([carry, bits[:n_bits - written - len(carry)]])
+        complete = len(bits) // 8 * 8
+        packed = np.packbits(bits[:complete])
+        output[position:position + len(packed)] = packed
+        position += len(packed)
+        written += complete
+        carry = bits[complete:]
+    if len(carry):
+        output[position] = np.packbits(carry)[0]
+    return count
+
+
+class RandomnessBattery:
+    # Паралельний запуск батареї тестів над однією послідовністю бітів
+
+    @staticmethod
+    def run(generator: LinearCongruentialGenerator, n_bits: int = 1000000,
+            bit_length: Optional[int] = None, tests: Optional[List[str]] = None,
+            workers: int = 1, block_size: int = 128, serial_length: Optional[int] = None,
+            entropy_length: Optional[int] = None) -> Dict[str, Any]:
+        #generator: генератор, з поточного стану якого береться послідовність
+        #n_bits: кількість бітів для тестування
+        #bit_length: скільки молодших бітів брати з кожного числа (None - (m-1).bit_length())
+        #tests: назви тестів з BATTERY_TESTS (None - усі)
+        #workers: кількість процесів
+        #serial_length, entropy_length: довжини шаблонів (None - залежно від n_bits)
+        names = list(BATTERY_TESTS) if tests is None else list(tests)
+        unknown = [name for name in names if name not in BATTERY_TESTS]
+        if unknown:
+            raise ValueError(f"Невідомі тести: {', '.join(unknown)}")
+        if n_bits < 1:
+            raise ValueError('Кількість бітів має бути додатною')
+        bit_length = bit_length or max(1, (generator.m - 1).bit_length())
+        if not 1 <= bit_length <= 64:
+            raise ValueError('Кількість бітів числа має бути від 1 до 64')
+
+        lengths = default_pattern_lengths(n_bits)
+        if serial_length is None:
+            serial_length = lengths['serial']
+        if entropy_length is None:
+            entropy_length = lengths['approximate_entropy']
+
+        params = {
+            'block_frequency': {'block_size': block_size},
+            'serial': {'length': serial_length},
+            'approximate_entropy': {'length': entropy_length},
+        }
+
+        descriptor, path = tempfile.mkstemp(prefix='lcg_bits_', suffix='.bin')
+        os.close(descriptor)
+        try:
+            start_time = time.perf_counter()
+            packed = np.memmap(path, dtype=np.uint8, mode='w+', shape=((n_bits + 7) // 8,))
+            numbers = write_bits(generator, n_bits, bit_length, packed)
+            packed.flush()
+            del packed
+            generation_ms = (time.perf_counter() - start_time) * 1000
+
+            jobs = [(name, path, n_bits, params.get(name, {})) for name in names]
+            if workers > 1 and len(jobs) > 1:
+                with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+                    futures = [executor.submit(_run_test, *job) for job in jobs]
+                    results = [future.result() for future in futures]
+            else:
+                results = [_run_test(*job) for job in jobs]
+        finally:
+            os.unlink(path)
+
+        return {
+            'n_bits': n_bits,
+            'numbers_used': numbers,
+            'bit_length': bit_length,
+            'generation_time_ms': generation_ms,
+            'tests': dict(zip(names, results))
+        }
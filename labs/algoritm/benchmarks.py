@@ -0,0 +1,239 @@
+"""
+Вимірювання продуктивності алгоритмів лабораторних робіт
+Запуск: python -m labs.algoritm.benchmarks [назва]
+"""
+import hashlib
+import math
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, Any, Callable
+
+from .Config.config import CONFIG_LR1
+from .LR1 import LinearCongruentialGenerator
+from .battery import RandomnessBattery
+from .LR2 import MD5
+
+
+def _measure(func: Callable[[], Any], repeat: int = 3) -> float:
+    # Найкращий час виконання func (секунди) з repeat запусків
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_generation(count: int = 2000000, config: Dict[str, int] = CONFIG_LR1) -> Dict[str, Any]:
+    # Порівняння скалярної генерації (next()) з блоковою (generate_array)
+    def scalar():
+        generator = LinearCongruentialGenerator(**config)
+        for _ in range(count):
+            generator.next()
+
+    def vectorized():
+        LinearCongruentialGenerator(**config).generate_array(count)
+
+    scalar_time = _measure(scalar, repeat=1)
+    vector_time = _measure(vectorized)
+
+    return {
+        'count': count,
+        'scalar_values_per_s': count / scalar_time,
+        'vectorized_values_per_s': count / vector_time,
+        'speedup': scalar_time / vector_time
+    }
+
+
+def benchmark_period(config: Dict[str, int] = CONFIG_LR1,
+                     max_iterations: int = 100000000) -> Dict[str, Any]:
+    # Порівняння пошуку періоду словником ('dict') та алгоритмом Брента ('brent'):
+    # час виконання і пікове використання пам'яті (tracemalloc, окремий запуск,
+    # бо трасування алокацій спотворює час)
+    result = {}
+    for method in ('dict', 'brent'):
+        generator = LinearCongruentialGenerator(**config)
+        start = time.perf_counter()
+        period, found = generator.find_period(max_iterations, method=method)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        LinearCongruentialGenerator(**config).find_period(max_iterations, method=method)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        result[f'{method}_period'] = period
+        result[f'{method}_found'] = found
+        result[f'{method}_time_ms'] = elapsed * 1000
+        result[f'{method}_peak_memory_kb'] = peak / 1024
+    return result
+
+
+# Модулі для статистики: більше SPARSE_COUNT_LIMIT різних значень - шлях HeavyHitters
+STATISTICS_CASES = (
+    ('pow2 2^32', 2 ** 32, 1664525, 1013904223),
+    ('mersenne 2^31-1', 2 ** 31 - 1, 48271, 0),
+)
+
+
+def benchmark_statistics(count: int = 10000000) -> Dict[str, Any]:
+    # Потокова статистика (generate_statistics, get_statistics над масивом) проти
+    # початкової get_statistics: словник частот і set над списком Python
+    result = {}
+    for name, m, a, c in STATISTICS_CASES:
+        def baseline():
+            sequence = LinearCongruentialGenerator(m, a, c, 1, history_size=0).generate_sequence(count)
+            mean = sum(sequence) / count
+            variance = sum((x - mean) ** 2 for x in sequence) / count
+            math.sqrt(variance)
+            frequency = {}
+            for num in sequence:
+                frequency[num] = frequency.get(num, 0) + 1
+            min(sequence), max(sequence), len(set(sequence))
+            dict(sorted(frequency.items(), key=lambda x: x[1], reverse=True)[:10])
+
+        def streamed():
+            LinearCongruentialGenerator(m, a, c, 1, history_size=0).generate_statistics(count)
+
+        def from_array():
+            generator = LinearCongruentialGenerator(m, a, c, 1, history_size=0)
+            generator.get_statistics(generator.generate_array(count))
+
+        baseline_time = _measure(baseline, repeat=1)
+        streamed_time = _measure(streamed, repeat=1)
+        array_time = _measure(from_array, repeat=1)
+        result[f'{name} baseline_time_ms'] = baseline_time * 1000
+        result[f'{name} generate_statistics_time_ms'] = streamed_time * 1000
+        result[f'{name} get_statistics_time_ms'] = array_time * 1000
+        result[f'{name} speedup'] = baseline_time / streamed_time
+    return result
+
+
+# Представники класів модулів: (назва, m, a, c)
+MODULUS_CLASS_CASES = (
+    ('pow2 2^32', 2 ** 32, 1664525, 1013904223),
+    ('pow2 2^64', 2 ** 64, 6364136223846793005, 1442695040888963407),
+    ('mersenne 2^26-1', CONFIG_LR1['m'], CONFIG_LR1['a'], CONFIG_LR1['c']),
+    ('mersenne 2^31-1', 2 ** 31 - 1, 48271, 0),
+    ('mersenne 2^521-1', 2 ** 521 - 1, 3 ** 300, 12345),
+    ('generic 10^9+7', 10 ** 9 + 7, 48271, 12345),
+)
+
+
+def benchmark_modulus_classes(count: int = 2000000, scalar_count: int = 300000) -> Dict[str, Any]:
+    # Виграш спеціалізованих ядер (маска, згортання Мерсенна) відносно загального
+    # зведення % для скалярного next() і блокової генерації.
+    # Для m = 2^64 загальне ядро не векторизується - порівнюється зі скалярним циклом
+    result = {}
+    for name, m, a, c in MODULUS_CLASS_CASES:
+        def scalar(kernel):
+            generator = LinearCongruentialGenerator(m, a, c, 1, history_size=0)
+            if kernel == 'generic':
+                generator._select_kernels('generic', 0)
+            for _ in range(scalar_count):
+                generator.next()
+
+        def vectorized(kernel):
+            generator = LinearCongruentialGenerator(m, a, c, 1, history_size=0)
+            if kernel == 'generic':
+                generator._select_kernels('generic', 0)
+            size = count if generator._vectorizable() else scalar_count
+            return lambda: generator.generate_array(size), size
+
+        generic_scalar = _measure(lambda: scalar('generic'), repeat=1)
+        special_scalar = _measure(lambda: scalar('special'), repeat=1)
+        (generic_run, generic_size), (special_run, special_size) = vectorized('generic'), vectorized('special')
+        generic_vector = _measure(generic_run) / generic_size
+        special_vector = _measure(special_run) / special_size
+
+        result[f'{name} scalar_speedup'] = generic_scalar / special_scalar
+        result[f'{name} vectorized_values_per_s'] = 1 / special_vector
+        result[f'{name} vectorized_speedup'] = generic_vector / special_vector
+    return result
+
+
+def benchmark_battery(n_bits: int = 100000000, config: Dict[str, int] = CONFIG_LR1,
+                      workers: int = 1) -> Dict[str, Any]:
+    # Час генерації бітів і кожного тесту батареї NIST SP 800-22
+    start = time.perf_counter()
+    battery = RandomnessBattery.run(LinearCongruentialGenerator(**config), n_bits, workers=workers)
+    result = {
+        'n_bits': n_bits,
+        'total_time_ms': (time.perf_counter() - start) * 1000,
+        'generation_time_ms': battery['generation_time_ms'],
+    }
+    for name, test in battery['tests'].items():
+        result[f'{name}_time_ms'] = test['time_ms']
+    return result
+
+
+def benchmark_md5(size: int = 1 << 20) -> Dict[str, Any]:
+    # Пропускна здатність MD5 (МБ/с): еталонна і оптимізована функції стиснення,
+    # повний інкрементний об'єкт і hashlib.md5 як верхня межа
+    data = random.Random(0).randbytes(size)
+    view = memoryview(data)
+
+    def compress(process):
+        def run():
+            state = (MD5.INIT_A, MD5.INIT_B, MD5.INIT_C, MD5.INIT_D)
+            for offset in range(0, size - 63, 64):
+                state = process(view[offset:offset + 64], *state)
+        return run
+
+    reference_time = _measure(compress(MD5._process_block_reference), repeat=1)
+    optimized_time = _measure(compress(MD5._process_block))
+    update_time = _measure(lambda: MD5(data).digest())
+    hashlib_time = _measure(lambda: hashlib.md5(data).digest())
+
+    megabytes = size / (1 << 20)
+    return {
+        'size_bytes': size,
+        'reference_mb_per_s': megabytes / reference_time,
+        'optimized_mb_per_s': megabytes / optimized_time,
+        'update_mb_per_s': megabytes / update_time,
+        'hashlib_mb_per_s': megabytes / hashlib_time,
+        'speedup': reference_time / optimized_time
+    }
+
+
+def benchmark_md5_many(count: int = 200000, length: int = 24, scalar_count: int = 5000) -> Dict[str, Any]:
+    # Хешування багатьох коротких повідомлень: hash_many проти hash_bytes у циклі
+    rng = random.Random(0)
+    messages = [rng.randbytes(length) for _ in range(count)]
+
+    batch_time = _measure(lambda: MD5.hash_many(messages), repeat=1)
+    scalar_time = _measure(lambda: [MD5.hash_bytes(message) for message in messages[:scalar_count]], repeat=1)
+
+    return {
+        'count': count,
+        'message_length': length,
+        'batched_messages_per_s': count / batch_time,
+        'scalar_messages_per_s': scalar_count / scalar_time,
+        'speedup': (scalar_time / scalar_count) / (batch_time / count)
+    }
+
+
+BENCHMARKS = {
+    'generation': benchmark_generation,
+    'period': benchmark_period,
+    'statistics': benchmark_statistics,
+    'battery': benchmark_battery,
+    'modulus': benchmark_modulus_classes,
+    'md5': benchmark_md5,
+    'md5_many': benchmark_md5_many,
+}
+
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or list(BENCHMARKS)
+    for name in names:
+        result = BENCHMARKS[name]()
+        print(f"[{name}]")
+        for key, value in result.items():
+            print(f"  {key}: {value:,.2f}" if isinstance(value, float) else f"  {key}: {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Зменшення кількості точок графіків на сервері
+Лабораторна робота №1 - Варіант 17
+
+Методи:
+- 'lttb'   - Largest-Triangle-Three-Buckets: з кожного кошика береться точка, що утворює
+             найбільший трикутник з попередньою обраною точкою і середнім наступного кошика
+             (зберігає форму кривої, наприклад збіжність оцінки Pi);
+- 'minmax' - мінімум і максимум кожного кошика (зберігає розмах шуму, наприклад послідовності ЛКГ).
+Перша й остання точки завжди зберігаються; результат містить не більше max_points точок
+"""
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+DOWNSAMPLING_METHODS = ('lttb', 'minmax')
+
+# Найменша кількість точок (перша, остання і мінімум з максимумом хоча б одного кошика)
+MIN_POINTS = 4
+
+
+def lttb_indices(y: np.ndarray, max_points: int, x: Optional[np.ndarray] = None) -> np.ndarray:
+    # Індекси точок, обраних LTTB. x = None - абсциси дорівнюють індексам (без створення масиву)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    def xs(lo, hi):
+        return np.arange(lo, hi, dtype=np.float64) if x is None else x[lo:hi].astype(np.float64)
+
+    def x_at(index):
+        return float(index if x is None else x[index])
+
+    # Внутрішні точки 1..n-2 діляться на max_points - 2 непорожніх кошиків
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        # Третя вершина - середня точка наступного кошика (для останнього - остання точка)
+        if bucket + 2 < len(edges):
+            next_lo, next_hi = edges[bucket + 1], edges[bucket + 2]
+            next_x = float(xs(next_lo, next_hi).mean())
+            next_y = float(y[next_lo:next_hi].astype(np.float64).mean())
+        else:
+            next_x, next_y = x_at(n - 1), float(y[n - 1])
+        prev_x, prev_y = x_at(previous), float(y[previous])
+        # Подвоєна площа трикутника (множник 1/2 не впливає на вибір)
+        area = np.abs((prev_x - next_x) * (y[lo:hi].astype(np.float64) - prev_y) -
+                      (prev_x - xs(lo, hi)) * (next_y - prev_y))
+        previous = lo + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def minmax_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    # Індекси мінімуму і максимуму кожного з (max_points - 2) / 2 кошиків внутрішніх точок
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    inner = y[1:n - 1]
+    size = -(-len(inner) // ((max_points - 2) // 2))
+    full = len(inner) // size * size
+    # Рівні кошики - одним reshape, неповний залишок - окремо
+    blocks = inner[:full].reshape(-1, size)
+    offsets = np.arange(0, full, size)
+    picks = [offsets + np.argmin(blocks, axis=1), offsets + np.argmax(blocks, axis=1)]
+    if full < len(inner):
+        rest = inner[full:]
+        picks.append(np.array([full + int(np.argmin(rest)), full + int(np.argmax(rest))]))
+    indices = np.unique(np.concatenate(picks)) + 1
+    return np.concatenate(([0], indices, [n - 1]))
+
+
+def downsample(y: np.ndarray, max_points: int, x: Optional[np.ndarray] = None,
+               method: str = 'lttb') -> Dict[str, Any]:
+    # Ряд для графіка: {'x', 'y', 'total', 'method'}; x - абсциси обраних точок (індекси, якщо x = None)
+    if method not in DOWNSAMPLING_METHODS:
+        raise ValueError(f"Невідомий метод зменшення: {method}")
+    if max_points < MIN_POINTS:
+        raise ValueError(f'Кількість точок графіка повинна бути не менше {MIN_POINTS}')
+    y = np.asarray(y)
+    if method == 'lttb':
+        indices = lttb_indices(y, max_points, x)
+    else:
+        indices = minmax_indices(y, max_points)
+    return {
+        'x': indices if x is None else np.asarray(x)[indices],
+        'y': y[indices],
+        'total': len(y),
+        'method': method
+    }
@@ -0,0 +1,235 @@
+"""
+Хешування дерева каталогів MD5 і маніфести у форматі md5sum
+Лабораторна робота №2
+
+Файли розподіляються між процесами пулу: великі файли хешуються потоково
+(MD5.hash_file), дрібні - пакетами через MD5.hash_many. Маніфест сумісний
+з `md5sum` / `md5sum -c`: рядок "<хеш у нижньому регістрі>  <шлях>", шляхи
+відносні до кореня, роздільник '/'
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from .LR2 import MD5
+
+# Файли, менші за цей розмір (байти), хешуються пакетами
+SMALL_FILE_SIZE = 1 << 16
+
+# Сумарний розмір одного пакета дрібних файлів (байти)
+BATCH_BYTES = 1 << 22
+
+# Розмір частини читання великих файлів (байти)
+FILE_CHUNK_SIZE = 1 << 20
+
+# (відносний шлях, абсолютний шлях, розмір або None, якщо файл недоступний)
+FileItem = Tuple[str, str, Optional[int]]
+
+
+def _hash_large(item: FileItem) -> List[Dict[str, Any]]:
+    # Потокове хешування одного великого файлу (функція модуля - для пулу процесів)
+    relative, path, size = item
+    start = time.perf_counter()
+    entry = {'path': relative, 'size': size, 'md5': None, 'batched': False, 'time_shared': False}
+    try:
+        entry['md5'] = MD5.hash_file(filepath=path, chunk_size=FILE_CHUNK_SIZE).lower()
+    except OSError as e:
+        entry['error'] = str(e)
+    entry['time_ms'] = (time.perf_counter() - start) * 1000
+    return [entry]
+
+
+def _hash_small(items: List[FileItem]) -> List[Dict[str, Any]]:
+    # Пакет дрібних файлів: читання повністю і одночасне хешування hash_many.
+    # Окремого часу файлу в пакеті немає: time_ms - рівна частка часу пакета (time_shared = True)
+    start = time.perf_counter()
+    entries, contents = [], []
+    for relative, path, size in items:
+        entry = {'path': relative, 'size': size, 'md5': None, 'batched': True, 'time_shared': True}
+        try:
+            with open(path, 'rb') as file:
+                contents.append(file.read())
+            entries.append(entry)
+        except OSError as e:
+            entry['error'] = str(e)
+            entries.append(entry)
+    readable = [entry for entry in entries if 'error' not in entry]
+    for entry, digest in zip(readable, MD5.hash_many(contents)):
+        entry['md5'] = digest.lower()
+    share = (time.perf_counter() - start) * 1000 / max(1, len(entries))
+    for entry in entries:
+        entry['time_ms'] = share
+    return entries
+
+
+def _hash_items(items: List[FileItem], workers: int = 1, small_file_size: int = SMALL_FILE_SIZE,
+                batch_bytes: int = BATCH_BYTES) -> Tuple[List[Dict[str, Any]], float]:
+    # Хешування списку файлів; повертає (записи в порядку items, час у секундах).
+    # Кожен шлях хешується один раз, навіть якщо повторюється в items
+    start = time.perf_counter()
+    unique = list({item[0]: item for item in items}.values())
+    missing = [item for item in unique if item[2] is None]
+    large = sorted((item for item in unique if item[2] is not None and item[2] >= small_file_size),
+                   key=lambda item: -item[2])
+    small = [item for item in unique if item[2] is not None and item[2] < small_file_size]
+
+    # Завдання: найбільші файли першими (рівномірніше завантаження пулу), далі пакети дрібних
+    jobs = [(_hash_large, item) for item in large]
+    batch, batch_size = [], 0
+    for item in small:
+        batch.append(item)
+        batch_size += item[2]
+        if batch_size >= batch_bytes:
+            jobs.append((_hash_small, batch))
+            batch, batch_size = [], 0
+    if batch:
+        jobs.append((_hash_small, batch))
+
+    results = {}
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            futures = [executor.submit(func, argument) for func, argument in jobs]
+            for future in as_completed(futures):
+                for entry in future.result():
+                    results[entry['path']] = entry
+    else:
+        for func, argument in jobs:
+            for entry in func(argument):
+                results[entry['path']] = entry
+    for relative, _, _ in missing:
+        # Лише відносний шлях: абсолютний розкривав би розташування кореня
+        results[relative] = {'path': relative, 'size': None, 'md5': None, 'batched': False,
+                             'time_shared': False, 'time_ms': 0.0, 'error': f'Файл не знайдено: {relative}'}
+
+    # Копії записів: шлях може повторюватися в маніфесті
+    return [dict(results[item[0]]) for item in items], time.perf_counter() - start
+
+
+def _summary(entries: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    total_bytes = sum(entry['size'] or 0 for entry in entries if entry['md5'] is not None)
+    return {
+        'file_count': len(entries),
+        'total_bytes': total_bytes,
+        'elapsed_ms': elapsed * 1000,
+        'mb_per_s': total_bytes / (1 << 20) / elapsed if elapsed > 0 else 0.0,
+        'files_per_s': len(entries) / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def walk_tree(root: str, exclude: Iterable[str] = ()) -> List[FileItem]:
+    # Звичайні файли дерева (без символьних посилань) у детермінованому порядку
+    exclude = {os.path.abspath(path) for path in exclude}
+    items = []
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(filenames):
+            path = os.path.join(directory, name)
+            if os.path.abspath(path) in exclude or os.path.islink(path) or not os.path.isfile(path):
+                continue
+            relative = os.path.relpath(path, root).replace(os.sep, '/')
+            items.append((relative, path, os.path.getsize(path)))
+    return items
+
+
+def hash_tree(root: str, workers: int = 1, small_file_size: int = SMALL_FILE_SIZE,
+              batch_bytes: int = BATCH_BYTES, exclude: Iterable[str] = ()) -> Dict[str, Any]:
+    # Хеші всіх файлів дерева: записи {'path', 'size', 'md5', 'batched', 'time_shared', 'time_ms'[, 'error']}
+    # і підсумок (кількість, байти, час, МБ/с)
+    if not os.path.isdir(root):
+        raise ValueError(f'Каталог не знайдено: {root}')
+    entries, elapsed = _hash_items(walk_tree(root, exclude), workers, small_file_size, batch_bytes)
+    result = _summary(entries, elapsed)
+    result.update({
+        'root': os.path.abspath(root),
+        'files': entries,
+        'errors': sum('error' in entry for entry in entries)
+    })
+    return result
+
+
+def escape_path(path: str) -> Tuple[str, str]:
+    # Екранування шляху як у GNU md5sum: (префікс рядка, шлях)
+    if '\\' in path or '\n' in path or '\r' in path:
+        return '\\', path.replace('\\', '\\\\').replace('\n', '\\n').replace('\r', '\\r')
+    return '', path
+
+
+def _unescape(path: str) -> str:
+    result, index = [], 0
+    while index < len(path):
+        if path[index] == '\\' and index + 1 < len(path):
+            result.append({'\\': '\\', 'n': '\n', 'r': '\r'}.get(path[index + 1], path[index + 1]))
+            index += 2
+        else:
+            result.append(path[index])
+            index += 1
+    return ''.join(result)
+
+
+def format_manifest(entries: List[Dict[str, Any]]) -> str:
+    # Маніфест md5sum для записів hash_tree (файли з помилками пропускаються)
+    lines = []
+    for entry in entries:
+        if entry['md5'] is None:
+            continue
+        prefix, path = escape_path(entry['path'])
+        lines.append(f"{prefix}{entry['md5']}  {path}\n")
+    return ''.join(lines)
+
+
+def parse_manifest(text: str) -> Tuple[List[Tuple[str, str]], int]:
+    # Рядки маніфесту md5sum (текстовий "  " і двійковий " *" режими):
+    # ([(хеш, шлях)], кількість некоректних рядків)
+    entries, malformed = [], 0
+    # Лише '\n' розділяє рядки (splitlines розбив би імена з іншими керуючими символами)
+    for line in text.split('\n'):
+        line = line[:-1] if line.endswith('\r') else line
+        if not line.strip():
+            continue
+        escaped = line.startswith('\\')
+        if escaped:
+            line = line[1:]
+        digest, separator, path = line[:32], line[32:34], line[34:]
+        if len(digest) != 32 or separator not in ('  ', ' *') or not path or \
+                any(char not in '0123456789abcdefABCDEF' for char in digest):
+            malformed += 1
+            continue
+        entries.append((digest.lower(), _unescape(path) if escaped else path))
+    return entries, malformed
+
+
+def verify_manifest(root: str, text: str, workers: int = 1, small_file_size: int = SMALL_FILE_SIZE,
+                    batch_bytes: int = BATCH_BYTES, confined: bool = False) -> Dict[str, Any]:
+    # Перевірка дерева за маніфестом (аналог md5sum -c): статус кожного файлу
+    # 'OK', 'FAILED' (хеш не збігається) або 'MISSING' (файл недоступний).
+    # confined: шляхи поза root (абсолютні, '..', символьні посилання) вважаються недоступними
+    listed, malformed = parse_manifest(text)
+    real_root = os.path.realpath(root)
+    items = []
+    for _, relative in listed:
+        path = relative if os.path.isabs(relative) else os.path.join(root, *relative.split('/'))
+        available = os.path.isfile(path)
+        if confined and available:
+            available = os.path.commonpath([real_root, os.path.realpath(path)]) == real_root
+        items.append((relative, path, os.path.getsize(path) if available else None))
+
+    entries, elapsed = _hash_items(items, workers, small_file_size, batch_bytes)
+    for (expected, _), entry in zip(listed, entries):
+        entry['expected'] = expected
+        if entry['md5'] is None:
+            entry['status'] = 'MISSING'
+        else:
+            entry['status'] = 'OK' if entry['md5'] == expected else 'FAILED'
+
+    result = _summary(entries, elapsed)
+    result.update({
+        'root': os.path.abspath(root),
+        'files': entries,
+        'ok': sum(entry['status'] == 'OK' for entry in entries),
+        'failed': sum(entry['status'] == 'FAILED' for entry in entries),
+        'missing': sum(entry['status'] == 'MISSING' for entry in entries),
+        'malformed': malformed
+    })
+    result['match'] = result['ok'] == len(entries) and malformed == 0
+    return result
@@ -0,0 +1,311 @@
+"""
+Паралельний пошук параметрів (a, c) ЛКГ для заданого модуля
+Лабораторна робота №1 - Варіант 17
+
+Кандидати оцінюються в три етапи, від дешевого до дорогого:
+1) період (умови Халла-Добелла / мультиплікативний порядок через analytic_period);
+2) спектральний тест (мінімальна нормована оцінка у розмірностях 2..max_dimension);
+3) швидка батарея емпіричних тестів.
+Кандидат, який уже не може потрапити до таблиці лідерів, відсікається
+на ранньому етапі. Прогрес зберігається в контрольній точці (JSON у тимчасовому
+каталозі), тож перерваний пошук продовжується з того самого місця; після
+завершення пошуку контрольна точка видаляється
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from .LR1 import (
+    ANALYTIC_MAX_BITS,
+    FactorizationLimitError,
+    LinearCongruentialGenerator,
+    SpectralTest,
+    _phi_factors,
+    _StepBudget,
+    analytic_period,
+    factorize,
+    max_possible_period,
+    validate_parameters
+)
+from .battery import RandomnessBattery
+
+# Тести швидкої емпіричної перевірки кандидатів
+SEARCH_BATTERY_TESTS = ('monobit', 'block_frequency', 'runs', 'longest_run',
+                        'cumulative_sums', 'approximate_entropy')
+
+# Точність, з якою порівнюються спектральні оцінки (рівні оцінки розрізняє батарея)
+FIGURE_PRECISION = 3
+
+# Ліміт кроків розкладу на множники для одного кандидата (див. analytic_period)
+MAX_FACTOR_STEPS = 1000000
+
+# Як часто (секунди) записується контрольна точка
+CHECKPOINT_INTERVAL = 5.0
+
+
+@lru_cache(maxsize=4096)
+def _spectral(m: int, a: int, max_dimension: int) -> Tuple[float, int]:
+    # Спектральна оцінка залежить лише від (m, a): кешується в кожному процесі
+    result = SpectralTest.test_parameters(m, a, max_dimension)
+    return result['min_figure_of_merit'], result['worst_dimension']
+
+
+def rank_key(entry: Dict[str, Any]) -> Tuple:
+    # Порядок таблиці лідерів: повний період, спектральна оцінка, результат батареї
+    battery = entry.get('battery') or {}
+    return (entry['full_period'], round(entry.get('figure_of_merit') or 0.0, FIGURE_PRECISION),
+            battery.get('passed', 0), battery.get('min_p_value', 0.0))
+
+
+def _evaluate_batch(m: int, x0: int, candidates: List[Tuple[int, int, int]], options: Dict[str, Any],
+                    threshold: Optional[Tuple[bool, float]]) -> List[Dict[str, Any]]:
+    # Оцінка частини кандидатів (функція модуля - для пулу процесів).
+    # threshold: (повний період, оцінка) останнього місця таблиці лідерів або None
+    results = []
+    for index, a, c in candidates:
+        try:
+            period, tail = analytic_period(m, a, c, x0, options['max_factor_steps'])
+        except FactorizationLimitError:
+            # Період невідомий - кандидат відсікається на першому етапі
+            period, tail = None, None
+        entry = {
+            'index': index,
+            'a': a,
+            'c': c,
+            'period': period,
+            'tail_length': tail,
+            'full_period': period is not None and period == max_possible_period(m, c),
+            'figure_of_merit': None,
+            'worst_dimension': None,
+            'battery': None,
+            'pruned': None
+        }
+        results.append(entry)
+
+        # Етап 1: період
+        if period is None or options['require_full_period'] and not entry['full_period']:
+            entry['pruned'] = 'period'
+            continue
+
+        # Етап 2: спектральний тест
+        figure, dimension = _spectral(m, a, options['max_dimension'])
+        entry['figure_of_merit'], entry['worst_dimension'] = figure, dimension
+        rounded = round(figure, FIGURE_PRECISION)
+        if figure < options['min_figure_of_merit'] or \
+                (threshold is not None and (entry['full_period'], rounded) < tuple(threshold)):
+            entry['pruned'] = 'spectral'
+            continue
+
+        # Етап 3: швидка батарея над початком послідовності
+        generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+        battery = RandomnessBattery.run(generator, options['battery_bits'], options['bit_length'],
+                                        tests=list(SEARCH_BATTERY_TESTS))
+        p_values = [test['p_value'] for test in battery['tests'].values() if 'p_value' in test]
+        entry['battery'] = {
+            'passed': sum(value >= 0.01 for value in p_values),
+            'total': len(p_values),
+            'min_p_value': min(p_values, default=0.0),
+            'p_values': {name: test.get('p_value') for name, test in battery['tests'].items()}
+        }
+    return results
+
+
+class ParameterSearch:
+    # Перебір множників a (та приростів c) з потоковою таблицею лідерів
+
+    def __init__(self, m: int, multipliers: range, increments: List[int], x0: int = 1,
+                 top: int = 10, max_dimension: int = 8, min_figure_of_merit: float = 0.0,
+                 require_full_period: bool = True, battery_bits: int = 1 << 16,
+                 bit_length: Optional[int] = None, workers: int = 1, batch_size: int = 16,
+                 checkpoint_dir: Optional[str] = None, max_factor_steps: int = MAX_FACTOR_STEPS):
+        #multipliers: діапазон множників a (range)
+        #increments: прирости c, що перебираються для кожного a
+        #top: розмір таблиці лідерів
+        #require_full_period: відсікати кандидатів без найбільшого можливого періоду
+        #battery_bits: кількість бітів швидкої батареї
+        #checkpoint_dir: каталог контрольних точок (None - системний тимчасовий)
+        #max_factor_steps: ліміт кроків розкладу m на множники
+        if len(multipliers) == 0 or not increments:
+            raise ValueError('Порожній набір кандидатів')
+        # Множники - арифметична прогресія: у [0, m) вона лежить, якщо там обидва її кінці
+        for a in (multipliers[0], multipliers[-1]):
+            for c in increments:
+                validate_parameters(m, a, c, x0, strict=True)
+        # Розклад m і p - 1 спільний для всіх кандидатів: якщо він не вкладається
+        # в ліміт, пошук відхиляється одразу, а не відсікає кожного кандидата окремо
+        if m.bit_length() > ANALYTIC_MAX_BITS:
+            raise FactorizationLimitError(f"Пошук параметрів підтримує модуль до 2^{ANALYTIC_MAX_BITS}")
+        budget = _StepBudget(max_factor_steps)
+        _phi_factors(factorize(m, budget), budget)
+        if top < 1:
+            raise ValueError('Розмір таблиці лідерів має бути додатним')
+
+        self.m = m
+        self.multipliers = multipliers
+        self.increments = list(increments)
+        self.x0 = x0
+        self.top = top
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.options = {
+            'max_dimension': max_dimension,
+            'min_figure_of_merit': min_figure_of_merit,
+            'require_full_period': require_full_period,
+            'battery_bits': battery_bits,
+            'bit_length': bit_length,
+            'max_factor_steps': max_factor_steps
+        }
+        self.total = len(multipliers) * len(self.increments)
+        self.checkpoint_path = os.path.join(checkpoint_dir or tempfile.gettempdir(),
+                                            f'lcg_search_{self._key()}.json')
+
+    def _key(self) -> str:
+        # Ключ контрольної точки: хеш усіх параметрів, що впливають на результат
+        description = json.dumps({
+            'm': self.m,
+            'multipliers': [self.multipliers.start, self.multipliers.stop, self.multipliers.step],
+            'increments': self.increments,
+            'x0': self.x0,
+            'top': self.top,
+            'options': self.options
+        }, sort_keys=True)
+        return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+    def candidate(self, index: int) -> Tuple[int, int, int]:
+        # (index, a, c) кандидата за його номером
+        a = self.multipliers[index // len(self.increments)]
+        return index, a, self.increments[index % len(self.increments)]
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_checkpoint(self, state: Dict[str, Any]):
+        # Атомарний запис: спочатку власний тимчасовий файл у тому ж каталозі, потім заміна.
+        # Унікальне ім'я (mkstemp) - паралельні пошуки з тим самим ключем не пишуть в один файл
+        directory, name = os.path.split(self.checkpoint_path)
+        descriptor, temporary = tempfile.mkstemp(prefix=name + '.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+                json.dump(state, file)
+            os.replace(temporary, self.checkpoint_path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def run(self, resume: bool = True) -> Iterator[Dict[str, Any]]:
+        # Генератор подій: 'start', 'progress' після кожної оціненої частини, 'done'.
+        # Кожна подія містить поточну таблицю лідерів
+        start_time = time.perf_counter()
+        state = self._load_checkpoint() if resume else {}
+        # watermark: усі кандидати з меншими номерами оброблені; completed - оброблені вище нього
+        watermark = state.get('watermark', 0)
+        completed = set(state.get('completed', []))
+        leaderboard = state.get('leaderboard', [])
+        processed = state.get('processed', 0)
+        pruned = state.get('pruned', {'period': 0, 'spectral': 0})
+
+        def snapshot():
+            return {
+                'watermark': watermark,
+                'completed': sorted(completed),
+                'leaderboard': leaderboard,
+                'processed': processed,
+                'pruned': pruned
+            }
+
+        def event(kind):
+            return {
+                'type': kind,
+                'processed': processed,
+                'total': self.total,
+                'pruned': pruned,
+                'leaderboard': leaderboard,
+                'elapsed_ms': (time.perf_counter() - start_time) * 1000
+            }
+
+        first = event('start')
+        first['resumed'] = processed > 0
+        first['checkpoint'] = self.checkpoint_path
+        yield first
+
+        def batches():
+            batch = []
+            for index in range(watermark, self.total):
+                if index not in completed:
+                    batch.append(self.candidate(index))
+                    if len(batch) == self.batch_size:
+                        yield batch
+                        batch = []
+            if batch:
+                yield batch
+
+        def threshold():
+            # Кандидат, гірший за останнє місце заповненої таблиці, відсікається
+            if len(leaderboard) < self.top:
+                return None
+            return rank_key(leaderboard[-1])[:2]
+
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        saved_at = time.perf_counter()
+        pending = set()
+        source = batches()
+        try:
+            while True:
+                # Не більше 2 * workers частин в обробці: поріг відсікання залишається свіжим
+                while len(pending) < 2 * self.workers:
+                    batch = next(source, None)
+                    if batch is None:
+                        break
+                    args = (self.m, self.x0, batch, self.options, threshold())
+                    if executor is None:
+                        # Без пулу частина обчислюється одразу в поточному процесі
+                        future = Future()
+                        future.set_result(_evaluate_batch(*args))
+                        pending.add(future)
+                    else:
+                        pending.add(executor.submit(_evaluate_batch, *args))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    for entry in future.result():
+                        processed += 1
+                        completed.add(entry['index'])
+                        if entry['pruned']:
+                            pruned[entry['pruned']] += 1
+                        else:
+                            leaderboard.append(entry)
+                    leaderboard.sort(key=rank_key, reverse=True)
+                    del leaderboard[self.top:]
+                while watermark in completed:
+                    completed.discard(watermark)
+                    watermark += 1
+
+                if time.perf_counter() - saved_at >= CHECKPOINT_INTERVAL:
+                    self._save_checkpoint(snapshot())
+                    saved_at = time.perf_counter()
+                yield event('progress')
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            if processed < self.total:
+                self._save_checkpoint(snapshot())
+            else:
+                # Завершений пошук не залишає контрольної точки
+                try:
+                    os.unlink(self.checkpoint_path)
+                except FileNotFoundError:
+                    pass
+
+        yield event('done')
+
@@ -0,0 +1,127 @@
+"""
+Двійковий формат послідовностей ЛКГ
+Лабораторна робота №1 - Варіант 17
+
+Формат 'lcg':
+    4 байти   - сигнатура b'LCG1'
+    4 байти   - довжина заголовка L (uint32, little-endian)
+    L байтів  - JSON {"m", "a", "c", "x0", "count", "dtype"}, доповнений пробілами так,
+                щоб дані починалися з межі 64 байтів
+    далі      - count чисел little-endian ('<u4' для m <= 2^32, '<u8' для m <= 2^64)
+Формат 'npy' - стандартний файл NumPy (без параметрів генератора).
+Обидва формати читаються через відображення у пам'ять без копіювання даних
+"""
+import io
+import json
+import struct
+from typing import Dict, Any, Iterator, Tuple
+
+import numpy as np
+
+from .LR1 import LinearCongruentialGenerator, VECTOR_MAX_MODULUS
+
+SEQUENCE_MAGIC = b'LCG1'
+NPY_MAGIC = b'\x93NUMPY'
+
+# Вирівнювання початку даних
+HEADER_ALIGNMENT = 64
+
+
+def _file_dtype(m: int) -> np.dtype:
+    # Тип чисел у файлі: найменший беззнаковий little-endian, що вміщує [0, m)
+    if m <= VECTOR_MAX_MODULUS:
+        return np.dtype('<u4')
+    if m <= 1 << 64:
+        return np.dtype('<u8')
+    raise ValueError('Двійковий формат підтримує модуль до 2^64')
+
+
+def _read_metadata(file) -> Tuple[Dict[str, Any], int]:
+    # Метадані заголовка 'lcg' (файл - одразу після сигнатури): (метадані, довжина L)
+    raw = file.read(4)
+    if len(raw) != 4:
+        raise ValueError('Пошкоджений заголовок файлу послідовності')
+    length, = struct.unpack('<I', raw)
+    data = file.read(length)
+    try:
+        metadata = json.loads(data) if len(data) == length else None
+    except ValueError:
+        metadata = None
+    if not isinstance(metadata, dict) or \
+            any(not isinstance(metadata.get(key), int) for key in ('m', 'a', 'c', 'x0', 'count')) or \
+            metadata['count'] < 0 or metadata.get('dtype') not in ('<u4', '<u8'):
+        raise ValueError('Пошкоджений заголовок файлу послідовності')
+    return metadata, length
+
+
+class SequenceFile:
+    # Запис і читання двійкових файлів послідовності
+
+    @staticmethod
+    def header(generator: LinearCongruentialGenerator, count: int, fmt: str = 'lcg') -> bytes:
+        # Заголовок файлу для count чисел генератора
+        dtype = _file_dtype(generator.m)
+        if fmt == 'npy':
+            buffer = io.BytesIO()
+            np.lib.format.write_array_header_1_0(
+                buffer, {'descr': dtype.str, 'fortran_order': False, 'shape': (count,)})
+            return buffer.getvalue()
+        if fmt != 'lcg':
+            raise ValueError(f"Невідомий формат: {fmt}")
+        metadata = json.dumps({
+            'm': generator.m,
+            'a': generator.a,
+            'c': generator.c,
+            'x0': generator.x0,
+            'count': count,
+            'dtype': dtype.str
+        }).encode('utf-8')
+        length = -(-(8 + len(metadata)) // HEADER_ALIGNMENT) * HEADER_ALIGNMENT - 8
+        return SEQUENCE_MAGIC + struct.pack('<I', length) + metadata.ljust(length)
+
+    @staticmethod
+    def chunks(generator: LinearCongruentialGenerator, count: int, fmt: str = 'lcg') -> Iterator[bytes]:
+        # Вміст файлу частинами: заголовок, далі блоки generate_blocks у little-endian.
+        # Послідовність - та сама, що generate_sequence(count) (генератор скидається)
+        dtype = _file_dtype(generator.m)
+        yield SequenceFile.header(generator, count, fmt)
+        generator.reset()
+        for block in generator.generate_blocks(count):
+            yield block.astype(dtype, copy=False).tobytes()
+
+    @staticmethod
+    def size(generator: LinearCongruentialGenerator, count: int, fmt: str = 'lcg') -> int:
+        # Розмір файлу в байтах (відомий наперед - для Content-Length)
+        return len(SequenceFile.header(generator, count, fmt)) + count * _file_dtype(generator.m).itemsize
+
+    @staticmethod
+    def write(path: str, generator: LinearCongruentialGenerator, count: int, fmt: str = 'lcg') -> int:
+        # Запис файлу; повертає кількість записаних байтів
+        written = 0
+        with open(path, 'wb') as file:
+            for chunk in SequenceFile.chunks(generator, count, fmt):
+                file.write(chunk)
+                written += len(chunk)
+        return written
+
+    @staticmethod
+    def open(path: str) -> Tuple[Dict[str, Any], np.ndarray]:
+        # Відкриття файлу будь-якого з двох форматів: (метадані, масив np.memmap тільки для читання).
+        # Масив можна передавати в StatisticsAccumulator, FrequencyTest, RunsTest тощо
+        with open(path, 'rb') as file:
+            magic = file.read(len(NPY_MAGIC))
+        if magic.startswith(SEQUENCE_MAGIC):
+            with open(path, 'rb') as file:
+                file.seek(len(SEQUENCE_MAGIC))
+                metadata, length = _read_metadata(file)
+                file.seek(0, io.SEEK_END)
+                size = file.tell()
+            dtype = np.dtype(metadata['dtype'])
+            if size < 8 + length + metadata['count'] * dtype.itemsize:
+                raise ValueError('Файл послідовності коротший, ніж вказано в заголовку')
+            values = np.memmap(path, dtype=dtype, mode='r', offset=8 + length, shape=(metadata['count'],))
+            return metadata, values
+        if magic == NPY_MAGIC:
+            values = np.load(path, mmap_mode='r')
+            return {'count': len(values), 'dtype': values.dtype.str}, values
+        raise ValueError('Невідомий формат файлу послідовності')
@@ -0,0 +1,89 @@
+"""
+Хешування дерева каталогів MD5 (ЛР2) з маніфестом у форматі md5sum
+
+Приклади:
+    python manage.py md5tree static > static.md5
+    python manage.py md5tree static --workers 4 --output static.md5
+    python manage.py md5tree static --check static.md5
+"""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from labs.algoritm.manifest import (
+    BATCH_BYTES,
+    SMALL_FILE_SIZE,
+    escape_path,
+    format_manifest,
+    hash_tree,
+    verify_manifest
+)
+
+
+class Command(BaseCommand):
+    help = 'Хешування дерева каталогів MD5: маніфест md5sum або перевірка за ним (--check)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('root', help='Кореневий каталог')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Кількість процесів (за замовчуванням - кількість ядер)')
+        parser.add_argument('--output', '-o', help='Файл маніфесту (за замовчуванням - стандартний вивід)')
+        parser.add_argument('--check', '-c', metavar='MANIFEST', help='Перевірити дерево за маніфестом')
+        parser.add_argument('--small-file-size', type=int, default=SMALL_FILE_SIZE,
+                            help='Файли, менші за цей розмір (байти), хешуються пакетами')
+        parser.add_argument('--batch-bytes', type=int, default=BATCH_BYTES,
+                            help='Сумарний розмір пакета дрібних файлів (байти)')
+
+    def handle(self, *args, **options):
+        root = options['root']
+        if not os.path.isdir(root):
+            raise CommandError(f'Каталог не знайдено: {root}')
+        workers = max(1, options['workers'])
+        verbose = options['verbosity'] >= 2
+
+        if options['check']:
+            try:
+                with open(options['check'], 'r', encoding='utf-8') as file:
+                    manifest = file.read()
+            except OSError as e:
+                raise CommandError(str(e))
+            result = verify_manifest(root, manifest, workers, options['small_file_size'],
+                                     options['batch_bytes'])
+            # Вивід у форматі md5sum -c
+            for entry in result['files']:
+                status = 'FAILED open or read' if entry['status'] == 'MISSING' else entry['status']
+                share = ', частка часу пакета' if entry['time_shared'] else ''
+                timing = f" ({entry['time_ms']:.2f} мс{share})" if verbose else ''
+                prefix, path = escape_path(entry['path'])
+                self.stdout.write(f"{prefix}{path}: {status}{timing}")
+            self._summary(result)
+            if result['malformed']:
+                self.stderr.write(f"Попередження: {result['malformed']} рядків маніфесту мають невірний формат")
+            if not result['match']:
+                raise CommandError(f"Не збіглися хеші: {result['failed']}, недоступні файли: {result['missing']}")
+            return
+
+        output = options['output']
+        result = hash_tree(root, workers, options['small_file_size'], options['batch_bytes'],
+                           exclude=[output] if output else ())
+        manifest = format_manifest(result['files'])
+        if output:
+            with open(output, 'w', encoding='utf-8', newline='\n') as file:
+                file.write(manifest)
+        else:
+            self.stdout.write(manifest, ending='')
+
+        for entry in result['files']:
+            if 'error' in entry:
+                self.stderr.write(f"{entry['path']}: {entry['error']}")
+            elif verbose:
+                mode = 'пакет, частка часу пакета' if entry['time_shared'] else 'потік'
+                self.stderr.write(f"{entry['path']}: {entry['size']} байт, {entry['time_ms']:.2f} мс ({mode})")
+        self._summary(result)
+
+    def _summary(self, result):
+        self.stderr.write(
+            f"Файлів: {result['file_count']}, байтів: {result['total_bytes']}, "
+            f"час: {result['elapsed_ms']:.1f} мс, {result['mb_per_s']:.2f} МБ/с, "
+            f"{result['files_per_s']:.1f} файлів/с"
+        )
@@ -0,0 +1,137 @@
+"""
+Допоміжні функції для потокових відповідей (StreamingHttpResponse):
+форматування масивів чисел у текст блоками без циклу Python по елементах
+та потокове кодування JSON з великими масивами NumPy
+"""
+import json
+from typing import Any, Iterator, List
+
+import numpy as np
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+ASCII_ZERO = ord('0')
+ASCII_SPACE = ord(' ')
+
+# Кількість елементів масиву, що кодуються за один крок
+JSON_ARRAY_CHUNK = 1 << 16
+
+# Дрібні частини JSON об'єднуються до такого розміру перед передачею (байти)
+JSON_BUFFER_SIZE = 1 << 16
+
+
+def digit_matrix(values: np.ndarray) -> np.ndarray:
+    # ASCII-цифри беззнакових чисел (до 2^64 - 1) у матриці (n, W), вирівняні праворуч
+    # і доповнені зліва пробілами; W - кількість цифр найбільшого числа
+    values = np.asarray(values)
+    if values.dtype == object:
+        # Числа понад 2^64 - звичайне форматування Python
+        text = [str(value).encode() for value in values]
+        width = max(map(len, text), default=1)
+        return np.frombuffer(b''.join(value.rjust(width) for value in text),
+                             dtype=np.uint8).reshape(len(text), width).copy()
+
+    largest = int(values.max()) if len(values) else 0
+    # Ділення в uint32 помітно швидше, ніж в uint64
+    rest = values.astype(np.uint32 if largest < 1 << 32 else np.uint64)
+    width = len(str(largest))
+    # Стовпці заповнюються як рядки транспонованої матриці (суцільні ділянки пам'яті)
+    digits = np.empty((width, len(values)), dtype=np.uint8)
+    zero = rest.dtype.type(0)
+    ten = rest.dtype.type(10)
+    for column in range(width - 1, -1, -1):
+        # Нульова частка до ділення означає ведучий нуль - він стає пробілом (крім останньої цифри)
+        exhausted = rest == zero
+        rest, digit = np.divmod(rest, ten)
+        digits[column] = digit
+        digits[column] += ASCII_ZERO
+        if column < width - 1:
+            digits[column][exhausted] = ASCII_SPACE
+    return digits.T
+
+
+def format_rows(columns: List[np.ndarray], separator: bytes = b'\t', terminator: bytes = b'\n') -> bytes:
+    # Рядки "col1<separator>col2...<terminator>" для стовпців беззнакових чисел.
+    # Рядки складаються в одну матрицю байтів фіксованої ширини, після чого
+    # пробіли вирівнювання видаляються одним bytes.replace
+    matrices = [digit_matrix(column) for column in columns]
+    rows = len(columns[0])
+    widths = [matrix.shape[1] for matrix in matrices]
+    total = sum(widths) + len(separator) * (len(columns) - 1) + len(terminator)
+    out = np.empty((rows, total), dtype=np.uint8)
+    position = 0
+    for index, matrix in enumerate(matrices):
+        if index:
+            out[:, position:position + len(separator)] = np.frombuffer(separator, dtype=np.uint8)
+            position += len(separator)
+        out[:, position:position + matrix.shape[1]] = matrix
+        position += matrix.shape[1]
+    out[:, position:] = np.frombuffer(terminator, dtype=np.uint8)
+    return out.tobytes().replace(b' ', b'')
+
+
+def json_array_chunks(values: np.ndarray, chunk_size: int = JSON_ARRAY_CHUNK) -> Iterator[bytes]:
+    # JSON-масив частинами по chunk_size елементів. Невід'ємні цілі форматуються
+    # матрицею цифр (кома - роздільник рядків), решта - стандартним json.dumps
+    values = np.asarray(values)
+    if values.dtype.kind == 'i':
+        digits = len(values) == 0 or values.min() >= 0
+    elif values.dtype == object:
+        # Числа понад 2^64 (ЛКГ з великим модулем)
+        digits = all(isinstance(value, int) and value >= 0 for value in values)
+    else:
+        digits = values.dtype.kind == 'u'
+    yield b'['
+    for start in range(0, len(values), chunk_size):
+        block = values[start:start + chunk_size]
+        if digits:
+            text = format_rows([block], terminator=b',')
+        else:
+            text = json.dumps(block.tolist(), cls=DjangoJSONEncoder)[1:-1].encode() + b','
+        # Після останнього блоку роздільник не потрібен
+        yield text[:-1] if start + chunk_size >= len(values) else text
+    yield b']'
+
+
+def _json_parts(value: Any) -> Iterator[bytes]:
+    # Обхід структури: масиви NumPy кодуються блоками, решта - DjangoJSONEncoder
+    if isinstance(value, np.ndarray):
+        yield from json_array_chunks(value)
+    elif isinstance(value, dict):
+        yield b'{'
+        for index, (key, item) in enumerate(value.items()):
+            yield (b', ' if index else b'') + json.dumps(str(key)).encode() + b': '
+            yield from _json_parts(item)
+        yield b'}'
+    elif isinstance(value, (list, tuple)) and any(isinstance(item, (np.ndarray, dict)) for item in value):
+        yield b'['
+        for index, item in enumerate(value):
+            if index:
+                yield b', '
+            yield from _json_parts(item)
+        yield b']'
+    else:
+        yield json.dumps(value, cls=DjangoJSONEncoder).encode()
+
+
+def json_chunks(value: Any, buffer_size: int = JSON_BUFFER_SIZE) -> Iterator[bytes]:
+    # Потокове кодування JSON: частини не менші за buffer_size (крім останньої)
+    buffer = []
+    size = 0
+    for part in _json_parts(value):
+        buffer.append(part)
+        size += len(part)
+        if size >= buffer_size:
+            yield b''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    # Аналог JsonResponse, що передає JSON частинами під час кодування.
+    # Масиви NumPy у data не перетворюються на списки Python
+    def __init__(self, data: Any, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(json_chunks(data), **kwargs)
@@ -1,3 +1,1112 @@
+import hashlib
+import io
+import itertools
+import json
+import math
+import os
+import random
+import tempfile
+from array import array
+from collections import Counter
+from statistics import NormalDist
+from unittest import mock
+
+import numpy as np
+from django.core.management import CommandError, call_command
 from django.test import TestCase
 
-# Create your tests here.
+from .algoritm.LR1 import (
+    ANALYTIC_MAX_BITS,
+    CesaroTest,
+    FactorizationLimitError,
+    FrequencyTest,
+    LinearCongruentialGenerator,
+    RunsTest,
+    SpectralTest,
+    StatisticsAccumulator,
+    analytic_period,
+    detect_modulus_class
+)
+from .algoritm.LR2 import MD5
+from .algoritm.manifest import format_manifest, hash_tree, parse_manifest, verify_manifest
+from .algoritm.downsampling import DOWNSAMPLING_METHODS, downsample
+from .algoritm.search import ParameterSearch
+from .algoritm.sequence_file import SequenceFile
+from .streaming import StreamingJsonResponse
+from .algoritm.battery import (
+    RandomnessBattery,
+    approximate_entropy_test,
+    block_frequency_test,
+    cumulative_sums_test,
+    monobit_test,
+    runs_test
+)
+
+
+class SequenceAssertions:
+    """Порівняння довгих послідовностей з повідомленням про першу розбіжність
+    (повний diff списків великих чисел будується хвилинами)"""
+
+    def assertSameSequence(self, actual, expected):
+        actual, expected = list(actual), list(expected)
+        self.assertEqual(len(actual), len(expected))
+        mismatch = next((i for i, (x, y) in enumerate(zip(actual, expected)) if x != y), None)
+        if mismatch is not None:
+            self.fail(f'Розбіжність у позиції {mismatch}: {actual[mismatch]} != {expected[mismatch]}')
+
+
+class GenerateArrayTests(SequenceAssertions, TestCase):
+    """Блокова генерація повинна збігатися з послідовними викликами next()"""
+
+    # (m, a, c, x0) для кожного класу модуля та типу масиву
+    PARAMETERS = [
+        (1, 0, 0, 0),
+        (2 ** 16, 75, 74, 1),
+        (2 ** 32, 1664525, 1013904223, 12345),
+        (2 ** 64, 6364136223846793005, 1442695040888963407, 7),
+        (2 ** 26 - 1, 13 ** 3, 1597, 13),
+        (2 ** 31 - 1, 16807, 0, 1),
+        (2 ** 61 - 1, 437799614237992725, 0, 3),
+        (2 ** 521 - 1, 3 ** 300, 5, 2 ** 400),
+        (1000003, 0, 17, 5),
+        (4294967291, 279470273, 0, 1),
+        (10 ** 12 + 39, 10 ** 11 + 3, 10 ** 9 + 7, 42),
+        (10 ** 40 + 121, 7 ** 40, 3, 11),
+    ]
+
+    def reference(self, m, a, c, x0, n):
+        generator = LinearCongruentialGenerator(m, a, c, x0)
+        return [generator.next() for _ in range(n)]
+
+    def test_modulus_classes_covered(self):
+        classes = {detect_modulus_class(m)[0] for m, _, _, _ in self.PARAMETERS}
+        self.assertEqual(classes, {'pow2', 'mersenne', 'generic'})
+
+    def test_generate_array_matches_next(self):
+        for m, a, c, x0 in self.PARAMETERS:
+            expected = self.reference(m, a, c, x0, 1000)
+            for block_size in (1, 7, 64, 1 << 16):
+                with self.subTest(m=m, block_size=block_size):
+                    generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+                    self.assertSameSequence(generator.generate_array(1000, block_size).tolist(), expected)
+
+    def test_blocks_continue_state(self):
+        # Після блокової генерації next() продовжує ту саму послідовність
+        for m, a, c, x0 in self.PARAMETERS:
+            with self.subTest(m=m):
+                expected = self.reference(m, a, c, x0, 300)
+                generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+                head = generator.generate_array(257, 64).tolist()
+                tail = [generator.next() for _ in range(43)]
+                self.assertSameSequence(head + tail, expected)
+
+    def test_generate_sequence_matches_next(self):
+        m, a, c, x0 = 2 ** 26 - 1, 13 ** 3, 1597, 13
+        expected = self.reference(m, a, c, x0, 5000)
+        generator = LinearCongruentialGenerator(m, a, c, x0)
+        self.assertSameSequence(generator.generate_sequence(5000), expected)
+        generator.reset()
+        self.assertSameSequence(generator.generate_sequence(5000, as_array=True).tolist(), expected)
+
+
+class JumpSplitTests(SequenceAssertions, TestCase):
+    """Перехід jump(n) і підпотоки split() повинні відтворювати послідовні виклики next()"""
+
+    PARAMETERS = GenerateArrayTests.PARAMETERS
+
+    def test_jump_matches_next(self):
+        for m, a, c, x0 in self.PARAMETERS:
+            for steps in [0, 1, 2, 63, 64, 1000]:
+                with self.subTest(m=m, steps=steps):
+                    walker = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+                    for _ in range(steps):
+                        walker.next()
+                    jumper = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+                    self.assertEqual(jumper.jump(steps), walker.current)
+                    # Після переходу next() продовжує ту саму послідовність
+                    self.assertEqual(jumper.next(), walker.next())
+
+    def test_split_concatenates_to_serial(self):
+        for m, a, c, x0 in self.PARAMETERS:
+            with self.subTest(m=m):
+                generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+                generator.jump(5)
+                streams = generator.split(7, 37)
+                concatenated = [stream.next() for stream in streams for _ in range(37)]
+                expected = [generator.next() for _ in range(7 * 37)]
+                self.assertSameSequence(concatenated, expected)
+
+
+class FindCycleTests(TestCase):
+    """Пошук циклу Брента повинен збігатися з обходом зі словником побачених значень"""
+
+    @staticmethod
+    def dict_walk(m, a, c, x0):
+        # (період, довжина передперіоду) за першим повтором значення
+        seen, value = {x0: 0}, x0
+        for i in range(1, m + 1):
+            value = (a * value + c) % m
+            if value in seen:
+                return i - seen[value], seen[value]
+            seen[value] = i
+
+    def test_matches_dict_walk(self):
+        for m in [1, 2, 3, 8, 12, 25, 36, 49, 64, 81, 100]:
+            for a in range(m):
+                for c in range(0, m, max(1, m // 5)):
+                    for x0 in sorted({0, 1, m // 3, m - 1} & set(range(m))):
+                        with self.subTest(m=m, a=a, c=c, x0=x0):
+                            generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+                            period, tail, found = generator.find_cycle()
+                            self.assertTrue(found)
+                            self.assertEqual((period, tail), self.dict_walk(m, a, c, x0))
+                            self.assertEqual(generator.find_period(method='dict'), (period, True))
+                            self.assertEqual(generator.find_period(method='brent'), (period, True))
+
+    def test_iteration_limit(self):
+        # Повний період 2^16 (умови Халла-Добелла): 1000 кроків недостатньо
+        generator = LinearCongruentialGenerator(2 ** 16, 1664525 % 2 ** 16, 1013904223 % 2 ** 16, 1,
+                                                history_size=0)
+        self.assertEqual(generator.find_cycle(1000), (1000, 0, False))
+        self.assertEqual(generator.find_cycle(), (2 ** 16, 0, True))
+
+
+class AnalyticPeriodTests(TestCase):
+    """Аналітичний період і передперіод повинні збігатися з обходом Брента"""
+
+    MODULI = [1, 2, 4, 9, 12, 16, 27, 30, 64, 97, 100, 125, 210, 256, 360]
+
+    def brent(self, m, a, c, x0):
+        period, tail, found = LinearCongruentialGenerator(m, a, c, x0, history_size=0).find_cycle()
+        self.assertTrue(found)
+        return period, tail
+
+    def test_matches_find_cycle_for_small_moduli(self):
+        # Усі множники; прирости і початкові значення - межові та середні
+        for m in self.MODULI:
+            for a in range(m):
+                for c in sorted({0, 1, m // 2, m - 1} & set(range(m))):
+                    for x0 in sorted({0, 1, m - 1} & set(range(m))):
+                        with self.subTest(m=m, a=a, c=c, x0=x0):
+                            self.assertEqual(analytic_period(m, a, c, x0), self.brent(m, a, c, x0))
+
+    def test_matches_find_cycle_for_larger_moduli(self):
+        for m, a, c, x0 in [
+            (2 ** 16 + 1, 75, 74, 0),
+            (2 ** 17 - 1, 16807, 0, 1),
+            (3 ** 10, 4, 2, 5),
+            (2 ** 12 * 3 ** 5, 13, 0, 6),
+            (1000003, 2, 0, 1),
+        ]:
+            with self.subTest(m=m, a=a, c=c, x0=x0):
+                self.assertEqual(analytic_period(m, a, c, x0), self.brent(m, a, c, x0))
+
+    def test_full_period_by_hull_dobell(self):
+        # Повний період для m = 2^26 без обходу: c непарне, a = 1 (mod 4)
+        self.assertEqual(analytic_period(2 ** 26, 1664525 % 2 ** 26, 1013904223 % 2 ** 26, 7), (2 ** 26, 0))
+
+    def test_factorisation_limits(self):
+        with self.assertRaises(FactorizationLimitError):
+            analytic_period(2 ** (ANALYTIC_MAX_BITS + 1) + 1, 3, 0, 1)
+        # Добуток двох 40-бітових простих не розкладається за 10 кроків Полларда
+        m = 1099511627791 * 1099511627803
+        with self.assertRaises(FactorizationLimitError):
+            analytic_period(m, 3, 0, 1, max_steps=10)
+
+
+class PeriodViewTests(TestCase):
+    """Прапорець verify у /lab1/period/: перевірка вмикається лише для true, "true" або "1" (не для "false")"""
+
+    def test_verify_flag(self):
+        for verify, expected in [(True, True), ('true', True), ('1', True), (1, True),
+                                 (False, None), ('false', None), ('0', None), (0, None), (None, None)]:
+            with self.subTest(verify=verify):
+                data = {'m': 2 ** 16, 'a': 1103515245 % 2 ** 16, 'c': 12345, 'x0': 1, 'method': 'analytic'}
+                if verify is not None:
+                    data['verify'] = verify
+                response = self.client.post('/lab1/period/', data=json.dumps(data),
+                                            content_type='application/json')
+                self.assertEqual(response.json()['verified'], expected)
+
+
+class StatisticsAccumulatorTests(TestCase):
+    """Об'єднання часткових акумуляторів повинно давати результат одного проходу"""
+
+    def sequence(self, m, n, seed=6):
+        # Випадкові значення з [0, min(m, n / 3)) з повторами і 12 частих значень
+        # (кожне не рідше n / 100 разів - топ-10 гарантовано точний і в HeavyHitters)
+        generator = np.random.default_rng(seed)
+        values = generator.integers(0, min(m, max(2, n // 3)), n, dtype=np.uint64)
+        positions = generator.permutation(n)
+        frequent = generator.choice(min(m, 1 << 40), 12, replace=False)
+        offset = 0
+        for rank, value in enumerate(frequent):
+            size = n // 100 + 37 * rank
+            values[positions[offset:offset + size]] = value
+            offset += size
+        return values
+
+    def single_pass(self, m, values):
+        accumulator = StatisticsAccumulator(m)
+        for start in range(0, len(values), 4096):
+            accumulator.update(values[start:start + 4096])
+        return accumulator.result(verify_chunks=[values])
+
+    def merged(self, m, values, bounds):
+        parts = []
+        for start, end in zip([0] + bounds, bounds + [len(values)]):
+            accumulator = StatisticsAccumulator(m)
+            for offset in range(start, end, 4096):
+                accumulator.update(values[offset:min(end, offset + 4096)])
+            parts.append(accumulator)
+        total = parts[0]
+        for part in parts[1:]:
+            total.merge(part)
+        return total.result(verify_chunks=[values])
+
+    def test_merge_matches_single_pass(self):
+        # Щільна таблиця, розріджені частоти і (з малим SPARSE_COUNT_LIMIT) HeavyHitters
+        # з бітовою картою чи відсортованим масивом унікальних; частини в різних станах
+        for limit in (1 << 20, 500):
+            for m in (1000, 1 << 22, 1 << 28, 1 << 40):
+                values = self.sequence(m, 60000)
+                for bounds in ([100], [30000], [59000], [10, 20000, 40000]):
+                    with self.subTest(limit=limit, m=m, bounds=bounds), \
+                            mock.patch('labs.algoritm.LR1.SPARSE_COUNT_LIMIT', limit):
+                        expected = self.single_pass(m, values)
+                        self.assertTrue(expected['frequency_top10_exact'])
+                        self.assertEqual(self.merged(m, values, bounds), expected)
+                        self.assertEqual(expected['unique_values'], len(set(values.tolist())))
+                        self.assertEqual(expected['count'], len(values))
+                        self.assertAlmostEqual(expected['mean'], float(values.mean()))
+                        self.assertAlmostEqual(expected['variance'] / float(values.var()), 1.0)
+
+    @staticmethod
+    def counter_top(values, k=10):
+        # Еталон: повний підрахунок, при рівних частотах - менше значення першим
+        return dict(sorted(Counter(values.tolist()).items(), key=lambda item: (-item[1], item[0]))[:k])
+
+    def test_heavy_hitters_top_matches_counter(self):
+        # Після переходу на HeavyHitters топ-10 не порожній і збігається з Counter, коли точність гарантована
+        generator = LinearCongruentialGenerator(2 ** 26, 1664525 % 2 ** 26, 1013904223 % 2 ** 26, 1, history_size=0)
+        full_period = generator.generate_array(60000).astype(np.uint64)
+        repeated = np.random.default_rng(7).integers(0, 20000, 60000, dtype=np.uint64)
+        planted = full_period.copy()
+        planted[:3000] = np.repeat(full_period[-15:], 200)
+        cases = [('full period', 2 ** 26, full_period, True), ('planted', 2 ** 32, planted, True),
+                 ('repeated', 2 ** 32, repeated, None)]
+        with mock.patch('labs.algoritm.LR1.SPARSE_COUNT_LIMIT', 1000):
+            for name, m, values, exact in cases:
+                with self.subTest(name):
+                    accumulator = StatisticsAccumulator(m)
+                    for start in range(0, len(values), 4096):
+                        accumulator.update(values[start:start + 4096])
+                    self.assertIsNotNone(accumulator._heavy)
+                    result = accumulator.result(verify_chunks=[values])
+                    top = result['frequency_top10']
+                    expected = self.counter_top(values)
+                    counts = Counter(values.tolist())
+                    self.assertEqual(len(top), 10)
+                    # Частоти кандидатів після другого проходу точні в будь-якому разі
+                    self.assertEqual(top, {value: counts[value] for value in top})
+                    if exact is not None:
+                        self.assertEqual(result['frequency_top10_exact'], exact)
+                    if result['frequency_top10_exact']:
+                        self.assertEqual(top, expected)
+
+    def test_merge_requires_same_modulus(self):
+        with self.assertRaises(ValueError):
+            StatisticsAccumulator(16).merge(StatisticsAccumulator(32).update([1, 2]))
+
+
+class CesaroBatchedTests(SequenceAssertions, TestCase):
+    """Пакетна оцінка Pi повинна відтворювати estimate_pi разом з історією оцінок"""
+
+    PARAMETERS = [
+        (2 ** 26 - 1, 13 ** 3, 1597, 13),
+        (2 ** 32, 1664525, 1013904223, 1),
+        (16, 5, 3, 1),
+        (10 ** 40 + 121, 7 ** 40, 3, 11),
+    ]
+
+    def check(self, params, num_pairs, workers):
+        expected_generator = LinearCongruentialGenerator(*params, history_size=0)
+        expected = CesaroTest.estimate_pi(expected_generator, num_pairs)
+        generator = LinearCongruentialGenerator(*params, history_size=0)
+        pi_estimate, error, history = CesaroTest.estimate_pi_batched(generator, num_pairs, workers)
+        self.assertEqual((pi_estimate, error), expected[:2])
+        self.assertSameSequence(history, expected[2])
+        # Генератор зупиняється там само, де після послідовного обходу
+        self.assertEqual(generator.current, expected_generator.current)
+
+    def test_matches_estimate_pi(self):
+        for params in self.PARAMETERS:
+            for num_pairs in (1, 99, 100, 12345, 70001):
+                with self.subTest(m=params[0], num_pairs=num_pairs):
+                    self.check(params, num_pairs, workers=1)
+
+    def test_result_independent_of_workers(self):
+        # Частини для пулу процесів не змінюють ні оцінку, ні історію
+        for workers in (2, 3):
+            with self.subTest(workers=workers):
+                self.check(self.PARAMETERS[0], 70001, workers)
+
+
+class CesaroSequentialTests(TestCase):
+    """Послідовна оцінка Pi зупиняється на першій парі, де піврозмах інтервалу Вільсона <= tolerance"""
+
+    @staticmethod
+    def first_stop(params, tolerance, confidence=0.95, min_pairs=100, max_pairs=100000):
+        # Поелементний еталон: інтервал Вільсона після кожної пари
+        generator = LinearCongruentialGenerator(*params, history_size=0)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        coprime = 0
+        for n in range(1, max_pairs + 1):
+            coprime += math.gcd(generator.next(), generator.next()) == 1
+            p_hat = coprime / n
+            center = (p_hat + z * z / (2 * n)) / (1 + z * z / n)
+            spread = z / (1 + z * z / n) * math.sqrt(p_hat * (1 - p_hat) / n + z * z / (4 * n * n))
+            if center - spread <= 0:
+                continue
+            half_width = (math.sqrt(6 / (center - spread)) - math.sqrt(6 / min(center + spread, 1))) / 2
+            if n >= min_pairs and half_width <= tolerance:
+                return n, coprime, generator.current
+        return None
+
+    def test_reference_stop(self):
+        generator = LinearCongruentialGenerator(2 ** 32, 1664525, 1013904223, 1, history_size=0)
+        result = CesaroTest.estimate_pi_sequential(generator, tolerance=0.02)
+        self.assertTrue(result['converged'])
+        self.assertEqual(result['pairs_used'], 4010)
+        self.assertLessEqual(result['half_width'], 0.02)
+
+    def test_matches_pairwise_rule(self):
+        for params in [(2 ** 32, 1664525, 1013904223, 1), (2 ** 26 - 1, 13 ** 3, 1597, 13)]:
+            for tolerance in [0.05, 0.02, 0.01]:
+                # Малий блок: зупинка припадає не на перший блок
+                for block_pairs in [1000, 32000]:
+                    with self.subTest(m=params[0], tolerance=tolerance, block_pairs=block_pairs):
+                        pairs, coprime, state = self.first_stop(params, tolerance)
+                        generator = LinearCongruentialGenerator(*params, history_size=0)
+                        with mock.patch('labs.algoritm.LR1.CESARO_BLOCK_PAIRS', block_pairs):
+                            result = CesaroTest.estimate_pi_sequential(generator, tolerance=tolerance)
+                        self.assertEqual(result['pairs_used'], pairs)
+                        self.assertEqual(result['coprime_probability'], coprime / pairs)
+                        # Генератор зупиняється одразу після останньої використаної пари
+                        self.assertEqual(generator.current, state)
+
+
+class SpectralTestTests(TestCase):
+    """Спектральний тест повинен відтворювати таблицю Кнута і повний перебір для малих модулів"""
+
+    @staticmethod
+    def brute_force(m, a, t):
+        # Найменший квадрат довжини ненульового s з s_1 + s_2 a + ... + s_t a^(t-1) = 0 (mod m)
+        powers = [pow(a, j, m) for j in range(t)]
+        bound = m  # вектор (m, 0, ..., 0) завжди задовольняє умову
+        best = m * m
+        for s in itertools.product(range(-bound, bound + 1), repeat=t - 1):
+            # s_1 однозначно визначається рештою координат з точністю до кратного m
+            residue = -sum(x * p for x, p in zip(s, powers[1:])) % m
+            for first in (residue, residue - m):
+                norm = first * first + sum(x * x for x in s)
+                if 0 < norm < best:
+                    best = norm
+        return best
+
+    def test_knuth_table(self):
+        # TAOCP т. 2, табл. 3.3.4-1, рядок 26: m = 2^32, a = 1664525
+        result = SpectralTest.test_parameters(2 ** 32, 1664525, 6)
+        self.assertEqual([item['nu_square'] for item in result['dimensions']],
+                         [4938916874, 2322494, 63712, 4092, 1038])
+
+    def test_shortest_vector(self):
+        for m, a in [(101, 12), (256, 37), (257, 3), (2 ** 32, 1664525), (2 ** 31 - 1, 16807)]:
+            for item in SpectralTest.test_parameters(m, a, 6)['dimensions']:
+                with self.subTest(m=m, a=a, t=item['dimension']):
+                    vector = item['shortest_vector']
+                    self.assertEqual(sum(x * pow(a, j, m) for j, x in enumerate(vector)) % m, 0)
+                    self.assertEqual(sum(x * x for x in vector), item['nu_square'])
+
+    def test_matches_brute_force(self):
+        for m, a in [(64, 5), (101, 12), (128, 29), (127, 3)]:
+            dimensions = SpectralTest.test_parameters(m, a, 3)['dimensions']
+            for item in dimensions:
+                with self.subTest(m=m, a=a, t=item['dimension']):
+                    self.assertEqual(item['nu_square'], self.brute_force(m, a, item['dimension']))
+
+
+class FrequencyTestTests(TestCase):
+    """Частотний тест через popcount повинен збігатися з рядковою реалізацією"""
+
+    KEYS = ('ones_count', 'zeros_count', 'ones_ratio', 'zeros_ratio', 'chi_square', 'is_random')
+
+    @staticmethod
+    def reference(sequence, bit_length):
+        # Початкова реалізація: bin(num)[2:].zfill(bit_length) для кожного числа
+        ones_count = zeros_count = 0
+        for num in sequence:
+            binary = bin(num)[2:].zfill(bit_length)
+            ones_count += binary.count('1')
+            zeros_count += binary.count('0')
+        total_bits = ones_count + zeros_count
+        chi_square = ((ones_count - total_bits / 2) ** 2 +
+                      (zeros_count - total_bits / 2) ** 2) / (total_bits / 2)
+        return {
+            'ones_count': ones_count,
+            'zeros_count': zeros_count,
+            'ones_ratio': ones_count / total_bits,
+            'zeros_ratio': zeros_count / total_bits,
+            'chi_square': chi_square,
+            'is_random': chi_square < 3.841
+        }
+
+    @staticmethod
+    def reference_blocks(sequence, bit_length, block_size):
+        # Блоковий тест NIST: 4 * M * (pi - 1/2)^2 для кожного повного блоку
+        chi_square, blocks = 0.0, 0
+        for start in range(0, len(sequence) - block_size + 1, block_size):
+            bits = ''.join(bin(num)[2:].zfill(bit_length) for num in sequence[start:start + block_size])
+            chi_square += 4 * len(bits) * (bits.count('1') / len(bits) - 0.5) ** 2
+            blocks += 1
+        return blocks, chi_square
+
+    def sequence(self, n=5000):
+        return LinearCongruentialGenerator(2 ** 26 - 1, 13 ** 3, 1597, 13).generate_sequence(n)
+
+    def assertMatchesReference(self, result, sequence, bit_length):
+        expected = self.reference(sequence, bit_length)
+        self.assertEqual({key: result[key] for key in self.KEYS}, expected)
+
+    def test_matches_string_implementation(self):
+        sequence = self.sequence()
+        for bit_length in (8, 26, 32, 64):
+            with self.subTest(bit_length=bit_length):
+                self.assertMatchesReference(FrequencyTest.test_bits(sequence, bit_length), sequence, bit_length)
+
+    def test_array_inputs(self):
+        sequence = self.sequence()
+        for values in (np.array(sequence, dtype=np.uint32), np.array(sequence, dtype=np.int64),
+                       array('I', sequence)):
+            with self.subTest(type=type(values).__name__, dtype=getattr(values, 'dtype', None)):
+                self.assertMatchesReference(FrequencyTest.test_bits(values, 26), sequence, 26)
+
+    def test_wide_numbers(self):
+        # Числа, довші за bit_length, займають власну довжину, як у zfill
+        sequence = [0, 1, 3, 2 ** 40 + 5, 2 ** 70 + 2 ** 33, 255]
+        self.assertMatchesReference(FrequencyTest.test_bits(sequence, 32), sequence, 32)
+
+    def test_stream_matches_whole_sequence(self):
+        sequence = self.sequence()
+        chunks = (sequence[start:start + 777] for start in range(0, len(sequence), 777))
+        streamed = FrequencyTest.test_bits_stream(chunks, 26, block_size=128)
+        whole = FrequencyTest.test_bits(sequence, 26, block_size=128)
+        # Блоки перетинають межі частин; сума хі-квадрат залежить лише від порядку додавання
+        streamed_blocks, whole_blocks = streamed.pop('block_frequency'), whole.pop('block_frequency')
+        self.assertEqual(streamed, whole)
+        self.assertEqual(streamed_blocks['blocks'], whole_blocks['blocks'])
+        self.assertTrue(math.isclose(streamed_blocks['chi_square'], whole_blocks['chi_square'], rel_tol=1e-9))
+
+    def test_block_frequency(self):
+        sequence = self.sequence()
+        for block_size in (1, 100, 128, 4999):
+            with self.subTest(block_size=block_size):
+                result = FrequencyTest.test_bits(sequence, 26, block_size=block_size)['block_frequency']
+                blocks, chi_square = self.reference_blocks(sequence, 26, block_size)
+                self.assertEqual(result['blocks'], blocks)
+                self.assertTrue(math.isclose(result['chi_square'], chi_square, rel_tol=1e-9))
+        result = FrequencyTest.test_bits(sequence[:10], 26, block_size=100)
+        self.assertIn('error', result['block_frequency'])
+
+
+class RunsTestTests(TestCase):
+    """Потоковий тест серій повинен збігатися з обходом побітового списку"""
+
+    KEYS = ('runs', 'expected_runs', 'variance', 'z_statistic', 'is_random')
+
+    @staticmethod
+    def reference(sequence, bit_length=None):
+        # Початкова реалізація: список бітів bin(num)[2:] (або zfill(bit_length)) і обхід
+        bits = []
+        for num in sequence:
+            binary = bin(num)[2:] if bit_length is None else bin(num)[2:].zfill(bit_length)
+            bits.extend(int(b) for b in binary)
+        if len(bits) < 2:
+            return {'error': 'Послідовність коротка'}
+        runs = 1 + sum(bits[i] != bits[i - 1] for i in range(1, len(bits)))
+        n = len(bits)
+        ones = sum(bits)
+        zeros = n - ones
+        if ones == 0 or zeros == 0:
+            return {'error': 'Біто однакові'}
+        expected_runs = (2 * ones * zeros) / n + 1
+        variance = (2 * ones * zeros * (2 * ones * zeros - n)) / (n ** 2 * (n - 1))
+        z = (runs - expected_runs) / math.sqrt(variance)
+        return {
+            'runs': runs,
+            'expected_runs': expected_runs,
+            'variance': variance,
+            'z_statistic': z,
+            'is_random': abs(z) < 1.96
+        }
+
+    def assertMatchesReference(self, result, sequence, bit_length=None):
+        expected = self.reference(sequence, bit_length)
+        if 'error' in expected:
+            self.assertEqual(result, expected)
+        else:
+            self.assertEqual({key: result[key] for key in self.KEYS}, expected)
+
+    def sequence(self, n=3000):
+        return LinearCongruentialGenerator(2 ** 26 - 1, 13 ** 3, 1597, 13).generate_sequence(n)
+
+    def test_matches_bit_list(self):
+        sequence = self.sequence()
+        for bit_length in (None, 26, 32):
+            with self.subTest(bit_length=bit_length):
+                self.assertMatchesReference(RunsTest.test(sequence, bit_length), sequence, bit_length)
+                values = np.array(sequence, dtype=np.uint32)
+                self.assertMatchesReference(RunsTest.test(values, bit_length), sequence, bit_length)
+
+    def test_irregular_numbers(self):
+        # Нулі (один біт '0'), одиниці, довгі числа та числа довші за bit_length
+        sequence = [0, 1, 0, 2, 7, 8, 2 ** 40 - 1, 2 ** 70 + 1, 0, 5, 2 ** 63, 3]
+        for bit_length in (None, 4, 64):
+            with self.subTest(bit_length=bit_length):
+                self.assertMatchesReference(RunsTest.test(sequence, bit_length), sequence, bit_length)
+
+    def test_stream_stitches_chunks(self):
+        # Межі серій між частинами потоку: частини різної довжини, зокрема по одному числу
+        sequence = self.sequence()
+        sizes = [1, 1, 2, 5, 64, 1000, 3, 1924]
+        chunks, start = [], 0
+        for size in sizes:
+            chunks.append(np.array(sequence[start:start + size], dtype=np.uint32))
+            start += size
+        self.assertEqual(start, len(sequence))
+        for bit_length in (None, 26):
+            with self.subTest(bit_length=bit_length):
+                self.assertEqual(RunsTest.test_stream(iter(chunks), bit_length), RunsTest.test(sequence, bit_length))
+
+    def test_degenerate_sequences(self):
+        for sequence in ([], [1], [0], [1, 3, 7], [2 ** 40 - 1]):
+            with self.subTest(sequence=sequence):
+                self.assertMatchesReference(RunsTest.test(sequence), sequence)
+
+
+class BatteryTests(TestCase):
+    """Тести батареї повинні відтворювати приклади NIST SP 800-22 (розділ 2)"""
+
+    # 100 біт двійкового розкладу числа pi з прикладів стандарту
+    EPSILON = ('11001001000011111101101010100010001000010110100011'
+               '00001000110100110001001100011001100010100010111000')
+
+    def setUp(self):
+        self.packed = np.packbits(np.array([int(bit) for bit in self.EPSILON], dtype=np.uint8))
+        self.n_bits = len(self.EPSILON)
+
+    def test_monobit(self):
+        self.assertAlmostEqual(monobit_test(self.packed, self.n_bits)['p_value'], 0.109599, places=6)
+
+    def test_block_frequency(self):
+        result = block_frequency_test(self.packed, self.n_bits, block_size=10)
+        self.assertAlmostEqual(result['p_value'], 0.706438, places=6)
+
+    def test_runs(self):
+        result = runs_test(self.packed, self.n_bits)
+        self.assertEqual(result['runs'], 52)
+        self.assertAlmostEqual(result['p_value'], 0.500798, places=6)
+
+    def test_cumulative_sums(self):
+        forward, backward = cumulative_sums_test(self.packed, self.n_bits)['p_values']
+        self.assertAlmostEqual(forward, 0.219194, places=6)
+        self.assertAlmostEqual(backward, 0.114866, places=6)
+
+    def test_approximate_entropy(self):
+        result = approximate_entropy_test(self.packed, self.n_bits, length=2)
+        self.assertAlmostEqual(result['p_value'], 0.235301, places=6)
+
+    def test_default_lengths_follow_n_bits(self):
+        # Довжини шаблонів за замовчуванням допустимі й для коротких послідовностей
+        for n_bits in [1 << 10, 1 << 16, 1 << 20]:
+            with self.subTest(n_bits=n_bits):
+                generator = LinearCongruentialGenerator(2 ** 32, 1664525, 1013904223, 1, history_size=0)
+                result = RandomnessBattery.run(generator, n_bits, tests=['serial', 'approximate_entropy'])
+                for name, test in result['tests'].items():
+                    self.assertNotIn('error', test, name)
+
+
+class ParameterSearchTests(TestCase):
+    """Перерваний пошук параметрів повинен продовжуватися до тієї самої таблиці лідерів"""
+
+    def search(self, directory):
+        return ParameterSearch(2 ** 16, range(5, 2000, 4), [1, 12345], x0=1, top=5,
+                               max_dimension=4, battery_bits=1 << 12, batch_size=8,
+                               checkpoint_dir=directory)
+
+    @staticmethod
+    def leaders(event):
+        return [(entry['a'], entry['c']) for entry in event['leaderboard']]
+
+    def test_resume_matches_single_run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            expected = list(self.search(directory).run(resume=False))[-1]
+            self.assertEqual(os.listdir(directory), [])
+
+            # Перериваємо пошук після кількох частин: контрольна точка зберігається при закритті
+            events = self.search(directory).run()
+            for _ in range(6):
+                next(events)
+            events.close()
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+            resumed = list(self.search(directory).run())
+            self.assertTrue(resumed[0]['resumed'])
+            self.assertGreater(resumed[0]['processed'], 0)
+            self.assertEqual(resumed[-1]['type'], 'done')
+            self.assertEqual(resumed[-1]['processed'], expected['processed'])
+            self.assertEqual(self.leaders(resumed[-1]), self.leaders(expected))
+            # Завершений пошук видаляє контрольну точку
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_validates_all_candidates(self):
+        for multipliers, increments in [(range(5, 2 ** 16 + 5, 4), [1]), (range(5, 100), [1, 2 ** 16]),
+                                        (range(-3, 100), [1]), (range(5, 100), [1, -1])]:
+            with self.subTest(multipliers=multipliers, increments=increments):
+                with self.assertRaises(ValueError):
+                    ParameterSearch(2 ** 16, multipliers, increments)
+
+
+class DownsampleTests(SequenceAssertions, TestCase):
+    """Зменшений ряд зберігає першу й останню точки та містить не більше max_points точок"""
+
+    def test_keeps_endpoints_within_limit(self):
+        generator = np.random.default_rng(20)
+        for method in DOWNSAMPLING_METHODS:
+            for n in [1, 5, 100, 1001, 12345]:
+                for max_points in [4, 5, 10, 1000]:
+                    with self.subTest(method=method, n=n, max_points=max_points):
+                        y = generator.integers(0, 2 ** 32, n)
+                        series = downsample(y, max_points, method=method)
+                        x = np.asarray(series['x'])
+                        self.assertLessEqual(len(x), min(n, max_points))
+                        self.assertEqual(x[0], 0)
+                        self.assertEqual(x[-1], n - 1)
+                        self.assertTrue(np.all(np.diff(x) > 0))
+                        self.assertTrue(np.array_equal(series['y'], y[x]))
+                        self.assertEqual(series['total'], n)
+
+    def test_generate_keeps_sequence(self):
+        # /lab1/generate/ повертає послідовність, а ряд - лише за переданим max_points
+        parameters = {'m': 2 ** 32, 'a': 1664525, 'c': 1013904223, 'x0': 1, 'count': 5000}
+        expected = LinearCongruentialGenerator(2 ** 32, 1664525, 1013904223, 1).generate_sequence(5000)
+        for max_points in [None, 100]:
+            with self.subTest(max_points=max_points):
+                data = dict(parameters) if max_points is None else dict(parameters, max_points=max_points)
+                response = self.client.post('/lab1/generate/', data=json.dumps(data),
+                                            content_type='application/json')
+                body = json.loads(b''.join(response.streaming_content) if response.streaming
+                                  else response.content)
+                self.assertSameSequence(body['sequence'], expected)
+                if max_points is None:
+                    self.assertNotIn('series', body)
+                else:
+                    self.assertLessEqual(len(body['series']['x']), max_points)
+                    self.assertEqual(body['series']['y'][-1], expected[-1])
+
+
+class SequenceWindowTests(SequenceAssertions, TestCase):
+    """Сторінка /lab1/sequence/ повинна бути зрізом generate_sequence"""
+
+    def window(self, **data):
+        response = self.client.post('/lab1/sequence/', data=json.dumps(data), content_type='application/json')
+        return json.loads(b''.join(response.streaming_content) if response.streaming else response.content)
+
+    def test_matches_slice(self):
+        for m, a, c, x0 in [(2 ** 26 - 1, 13 ** 3, 1597, 13), (2 ** 32, 1664525, 1013904223, 1),
+                            (2 ** 64, 6364136223846793005, 1442695040888963407, 7),
+                            (10 ** 40 + 121, 7 ** 40, 3, 11)]:
+            expected = LinearCongruentialGenerator(m, a, c, x0).generate_sequence(12000)
+            for offset, limit in [(0, 1), (0, 5000), (5000, 5000), (11999, 1), (7, 4321)]:
+                with self.subTest(m=m, offset=offset, limit=limit):
+                    result = self.window(m=m, a=a, c=c, x0=x0, offset=offset, limit=limit)
+                    self.assertSameSequence(result['sequence'], expected[offset:offset + limit])
+
+            # Остання сторінка обрізається за count
+            with self.subTest(m=m, count=12000):
+                result = self.window(m=m, a=a, c=c, x0=x0, offset=10000, limit=5000, count=12000)
+                self.assertEqual(result['limit'], 2000)
+                self.assertSameSequence(result['sequence'], expected[10000:])
+
+    def test_invalid_requests(self):
+        self.assertIn('error', self.window(offset=-1))
+        self.assertIn('error', self.window(limit=0))
+        self.assertIn('error', self.window(limit=100001))
+
+
+class SequenceFileTests(SequenceAssertions, TestCase):
+    """Двійковий файл послідовності читається через memmap без змін і відхиляє пошкоджені заголовки"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'sequence.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        for m, a, c, x0 in [(2 ** 26 - 1, 13 ** 3, 1597, 13), (2 ** 32, 1664525, 1013904223, 1),
+                            (2 ** 64, 6364136223846793005, 1442695040888963407, 7)]:
+            for fmt in ('lcg', 'npy'):
+                for count in (0, 1, 70001):
+                    with self.subTest(m=m, fmt=fmt, count=count):
+                        generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+                        written = SequenceFile.write(self.path, generator, count, fmt)
+                        self.assertEqual(written, os.path.getsize(self.path))
+                        self.assertEqual(written, SequenceFile.size(generator, count, fmt))
+                        metadata, values = SequenceFile.open(self.path)
+                        self.assertIsInstance(values, np.memmap)
+                        self.assertEqual(metadata['count'], count)
+                        if fmt == 'lcg':
+                            self.assertEqual((metadata['m'], metadata['a'], metadata['c'], metadata['x0']),
+                                             (m, a, c, x0))
+                            self.assertEqual(values.offset % 64, 0)
+                        expected = LinearCongruentialGenerator(m, a, c, x0).generate_sequence(count)
+                        self.assertSameSequence(values.tolist(), expected)
+                        del values
+
+    def test_rejects_bad_header(self):
+        generator = LinearCongruentialGenerator(2 ** 32, 1664525, 1013904223, 1, history_size=0)
+        valid = b''.join(SequenceFile.chunks(generator, 100))
+        length = int.from_bytes(valid[4:8], 'little')
+        metadata = json.loads(valid[8:8 + length])
+
+        def header(**changes):
+            text = json.dumps(dict(metadata, **changes)).encode().ljust(length)
+            return valid[:8] + text + valid[8 + length:]
+
+        for name, content in [
+            ('empty', b''),
+            ('magic', b'LCG2' + valid[4:]),
+            ('truncated length', valid[:6]),
+            ('truncated metadata', valid[:8 + length // 2]),
+            ('json', valid[:8] + b'{' * length + valid[8 + length:]),
+            ('count', header(count=101)),
+            ('negative count', header(count=-1)),
+            ('dtype', header(dtype='<f8')),
+            ('missing key', valid[:8] + json.dumps({'count': 100, 'dtype': '<u4'}).encode().ljust(length) +
+             valid[8 + length:]),
+            ('truncated data', valid[:-4]),
+        ]:
+            with self.subTest(name=name):
+                with open(self.path, 'wb') as file:
+                    file.write(content)
+                with self.assertRaises(ValueError):
+                    SequenceFile.open(self.path)
+
+
+class StreamingJsonTests(TestCase):
+    """Потоковий JSON повинен розбиратися в те саме, що й json.dumps тих самих даних"""
+
+    def check(self, payload):
+        response = StreamingJsonResponse(payload)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        body = json.loads(b''.join(response.streaming_content))
+        # Еталон: масиви NumPy як списки Python
+        expected = json.loads(json.dumps(payload, default=lambda value: value.tolist()))
+        # Без повного diff: масиви на десятки тисяч чисел
+        self.assertTrue(body == expected, 'Розібраний потоковий JSON відрізняється від json.dumps')
+
+    def test_arrays(self):
+        generator = np.random.default_rng(19)
+        for name, values in [
+            ('empty', np.empty(0, dtype=np.uint32)),
+            ('uint32', generator.integers(0, 2 ** 32, 70001, dtype=np.uint64).astype(np.uint32)),
+            ('uint64', np.array([0, 1, 9, 10, 2 ** 63, 2 ** 64 - 1], dtype=np.uint64)),
+            ('int64', generator.integers(-10 ** 12, 10 ** 12, 1000)),
+            ('float64', generator.random(1000)),
+            ('big int', np.array([0, 2 ** 64, 10 ** 40 + 120, 3 ** 100], dtype=object)),
+        ]:
+            with self.subTest(name=name):
+                self.check({'values': values})
+
+    def test_nested_payload(self):
+        m, a, c, x0 = 10 ** 40 + 121, 7 ** 40, 3, 11
+        generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+        sequence = generator.generate_sequence(70001, as_array=True)
+        self.assertEqual(sequence.dtype, object)
+        self.check({
+            'success': True,
+            'sequence': sequence,
+            'parameters': {'m': m, 'a': a, 'c': c, 'x0': x0},
+            'series': [{'x': np.arange(5), 'y': sequence[:5]}, 'текст "у лапках"'],
+            'pairs': [[1, 2], (3, 4)],
+            'missing': None,
+            'ratio': 0.1,
+        })
+
+
+class ExportResultsTests(TestCase):
+    """Потоковий експорт lr1_lin.txt повинен збігатися побайтово з форматуванням f-рядками"""
+
+    @staticmethod
+    def reference(m, a, c, x0, count):
+        # Початковий формат файлу: заголовок і рядки "індекс<TAB>значення"
+        generator = LinearCongruentialGenerator(m, a, c, x0)
+        output = io.StringIO()
+        output.write(f"Модуль порівняння m = {m}\n")
+        output.write(f"Множник a = {a}\n")
+        output.write(f"Приріст c = {c}\n")
+        output.write(f"Початкове число x0 = {x0}\n")
+        output.write("-" * 20 + "\n")
+        output.write(f"Кількість змінних = {count}\n")
+        output.write("-" * 20 + "\n")
+        output.write("Індекс\tЗначення змінної\n")
+        for i in range(1, count + 1):
+            output.write(f"{i}\t{generator.next()}\n")
+        return output.getvalue().encode('utf-8')
+
+    def export(self, **data):
+        return self.client.post('/lab1/export/', data=json.dumps(data), content_type='application/json')
+
+    def test_byte_identical(self):
+        for m, a, c, x0, count in [
+            (2 ** 26 - 1, 13 ** 3, 1597, 13, 1),
+            (2 ** 26 - 1, 13 ** 3, 1597, 13, 70000),
+            (2 ** 32, 1664525, 1013904223, 0, 1000),
+            (2 ** 64, 6364136223846793005, 1442695040888963407, 7, 1000),
+            (10 ** 40 + 121, 7 ** 40, 3, 11, 300),
+        ]:
+            with self.subTest(m=m, count=count):
+                response = self.export(m=m, a=a, c=c, x0=x0, count=count)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.streaming)
+                self.assertEqual(response['Content-Disposition'], 'attachment; filename="lr1_lin.txt"')
+                content = b''.join(response.streaming_content)
+                expected = self.reference(m, a, c, x0, count)
+                # Без повного diff: файли на десятки тисяч рядків
+                self.assertEqual(len(content), len(expected))
+                self.assertTrue(content == expected, 'Вміст експорту відрізняється від еталонного')
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.export(count=0).status_code, 400)
+        self.assertEqual(self.export(count=10 ** 9).status_code, 400)
+        self.assertEqual(self.export(m=16, x0=16).status_code, 400)
+        self.assertEqual(self.client.get('/lab1/export/').status_code, 405)
+
+
+class PipeStream:
+    """Потік як у каналу: лише послідовне читання, без seek і fileno"""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._data.read(size)
+
+    def seek(self, offset):
+        raise io.UnsupportedOperation('seek')
+
+
+class MD5Tests(TestCase):
+    """Інкрементний MD5 повинен збігатися з hashlib.md5"""
+
+    # Довжини на межах блоків: доповнення вміщується в блок (55) або потребує ще одного (56)
+    LENGTHS = [0, 1, 3, 55, 56, 57, 63, 64, 65, 119, 120, 127, 128, 129, 1000, 4096, 100003]
+
+    def setUp(self):
+        self.random = random.Random(21)
+
+    def data(self, length):
+        return self.random.randbytes(length)
+
+    def test_hash_bytes(self):
+        for length in self.LENGTHS:
+            with self.subTest(length=length):
+                data = self.data(length)
+                expected = hashlib.md5(data).hexdigest()
+                self.assertEqual(MD5(data).hexdigest(), expected)
+                self.assertEqual(MD5(data).digest(), hashlib.md5(data).digest())
+                self.assertEqual(MD5.hash_bytes(data), expected.upper())
+        self.assertEqual(MD5.hash_string('Привіт, світ'), hashlib.md5('Привіт, світ'.encode('utf-8')).hexdigest().upper())
+
+    def test_update_in_pieces(self):
+        # Будь-яке розбиття повідомлення і типи буферів дають той самий хеш
+        data = self.data(5000)
+        expected = hashlib.md5(data).hexdigest()
+        for sizes in ([1] * 200 + [4800], [63, 1, 64, 65, 4807], [7, 0, 121, 4872], [5000]):
+            with self.subTest(sizes=sizes[:5]):
+                md5, offset = MD5(), 0
+                for index, size in enumerate(sizes):
+                    piece = data[offset:offset + size]
+                    md5.update((piece, bytearray(piece), memoryview(piece))[index % 3])
+                    offset += size
+                self.assertEqual(md5.hexdigest(), expected)
+        # Масив з елементами більше байта хешується як його байти
+        values = np.arange(1000, dtype=np.uint32)
+        self.assertEqual(MD5(values).hexdigest(), hashlib.md5(values.tobytes()).hexdigest())
+        # Несуцільні буфери хешуються як їхні байти в порядку C
+        matrix = np.arange(3000, dtype=np.uint16).reshape(60, 50)
+        for buffer in (values[::2], values[::-1], matrix[:, 3:17], np.asfortranarray(matrix),
+                       memoryview(data)[::3]):
+            with self.subTest(shape=memoryview(buffer).shape, strides=memoryview(buffer).strides):
+                expected = hashlib.md5(memoryview(buffer).tobytes()).hexdigest()
+                self.assertEqual(MD5(buffer).hexdigest(), expected)
+                md5 = MD5()
+                md5.update(b'x')
+                md5.update(buffer)
+                self.assertEqual(md5.hexdigest(), hashlib.md5(b'x' + memoryview(buffer).tobytes()).hexdigest())
+
+    def test_digest_and_copy_keep_state(self):
+        md5, reference = MD5(b'prefix-'), hashlib.md5(b'prefix-')
+        clone = md5.copy()
+        self.assertEqual(md5.digest(), md5.digest())
+        md5.update(b'one')
+        reference.update(b'one')
+        clone.update(b'two')
+        self.assertEqual(md5.hexdigest(), reference.hexdigest())
+        self.assertEqual(clone.hexdigest(), hashlib.md5(b'prefix-two').hexdigest())
+        self.assertEqual((md5.name, md5.digest_size, md5.block_size), ('md5', 16, 64))
+
+    def test_hash_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for length in (0, 64, 100003):
+                with self.subTest(length=length):
+                    data = self.data(length)
+                    expected = hashlib.md5(data).hexdigest().upper()
+                    path = os.path.join(directory, f'{length}.bin')
+                    with open(path, 'wb') as file:
+                        file.write(data)
+                    # Файл на диску (mmap), відкритий файл, BytesIO і потік без fileno/seek
+                    self.assertEqual(MD5.hash_file(filepath=path, chunk_size=100), expected)
+                    with open(path, 'rb') as file:
+                        self.assertEqual(MD5.hash_file(file_object=file), expected)
+                    self.assertEqual(MD5.hash_file(file_object=io.BytesIO(data)), expected)
+                    self.assertEqual(MD5.hash_file(file_object=PipeStream(data), chunk_size=100), expected)
+                    self.assertTrue(MD5.verify_file(filepath=path, expected_hash=expected.lower())['match'])
+        with self.assertRaises(ValueError):
+            MD5.hash_file()
+
+
+class HashManyTests(TestCase):
+    """Пакетний MD5 над доріжками NumPy повинен збігатися з hashlib для кожного повідомлення"""
+
+    def expected(self, messages):
+        return [hashlib.md5(m.encode('utf-8') if isinstance(m, str) else bytes(m)).hexdigest().upper()
+                for m in messages]
+
+    def test_matches_hashlib(self):
+        generator = random.Random(23)
+        # Довжини з різною кількістю блоків, перемішані - групи не йдуть підряд
+        lengths = list(range(0, 200)) + [generator.randrange(0, 2000) for _ in range(300)]
+        generator.shuffle(lengths)
+        messages = [generator.randbytes(length) for length in lengths]
+        self.assertEqual(MD5.hash_many(messages), self.expected(messages))
+
+    def test_input_types(self):
+        messages = ['', 'abc', 'Привіт, світ', b'\x00' * 56, bytearray(b'xyz' * 30), memoryview(b'q' * 64)]
+        self.assertEqual(MD5.hash_many(messages), self.expected(messages))
+        self.assertEqual(MD5.hash_many([]), [])
+
+    def test_lane_batches(self):
+        # Групи, більші за LANE_BATCH, діляться на кілька пакетів доріжок
+        messages = [f'password-{i}' for i in range(50)] + ['x' * 100] * 7
+        with mock.patch('labs.algoritm.LR2.LANE_BATCH', 8):
+            self.assertEqual(MD5.hash_many(messages), self.expected(messages))
+
+    def test_matches_hash_string(self):
+        messages = [f'key-{i}' for i in range(100)]
+        self.assertEqual(MD5.hash_many(messages), [MD5.hash_string(m) for m in messages])
+
+
+class ManifestTests(TestCase):
+    """Маніфест md5sum: екранування шляхів, режими рядків, обмеження коренем і команда md5tree"""
+
+    FILES = {
+        'plain.txt': b'abc',
+        'back\\slash.txt': b'backslash',
+        'new\nline.txt': b'newline',
+        'sub/deep/data.bin': bytes(range(256)) * 300,
+    }
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.directory.name, 'root')
+        for relative, content in self.FILES.items():
+            path = os.path.join(self.root, *relative.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as file:
+                file.write(content)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @staticmethod
+    def md5(content):
+        return hashlib.md5(content).hexdigest()
+
+    def test_escaped_paths_round_trip(self):
+        manifest = format_manifest(hash_tree(self.root)['files'])
+        self.assertIn('\\' + self.md5(b'backslash') + '  back\\\\slash.txt\n', manifest)
+        self.assertIn('\\' + self.md5(b'newline') + '  new\\nline.txt\n', manifest)
+        entries, malformed = parse_manifest(manifest)
+        self.assertEqual(malformed, 0)
+        self.assertEqual(sorted(entries), sorted((self.md5(content), relative)
+                                                 for relative, content in self.FILES.items()))
+        result = verify_manifest(self.root, manifest)
+        self.assertTrue(result['match'])
+        self.assertEqual(result['ok'], len(self.FILES))
+
+    def test_binary_marker(self):
+        manifest = f"{self.md5(b'abc').upper()} *plain.txt\n{self.md5(b'xyz')} *sub/deep/data.bin\n"
+        self.assertEqual(parse_manifest(manifest), ([(self.md5(b'abc'), 'plain.txt'),
+                                                     (self.md5(b'xyz'), 'sub/deep/data.bin')], 0))
+        result = verify_manifest(self.root, manifest)
+        self.assertEqual([entry['status'] for entry in result['files']], ['OK', 'FAILED'])
+
+    def test_malformed_lines(self):
+        digest = self.md5(b'abc')
+        manifest = '\n'.join([
+            f'{digest}  plain.txt',
+            f'{digest} plain.txt',        # один пробіл
+            f'{digest[:-1]}  plain.txt',  # короткий хеш
+            f'{digest[:-1]}g  plain.txt',  # не шістнадцятковий символ
+            f'{digest}  ',                # порожній шлях
+            'не рядок маніфесту',
+            '',
+        ])
+        entries, malformed = parse_manifest(manifest)
+        self.assertEqual(entries, [(digest, 'plain.txt')])
+        self.assertEqual(malformed, 5)
+        result = verify_manifest(self.root, manifest)
+        self.assertEqual(result['ok'], 1)
+        self.assertFalse(result['match'])
+
+    def test_confined_paths(self):
+        outside = os.path.join(self.directory.name, 'outside.txt')
+        with open(outside, 'wb') as file:
+            file.write(b'secret')
+        digest = self.md5(b'secret')
+        manifest = f'{digest}  ../outside.txt\n{digest}  {outside}\n'
+        confined = verify_manifest(self.root, manifest, confined=True)
+        self.assertEqual([entry['status'] for entry in confined['files']], ['MISSING', 'MISSING'])
+        self.assertTrue(all(entry['md5'] is None for entry in confined['files']))
+        self.assertTrue(verify_manifest(self.root, manifest)['match'])
+
+    def test_md5tree_command(self):
+        # Маніфест усередині кореня виключається з власного хешування
+        output = os.path.join(self.root, 'tree.md5')
+        call_command('md5tree', self.root, output=output, workers=1, stderr=io.StringIO())
+        with open(output, 'r', encoding='utf-8') as file:
+            self.assertEqual(len(parse_manifest(file.read())[0]), len(self.FILES))
+
+        stdout = io.StringIO()
+        call_command('md5tree', self.root, check=output, workers=1, stdout=stdout, stderr=io.StringIO())
+        self.assertIn('plain.txt: OK', stdout.getvalue())
+
+        with open(os.path.join(self.root, 'plain.txt'), 'wb') as file:
+            file.write(b'changed')
+        stdout = io.StringIO()
+        with self.assertRaises(CommandError):
+            call_command('md5tree', self.root, check=output, workers=1, stdout=stdout, stderr=io.StringIO())
+        self.assertIn('plain.txt: FAILED', stdout.getvalue())
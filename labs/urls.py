@@ -11,10 +11,16 @@ urlpatterns = [
     # Лабораторна робота 1
     path('lab1/', views.lab1_prng, name='lab1'),
     path('lab1/generate/', views.generate_prng, name='generate_prng'),
+    path('lab1/sequence/', views.sequence_window, name='sequence_window'),
+    path('lab1/statistics/', views.sequence_statistics, name='sequence_statistics'),
     path('lab1/period/', views.test_period, name='test_period'),
     path('lab1/cesaro/', views.test_cesaro, name='test_cesaro'),
+    path('lab1/spectral/', views.test_spectral, name='test_spectral'),
+    path('lab1/search/', views.search_parameters, name='search_parameters'),
     path('lab1/randomness/', views.test_randomness, name='test_randomness'),
+    path('lab1/battery/', views.test_battery, name='test_battery'),
     path('lab1/export/', views.export_results, name='export_results'),
+    path('lab1/export-binary/', views.export_binary, name='export_binary'),
 
     # Лабораторна робота 2 - MD5
     path('lab2/', views.lab2_md5, name='lab2'),
@@ -22,6 +28,7 @@ urlpatterns = [
     path('lab2/hash-file/', views.hash_file, name='hash_file'),
     path('lab2/verify-file/', views.verify_file, name='verify_file'),
     path('lab2/export-hash/', views.export_hash, name='export_hash'),
+    path('lab2/hash-tree/', views.hash_directory, name='hash_directory'),
 
     # Лабораторна робота 3 - RC5
     path('lab3/', views.lab3_rc5, name='lab3'),
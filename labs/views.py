@@ -1,19 +1,36 @@
 import math
+import os
 import time
+from django.conf import settings
 from django.shortcuts import render
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 import json
 import io
+from typing import Iterator
+
+import numpy as np
 from .algoritm.Config.config import (
     CONFIG_LR1, CONFIG_LR3
 )
 from .algoritm.LR1 import (
     LinearCongruentialGenerator,
+    analytic_period,
+    FactorizationLimitError,
+    validate_parameters,
+    max_possible_period,
+    period_quality,
     CesaroTest,
+    SpectralTest,
     FrequencyTest,
     RunsTest)
+from .algoritm.battery import RandomnessBattery
+from .algoritm.search import ParameterSearch
+from .algoritm.sequence_file import SequenceFile
+from .algoritm.downsampling import downsample
+from .streaming import format_rows, StreamingJsonResponse
 from .algoritm.LR2 import MD5
+from .algoritm.manifest import hash_tree, verify_manifest, format_manifest
 from .algoritm.LR4 import RSAEngine
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
@@ -78,22 +95,18 @@ def generate_prng(request):
             c = int(data.get('c', CONFIG_LR1['c']))
             x0 = int(data.get('x0', CONFIG_LR1['x0']))
             count = int(data.get('count', 200))
+            # Графік: за max_points до послідовності додається зменшений ряд з не більше
+            # ніж max_points точок (послідовність посторінково - через /lab1/sequence/)
+            max_points = data.get('max_points')
 
             # Валідація
-            if m <= 0:
-                return JsonResponse({'error': 'Модуль m повинен бути > 0'})
-            if not (0 <= a < m):
-                return JsonResponse({'error': f'Множник a повинен бути в діапазоні [0, {m})'})
-            if not (0 <= c < m):
-                return JsonResponse({'error': f'Приріст c повинен бути в діапазоні [0, {m})'})
-            if not (0 <= x0 < m):
-                return JsonResponse({'error': f'Початкове значення x0 повинен бути в діапазоні [0, {m})'})
+            validate_parameters(m, a, c, x0, strict=True)
             if count <= 0 or count > 10000000:
                 return JsonResponse({'error': 'Кількість чисел повинна бути від 1 до 10000000'})
 
-            # Генерація
-            generator = LinearCongruentialGenerator(m, a, c, x0)
-            sequence = generator.generate_sequence(count)
+            # Генерація (без історії, у компактний масив)
+            generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+            sequence = generator.generate_sequence(count, as_array=True)
 
             # Статистика
             stats = generator.get_statistics(sequence)
@@ -115,6 +128,113 @@ def generate_prng(request):
                 }
             }
 
+            if max_points is not None:
+                # Зменшений ряд (x - номери чисел)
+                response['series'] = downsample(sequence, int(max_points),
+                                                method=data.get('downsample', 'lttb'))
+
+            # Послідовність і ряд кодуються блоками під час передачі
+            return StreamingJsonResponse(response)
+
+        except Exception as e:
+            return JsonResponse({'error': str(e)})
+
+    return JsonResponse({'error': 'Помилка'})
+
+
+@csrf_exempt
+def sequence_window(request):
+    # Сторінка послідовності: limit чисел, починаючи з offset (перехід без генерації префікса)
+    if request.method == 'POST':
+        try:
+            start_time = time.time()
+            data = json.loads(request.body)
+
+            # Отримання параметрів
+            m = int(data.get('m', CONFIG_LR1['m']))
+            a = int(data.get('a', CONFIG_LR1['a']))
+            c = int(data.get('c', CONFIG_LR1['c']))
+            x0 = int(data.get('x0', CONFIG_LR1['x0']))
+            offset = int(data.get('offset', 0))
+            limit = int(data.get('limit', 5000))
+
+            # Валідація
+            validate_parameters(m, a, c, x0, strict=True)
+            if offset < 0:
+                return JsonResponse({'error': 'Зсув offset повинен бути >= 0'})
+            if limit <= 0 or limit > 100000:
+                return JsonResponse({'error': 'Розмір сторінки повинен бути від 1 до 100000'})
+            if data.get('count') is not None:
+                # Сторінка не виходить за межі послідовності заданої довжини
+                limit = max(0, min(limit, int(data['count']) - offset))
+
+            generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+            window = generator.generate_window(offset, limit)
+
+            end_time = time.time()
+            duration_ms = (end_time - start_time) * 1000
+
+            response = {
+                'success': True,
+                'sequence': window,
+                'offset': offset,
+                'limit': limit,
+                'generation_time_ms': duration_ms,
+                'parameters': {
+                    'm': m,
+                    'a': a,
+                    'c': c,
+                    'x0': x0
+                }
+            }
+
+            return StreamingJsonResponse(response)
+
+        except Exception as e:
+            return JsonResponse({'error': str(e)})
+
+    return JsonResponse({'error': 'Помилка'})
+
+
+@csrf_exempt
+def sequence_statistics(request):
+    # Статистика перших count чисел: обчислюється потоково, послідовність не передається
+    if request.method == 'POST':
+        try:
+            start_time = time.time()
+            data = json.loads(request.body)
+
+            # Отримання параметрів
+            m = int(data.get('m', CONFIG_LR1['m']))
+            a = int(data.get('a', CONFIG_LR1['a']))
+            c = int(data.get('c', CONFIG_LR1['c']))
+            x0 = int(data.get('x0', CONFIG_LR1['x0']))
+            count = int(data.get('count', 200))
+
+            # Валідація
+            validate_parameters(m, a, c, x0, strict=True)
+            if count <= 0 or count > 10000000:
+                return JsonResponse({'error': 'Кількість чисел повинна бути від 1 до 10000000'})
+
+            generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+            stats = generator.generate_statistics(count)
+
+            end_time = time.time()
+            duration_ms = (end_time - start_time) * 1000
+
+            response = {
+                'success': True,
+                'count': count,
+                'statistics': stats,
+                'generation_time_ms': duration_ms,
+                'parameters': {
+                    'm': m,
+                    'a': a,
+                    'c': c,
+                    'x0': x0
+                }
+            }
+
             return JsonResponse(response)
 
         except Exception as e:
@@ -136,28 +256,57 @@ def test_period(request):
             a = int(data.get('a', CONFIG_LR1['a']))
             c = int(data.get('c', CONFIG_LR1['c']))
             x0 = int(data.get('x0', CONFIG_LR1['x0']))
-            max_iterations = int(data.get('max_iterations'))
+            max_iterations = int(data.get('max_iterations', 1000000))
+            method = data.get('method', 'analytic')
+            # Лише справжній true або рядки "true"/"1": bool("false") був би істиною
+            verify = data.get('verify', False)
+            verify = verify is True or str(verify).lower() in ('true', '1')
+
+            validate_parameters(m, a, c, x0)
+            if method not in ('analytic', 'dict', 'brent'):
+                return JsonResponse({'error': "Метод пошуку періоду повинен бути 'analytic', 'dict' або 'brent'"})
 
             # Генератор
             generator = LinearCongruentialGenerator(m, a, c, x0)
 
             # Знаходження періоду
-            period, found = generator.find_period(max_iterations)
+            fallback = None
+            if method == 'analytic':
+                try:
+                    # Розклад m обмежений тим самим max_iterations, що й прямий обхід
+                    period, tail_length = analytic_period(m, a, c, x0, max_iterations)
+                    found = True
+                except FactorizationLimitError as e:
+                    # m не розкладається в межах ліміту - обхід Брента (теж обмежений max_iterations)
+                    fallback = str(e)
+                    method = 'brent'
+            if method == 'brent':
+                period, tail_length, found = generator.find_cycle(max_iterations)
+            elif method == 'dict':
+                period, found = generator.find_period(max_iterations)
+                tail_length = None
+
+            # Перехресна перевірка аналітичного результату прямим обходом (Брент, O(1) пам'яті)
+            verified = None
+            if verify and method == 'analytic':
+                walk_period, walk_tail, walk_found = generator.find_cycle(max_iterations)
+                verified = (walk_period, walk_tail) == (period, tail_length) if walk_found else None
 
             end_time = time.time()
             duration_ms = (end_time - start_time) * 1000
 
             # Оцінка якості
-            max_period = m if c != 0 else m - 1
-            quality = 'Відмінно' if period == max_period \
-                else 'Добре' if period > m / 2 \
-                else 'Задовільно' if period > m / 4 \
-                else 'Погано'
+            max_period = max_possible_period(m, c)
+            quality = period_quality(period, m, c)
 
             response = {
                 'success': True,
                 'period': period,
                 'found': found,
+                'method': method,
+                'fallback': fallback,
+                'tail_length': tail_length,
+                'verified': verified,
                 'max_possible_period': max_period,
                 'quality': quality,
                 'percentage': (period / max_period) * 100,
@@ -192,10 +341,31 @@ def test_cesaro(request):
             c = int(data.get('c', CONFIG_LR1['c']))
             x0 = int(data.get('x0', CONFIG_LR1['x0']))
             num_pairs = min(int(data.get('num_pairs', 10000)), 5000000)
+            max_points = int(data.get('max_points', 1000))
+            workers = max(1, min(int(data.get('workers', 1)), os.cpu_count() or 1))
 
             # Тестування лінійного генератора
-            generator = LinearCongruentialGenerator(m, a, c, x0)
-            pi_estimate, error, pi_history = CesaroTest.estimate_pi(generator, num_pairs)
+            generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+            sequential = None
+            if data.get('tolerance') is not None:
+                # Послідовний режим: зупинка, щойно довірчий інтервал для Pi достатньо вузький
+                tolerance = float(data['tolerance'])
+                confidence = float(data.get('confidence', 0.95))
+                if tolerance <= 0 or not (0 < confidence < 1):
+                    return JsonResponse({'error': 'Потрібні tolerance > 0 та 0 < confidence < 1'})
+                sequential = CesaroTest.estimate_pi_sequential(generator, num_pairs, tolerance, confidence)
+                pi_estimate, error, pi_history = sequential['pi_estimate'], sequential['error'], sequential['pi_history']
+                num_pairs = sequential['pairs_used']
+            else:
+                pi_estimate, error, pi_history = CesaroTest.estimate_pi_batched(generator, num_pairs, workers)
+
+            # Збіжність оцінки: точка кожні 100 пар (початкові точки без взаємно простих пар пропущені),
+            # на графік - не більше max_points точок
+            history_pairs = (np.arange(len(pi_history)) + num_pairs // 100 - len(pi_history) + 1) * 100
+            pi_series = downsample(np.array(pi_history, dtype=np.float64), max_points, x=history_pairs,
+                                   method=data.get('downsample', 'lttb'))
+            pi_series['x'] = pi_series['x'].tolist()
+            pi_series['y'] = pi_series['y'].tolist()
 
             # Тестування системного генератора (random)
             system_results = CesaroTest.compare_with_system_random(num_pairs)
@@ -217,8 +387,57 @@ def test_cesaro(request):
                 },
                 'actual_pi': math.pi,
                 'num_pairs': num_pairs,
+                'pi_history': pi_series,
                 'execution_time_ms': duration_ms
             }
+            if sequential is not None:
+                response['our_generator'].update({
+                    'pairs_used': sequential['pairs_used'],
+                    'converged': sequential['converged'],
+                    'confidence': sequential['confidence'],
+                    'confidence_interval': sequential['confidence_interval'],
+                    'half_width': sequential['half_width']
+                })
+
+            return JsonResponse(response)
+
+        except Exception as e:
+            return JsonResponse({'error': str(e)})
+
+    return JsonResponse({'error': 'Помилка'})
+
+
+@csrf_exempt
+def test_spectral(request):
+    # Спектральний тест: якість ґратки генератора в розмірностях 2..8 без генерації чисел
+    if request.method == 'POST':
+        try:
+            start_time = time.time()
+            data = json.loads(request.body)
+
+            # Отримання параметрів
+            m = int(data.get('m', CONFIG_LR1['m']))
+            a = int(data.get('a', CONFIG_LR1['a']))
+            max_dimension = int(data.get('max_dimension', 8))
+
+            results = SpectralTest.test_parameters(m, a, max_dimension)
+
+            end_time = time.time()
+            duration_ms = (end_time - start_time) * 1000
+
+            response = {
+                'success': True,
+                'dimensions': results['dimensions'],
+                'min_figure_of_merit': results['min_figure_of_merit'],
+                'worst_dimension': results['worst_dimension'],
+                'min_mu': results['min_mu'],
+                'passed': results['passed'],
+                'execution_time_ms': duration_ms,
+                'parameters': {
+                    'm': m,
+                    'a': a
+                }
+            }
 
             return JsonResponse(response)
 
@@ -228,6 +447,53 @@ def test_cesaro(request):
     return JsonResponse({'error': 'Помилка'})
 
 
+@csrf_exempt
+def search_parameters(request):
+    # Пошук параметрів (a, c) для модуля m: таблиця лідерів передається потоком NDJSON
+    # (один JSON-рядок на подію) у міру оцінювання кандидатів
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+
+            # Отримання параметрів
+            m = int(data.get('m', CONFIG_LR1['m']))
+            x0 = int(data.get('x0', CONFIG_LR1['x0']))
+            a_start = int(data.get('a_start', 2))
+            a_step = max(1, int(data.get('a_step', 1)))
+            a_stop = min(int(data.get('a_stop', a_start + 1000 * a_step)), m)
+            increments = [int(c) for c in data.get('increments', [data.get('c', CONFIG_LR1['c'])])]
+            workers = max(1, min(int(data.get('workers', 1)), os.cpu_count() or 1))
+
+            multipliers = range(a_start, a_stop, a_step)
+            if len(multipliers) * len(increments) > 1000000:
+                return JsonResponse({'error': 'Забагато кандидатів (максимум 1000000)'})
+
+            search = ParameterSearch(
+                m, multipliers, increments, x0,
+                top=min(int(data.get('top', 10)), 100),
+                max_dimension=int(data.get('max_dimension', 8)),
+                min_figure_of_merit=float(data.get('min_figure_of_merit', 0.0)),
+                require_full_period=bool(data.get('require_full_period', True)),
+                battery_bits=min(int(data.get('battery_bits', 1 << 16)), 1 << 20),
+                bit_length=int(data['bit_length']) if data.get('bit_length') else None,
+                workers=workers,
+                max_factor_steps=min(int(data.get('max_factor_steps', 1000000)), 10000000)
+            )
+        except Exception as e:
+            return JsonResponse({'error': str(e)})
+
+        def events():
+            try:
+                for event in search.run(resume=bool(data.get('resume', True))):
+                    yield json.dumps(event) + '\n'
+            except Exception as e:
+                yield json.dumps({'type': 'error', 'error': str(e)}) + '\n'
+
+        return StreamingHttpResponse(events(), content_type='application/x-ndjson')
+
+    return JsonResponse({'error': 'Помилка'})
+
+
 @csrf_exempt
 def test_randomness(request):
     # Комплексне тестування випадковості
@@ -242,13 +508,14 @@ def test_randomness(request):
             c = int(data.get('c', CONFIG_LR1['c']))
             x0 = int(data.get('x0', CONFIG_LR1['x0']))
             count = min(int(data.get('count', 1000)), 5000000)
+            block_size = int(data['block_size']) if data.get('block_size') else None
 
             # Генерація послідовності
-            generator = LinearCongruentialGenerator(m, a, c, x0)
-            sequence = generator.generate_sequence(count)
+            generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+            sequence = generator.generate_sequence(count, as_array=True)
 
             # Частотний тест
-            frequency_results = FrequencyTest.test_bits(sequence)
+            frequency_results = FrequencyTest.test_bits(sequence, block_size=block_size)
 
             # Тест послідовностей
             runs_results = RunsTest.test(sequence)
@@ -280,6 +547,88 @@ def test_randomness(request):
     return JsonResponse({'error': 'Помилка'})
 
 
+@csrf_exempt
+def test_battery(request):
+    # Батарея тестів у стилі NIST SP 800-22 над однією послідовністю бітів
+    if request.method == 'POST':
+        try:
+            start_time = time.time()
+            data = json.loads(request.body)
+
+            # Отримання параметрів
+            m = int(data.get('m', CONFIG_LR1['m']))
+            a = int(data.get('a', CONFIG_LR1['a']))
+            c = int(data.get('c', CONFIG_LR1['c']))
+            x0 = int(data.get('x0', CONFIG_LR1['x0']))
+            n_bits = min(int(data.get('n_bits', 1000000)), 1 << 28)
+            bit_length = int(data['bit_length']) if data.get('bit_length') else None
+            workers = max(1, min(int(data.get('workers', 1)), os.cpu_count() or 1))
+            serial_length = data.get('serial_length')
+            entropy_length = data.get('entropy_length')
+
+            generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+            battery = RandomnessBattery.run(
+                generator, n_bits, bit_length,
+                tests=data.get('tests'),
+                workers=workers,
+                block_size=int(data.get('block_size', 128)),
+                serial_length=int(serial_length) if serial_length is not None else None,
+                entropy_length=int(entropy_length) if entropy_length is not None else None
+            )
+
+            end_time = time.time()
+            duration_ms = (end_time - start_time) * 1000
+
+            response = {
+                'success': True,
+                'tests': battery['tests'],
+                'n_bits': battery['n_bits'],
+                'bit_length': battery['bit_length'],
+                'numbers_used': battery['numbers_used'],
+                'generation_time_ms': battery['generation_time_ms'],
+                'execution_time_ms': duration_ms,
+                'parameters': {
+                    'm': m,
+                    'a': a,
+                    'c': c,
+                    'x0': x0
+                }
+            }
+
+            return JsonResponse(response)
+
+        except Exception as e:
+            return JsonResponse({'error': str(e)})
+
+    return JsonResponse({'error': 'Помилка'})
+
+
+# Найбільша кількість чисел у файлі експорту
+EXPORT_MAX_COUNT = 100000000
+
+
+def _export_lines(generator: LinearCongruentialGenerator, count: int) -> Iterator[bytes]:
+    # Вміст lr1_lin.txt частинами: заголовок іде одразу, далі рядки "індекс<TAB>значення"
+    # блоками по BLOCK_SIZE чисел; у пам'яті одночасно лише один блок
+    header = (
+        f"Модуль порівняння m = {generator.m}\n"
+        f"Множник a = {generator.a}\n"
+        f"Приріст c = {generator.c}\n"
+        f"Початкове число x0 = {generator.x0}\n"
+        + "-" * 20 + "\n"
+        f"Кількість змінних = {count}\n"
+        + "-" * 20 + "\n"
+        "Індекс\tЗначення змінної\n"
+    )
+    yield header.encode('utf-8')
+
+    index = 1
+    for block in generator.generate_blocks(count):
+        indices = np.arange(index, index + len(block), dtype=np.uint64)
+        yield format_rows([indices, block])
+        index += len(block)
+
+
 @csrf_exempt
 def export_results(request):
     if request.method != 'POST':
@@ -290,39 +639,65 @@ def export_results(request):
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Невірний JSON'}, status=400)
 
-    m = int(data.get('m', CONFIG_LR1['m']))
-    a = int(data.get('a', CONFIG_LR1['a']))
-    c = int(data.get('c', CONFIG_LR1['c']))
-    x0 = int(data.get('x0', CONFIG_LR1['x0']))
-    count = int(data.get('count', 100))
-
-    # Генерація послідовності
-    generator = LinearCongruentialGenerator(m, a, c, x0)
-    sequence = generator.generate_sequence(count)
-
-    # Формуємо txt файл в пам'яті
-    output = io.StringIO()
-    output.write(f"Модуль порівняння m = {m}\n")
-    output.write(f"Множник a = {a}\n")
-    output.write(f"Приріст c = {c}\n")
-    output.write(f"Початкове число x0 = {x0}\n")
-    output.write("-" * 20 + "\n")
-    output.write(f"Кількість змінних = {len(sequence)}\n")
-    output.write("-" * 20 + "\n")
-    output.write("Індекс\tЗначення змінної\n")
-
-    for i, val in enumerate(sequence, 1):
-        output.write(f"{i}\t{val}\n")
-
-    file_content = output.getvalue()
-    output.close()
-
-    # Створюємо HTTP-відповідь із правильними заголовками
-    response = HttpResponse(file_content, content_type='text/plain; charset=utf-8')
+    try:
+        m = int(data.get('m', CONFIG_LR1['m']))
+        a = int(data.get('a', CONFIG_LR1['a']))
+        c = int(data.get('c', CONFIG_LR1['c']))
+        x0 = int(data.get('x0', CONFIG_LR1['x0']))
+        count = int(data.get('count', 100))
+        validate_parameters(m, a, c, x0, strict=True)
+    except (TypeError, ValueError) as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if count <= 0 or count > EXPORT_MAX_COUNT:
+        return JsonResponse({'error': f'Кількість чисел повинна бути від 1 до {EXPORT_MAX_COUNT}'}, status=400)
+
+    # Файл формується під час передачі: генерація і форматування блоками
+    generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+    response = StreamingHttpResponse(_export_lines(generator, count), content_type='text/plain; charset=utf-8')
     response['Content-Disposition'] = 'attachment; filename="lr1_lin.txt"'
     return response
 
 
+@csrf_exempt
+def export_binary(request):
+    # Двійковий експорт послідовності: формат 'lcg' (заголовок з параметрами) або 'npy'.
+    # Файл читається без копіювання через SequenceFile.open
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Дозволено тільки POST запити'}, status=405)
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Невірний JSON'}, status=400)
+
+    try:
+        m = int(data.get('m', CONFIG_LR1['m']))
+        a = int(data.get('a', CONFIG_LR1['a']))
+        c = int(data.get('c', CONFIG_LR1['c']))
+        x0 = int(data.get('x0', CONFIG_LR1['x0']))
+        count = int(data.get('count', 100))
+        fmt = data.get('format', 'lcg')
+        validate_parameters(m, a, c, x0, strict=True)
+        if fmt not in ('lcg', 'npy'):
+            raise ValueError(f"Невідомий формат: {fmt}")
+        generator = LinearCongruentialGenerator(m, a, c, x0, history_size=0)
+        chunks = SequenceFile.chunks(generator, count, fmt)
+        header = next(chunks)
+    except (TypeError, ValueError) as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if count <= 0 or count > EXPORT_MAX_COUNT:
+        return JsonResponse({'error': f'Кількість чисел повинна бути від 1 до {EXPORT_MAX_COUNT}'}, status=400)
+
+    def content() -> Iterator[bytes]:
+        yield header
+        yield from chunks
+
+    response = StreamingHttpResponse(content(), content_type='application/octet-stream')
+    response['Content-Disposition'] = f'attachment; filename="lr1_lin.{fmt}"'
+    response['Content-Length'] = str(SequenceFile.size(generator, count, fmt))
+    return response
+
+
 # ==================== Лабораторна робота 2 ====================
 
 def lab2_md5(request):
@@ -339,6 +714,17 @@ def hash_text(request):
             start_time = time.time()
             data = json.loads(request.body)
 
+            if isinstance(data.get('texts'), list):
+                # Пакетний режим: хеші списку рядків за один прохід hash_many
+                texts = [str(text) for text in data['texts']]
+                hashes = MD5.hash_many(texts)
+                return JsonResponse({
+                    'success': True,
+                    'hashes': hashes,
+                    'count': len(hashes),
+                    'execution_time_ms': (time.time() - start_time) * 1000
+                })
+
             text = data.get('text', '')
 
             # Обчислюємо хеш
@@ -477,6 +863,41 @@ def export_hash(request):
 
     return JsonResponse({'error': 'Дозволено тільки POST запити'}, status=405)
 
+
+@csrf_exempt
+def hash_directory(request):
+    """Хешування дерева каталогів (маніфест md5sum) або перевірка за маніфестом"""
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+
+            # Каталог задається відносно HASH_TREE_ROOT і не може виходити за його межі
+            base = getattr(settings, 'HASH_TREE_ROOT', None)
+            if base is None:
+                return JsonResponse({'error': 'Хешування каталогів вимкнено (HASH_TREE_ROOT не задано)'},
+                                    status=403)
+            base = os.path.realpath(base)
+            root = os.path.realpath(os.path.join(base, data.get('path', '.')))
+            if os.path.commonpath([base, root]) != base:
+                return JsonResponse({'error': 'Каталог поза дозволеним коренем'}, status=400)
+            workers = max(1, min(int(data.get('workers', 1)), os.cpu_count() or 1))
+
+            manifest = data.get('manifest')
+            if manifest:
+                result = verify_manifest(root, manifest, workers, confined=True)
+            else:
+                result = hash_tree(root, workers)
+                result['manifest'] = format_manifest(result['files'])
+
+            result['success'] = True
+            result['root'] = os.path.relpath(root, base).replace(os.sep, '/')
+            return JsonResponse(result)
+
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+    return JsonResponse({'error': 'Дозволено тільки POST запити'}, status=405)
+
 # ==================== Лабораторна робота 3 (RC5) ====================
 
 def lab3_rc5(request):
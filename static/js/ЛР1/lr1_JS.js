@@ -1,38 +1,56 @@
-// Глобальні змінні для пагінації
-let generatedSequence = [];
+// Глобальні змінні для пагінації: сервер повертає лише поточну сторінку
+let sequenceParams = null; // параметри генератора (m, a, c, x0, count) останньої генерації
 let currentPage = 1;
 const itemsPerPage = 5000; // Кількість елементів на сторінці
 
 // Tabs are automatically initialized by common-utils.js
 
+// Запит сторінки послідовності з сервера (offset/limit, без генерації префікса)
+async function fetchSequencePage(page) {
+    const response = await fetch('/lab1/sequence/', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+            ...sequenceParams,
+            offset: (page - 1) * itemsPerPage,
+            limit: itemsPerPage
+        })
+    });
+    const result = await response.json();
+    if (!result.success) {
+        throw new Error(result.error);
+    }
+    return result.sequence;
+}
+
 // Функція для відображення поточної сторінки послідовності
-function renderSequencePage() {
+async function renderSequencePage() {
     const seqDiv = document.getElementById('gen-sequence');
     const paginationControls = document.getElementById('pagination-controls');
     const sequenceInfo = document.getElementById('sequence-info');
 
-    if (generatedSequence.length === 0) {
+    if (!sequenceParams || sequenceParams.count === 0) {
         seqDiv.innerHTML = '';
         paginationControls.innerHTML = '';
         sequenceInfo.innerHTML = '';
         return;
     }
 
-    const totalPages = Math.ceil(generatedSequence.length / itemsPerPage);
+    const total = sequenceParams.count;
+    const totalPages = Math.ceil(total / itemsPerPage);
     // Перевірка, щоб номер сторінки був у допустимих межах
     if (currentPage < 1) currentPage = 1;
     if (currentPage > totalPages) currentPage = totalPages;
 
     const start = (currentPage - 1) * itemsPerPage;
-    const end = start + itemsPerPage;
-    const pageItems = generatedSequence.slice(start, end);
+    const pageItems = await fetchSequencePage(currentPage);
 
     // Відображаємо лише частину даних
     seqDiv.innerHTML = pageItems.join(', ');
 
     // Оновлюємо інформацію про послідовність
-    const endItem = Math.min(end, generatedSequence.length);
-    sequenceInfo.innerHTML = `(Показано ${start + 1} - ${endItem} з ${generatedSequence.length})`;
+    const endItem = start + pageItems.length;
+    sequenceInfo.innerHTML = `(Показано ${start + 1} - ${endItem} з ${total})`;
 
     // Створюємо кнопки для пагінації
     let paginationHTML = '';
@@ -47,16 +65,21 @@ function renderSequencePage() {
 }
 
 // Функція для переходу на іншу сторінку
-function goToPage(page) {
+async function goToPage(page) {
     currentPage = page;
-    renderSequencePage();
+    try {
+        await renderSequencePage();
+    } catch (error) {
+        alert('Помилка: ' + error.message);
+    }
     // Прокручуємо до верху контейнера з послідовністю
     document.getElementById('gen-sequence').scrollTop = 0;
 }
 
 // Видалена функція switchTab - використовуємо initializeTabs з common-utils.js
 
-// Оновлена функція генерації чисел
+// Оновлена функція генерації чисел: статистика рахується на сервері окремим запитом,
+// а послідовність завантажується посторінково
 async function generateNumbers() {
     const data = {
         m: parseInt(document.getElementById('gen-m').value),
@@ -74,7 +97,7 @@ async function generateNumbers() {
     document.getElementById('sequence-info').innerHTML = '';
 
     try {
-        const response = await fetch('/lab1/generate/', {
+        const response = await fetch('/lab1/statistics/', {
             method: 'POST',
             headers: {'Content-Type': 'application/json'},
             body: JSON.stringify(data)
@@ -108,12 +131,12 @@ async function generateNumbers() {
                 </div>
             `;
 
-            // Зберігаємо повну послідовність
-            generatedSequence = result.sequence;
+            // Зберігаємо параметри; сторінки запитуються з сервера за потреби
+            sequenceParams = data;
 
             // Встановлюємо початкову сторінку і відображаємо її
             currentPage = 1;
-            renderSequencePage();
+            await renderSequencePage();
         } else {
             seqDiv.innerHTML = ''; // Очищуємо повідомлення про завантаження у разі помилки
             alert('Помилка: ' + result.error);
@@ -160,6 +183,10 @@ async function testPeriod() {
                         <td>Знайдений період</td>
                         <td><strong>${result.period}</strong></td>
                     </tr>
+                    <tr>
+                        <td>Метод</td>
+                        <td>${result.method}</td>
+                    </tr>
                     <tr>
                         <td>Максимально можливий період</td>
                         <td>${result.max_possible_period}</td>
@@ -405,12 +432,10 @@ async function exportResults() {
                 throw new Error(errorResult.error || 'Не вдалося отримати дані з сервера');
             }
 
-            const fileContent = await response.text();
-
-            // Записуємо отриманий контент у файл
+            // Записуємо відповідь у файл потоком, не накопичуючи її в пам'яті браузера
+            // (pipeTo закриває файл після завершення передачі)
             const writable = await handle.createWritable();
-            await writable.write(fileContent);
-            await writable.close();
+            await response.body.pipeTo(writable);
             alert('Файл успішно збережено!');
         }
 